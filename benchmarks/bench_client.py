@@ -0,0 +1,68 @@
+"""Benchmarks the overhead of the SDK around a request, serving every
+response from memory so no network is involved.
+
+Pass the path of a recording made with `RecordingTransport` to serve the
+recorded responses instead of the built in ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from helpers import report
+
+from unkey import client
+from unkey import constants
+from unkey import transports
+
+VERIFICATION = {
+    "keyId": "key_123",
+    "valid": True,
+    "ownerId": "owner_123",
+    "meta": {"plan": "pro"},
+    "remaining": 10,
+    "ratelimit": {"limit": 10, "remaining": 9, "reset": 1700000000000},
+}
+
+KEY = {
+    "id": "key_123",
+    "apiId": "api_123",
+    "workspaceId": "ws_123",
+    "start": "sk_abc",
+    "createdAt": 1700000000000,
+    "meta": {"plan": "pro"},
+}
+
+
+def main() -> None:
+    transport: transports.Transport
+
+    if len(sys.argv) > 1:
+        transport = transports.ReplayTransport(sys.argv[1], speed=None)
+    else:
+        transport = transports.MemoryTransport()
+        transport.add_json_route(constants.POST, "/v1/keys.verifyKey", VERIFICATION)
+        transport.add_json_route(constants.GET, "/v1/keys.getKey", KEY)
+
+    loop = asyncio.new_event_loop()
+    unkey = client.Client("root_key", transport=transport)
+    loop.run_until_complete(unkey.start())
+
+    report(
+        "Client.keys.verify_key",
+        lambda: loop.run_until_complete(unkey.keys.verify_key("sk_123", "api_123")),
+        number=10_000,
+    )
+    report(
+        "Client.keys.get_key",
+        lambda: loop.run_until_complete(unkey.keys.get_key("key_123")),
+        number=10_000,
+    )
+
+    loop.run_until_complete(unkey.close())
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
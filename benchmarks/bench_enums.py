@@ -0,0 +1,21 @@
+"""Benchmarks decoding enum values with `from_str_maybe`."""
+
+from __future__ import annotations
+
+from helpers import report
+
+from unkey import models
+
+ENUMS = (models.ErrorCode, models.RatelimitType, models.RefillInterval, models.UpdateOp)
+
+
+def main() -> None:
+    for enum in ENUMS:
+        hit = next(iter(enum)).value
+        report(f"{enum.__name__}.from_str_maybe hit", lambda: enum.from_str_maybe(hit))
+        report(f"{enum.__name__}.from_str_maybe miss", lambda: enum.from_str_maybe(""))
+        report(f"{enum.__name__}.from_str_maybe None", lambda: enum.from_str_maybe(None))
+
+
+if __name__ == "__main__":
+    main()
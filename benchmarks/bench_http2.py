@@ -0,0 +1,127 @@
+"""Compares the default HTTP/1.1 transport with the HTTP/2 transport by
+verifying many keys at once against a local stand-in for the api.
+
+Reports the sockets each transport opened, the throughput, and the p99
+latency. Requires `httpx[http2]` and `hypercorn`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import socket
+import sys
+import time
+import typing as t
+
+from unkey import client
+from unkey import transports
+
+REQUESTS = 2_000
+LATENCY = 0.02
+VERIFICATION = b'{"keyId":"key_123","valid":true,"ownerId":"owner_123"}'
+
+_peers: t.Set[t.Any] = set()
+
+
+async def app(scope: t.Dict[str, t.Any], receive: t.Any, send: t.Any) -> None:
+    """A stand-in for the api that answers every request after a fixed
+    delay, counting the client sockets it saw.
+    """
+    if scope["type"] != "http":
+        return None
+
+    while (await receive()).get("more_body"):
+        pass
+
+    if scope["path"] == "/sockets":
+        body = str(len(_peers)).encode()
+        _peers.clear()
+    else:
+        _peers.add(tuple(scope["client"]))
+        await asyncio.sleep(LATENCY)
+        body = VERIFICATION
+
+    headers = [(b"content-type", b"application/json")]
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def serve(port: int) -> None:
+    from hypercorn.asyncio import serve as serve_
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.backlog = REQUESTS
+    config.keep_alive_max_requests = REQUESTS * 10
+    config.loglevel = "ERROR"
+    asyncio.run(serve_(app, config))  # type: ignore[arg-type]
+
+
+async def wait_for(port: int) -> None:
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            return None
+
+
+async def run(name: str, base_url: str, transport: transports.Transport) -> None:
+    latencies: t.List[float] = []
+
+    async def verify() -> None:
+        start = time.perf_counter()
+        result = await unkey.keys.verify_key("sk_123", "api_123")
+        latencies.append(time.perf_counter() - start)
+        assert result.is_ok, result
+
+    async with client.Client("root_key", api_base_url=base_url, transport=transport) as unkey:
+        start = time.perf_counter()
+        await asyncio.gather(*(verify() for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+        response = await transport.send(
+            transports.TransportRequest("GET", base_url + "/sockets", {})
+        )
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    sockets = response.text()
+    print(f"{name:<28} {sockets:>5} sockets {REQUESTS / elapsed:>10.0f} req/s {p99:>8.1f} ms p99")
+
+
+async def main(port: int) -> None:
+    base_url = f"http://127.0.0.1:{port}"
+    await wait_for(port)
+    print(f"{REQUESTS} concurrent verifications, {LATENCY * 1000:.0f} ms server latency")
+
+    await run("aiohttp HTTP/1.1", base_url, transports.AiohttpTransport())
+    await run("aiohttp HTTP/1.1 (no limit)", base_url, transports.AiohttpTransport(limit=0))
+    # Without TLS there is no protocol negotiation, so HTTP/2 is used
+    # with prior knowledge.
+    await run("httpx HTTP/2", base_url, transports.HttpxTransport(http1=False))
+
+
+if __name__ == "__main__":
+    try:
+        import h2  # noqa: F401
+        import hypercorn  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        print("Skipping, httpx[http2] and hypercorn are required.")
+        sys.exit(0)
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+
+    try:
+        asyncio.run(main(port))
+    finally:
+        server.terminate()
@@ -0,0 +1,54 @@
+"""Measures the time taken to import unkey.py and its heavier parts,
+using `python -X importtime` in fresh interpreters.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+RUNS = 10
+CASES = {
+    "import unkey": "import unkey",
+    "unkey.ApiKeyMeta": "import unkey; unkey.ApiKeyMeta",
+    "unkey.protected": "import unkey; unkey.protected",
+    "unkey.Client": "import unkey; unkey.Client",
+    "HttpService session": "import unkey.services.http; import aiohttp",
+}
+
+
+def import_time(code: str) -> int:
+    """Gets the total import time of the code in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    total = 0
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+
+        # Only count top level imports, which already include their children.
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+
+    return total
+
+
+def main() -> None:
+    # Imports made by the interpreter itself are excluded.
+    baseline = min(import_time("pass") for _ in range(RUNS))
+
+    for name, code in CASES.items():
+        best = min(import_time(code) for _ in range(RUNS)) - baseline
+        print(f"{name:<48} {best / 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
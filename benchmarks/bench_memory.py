@@ -0,0 +1,62 @@
+"""Measures the memory used by 100,000 listed keys with each serializer
+mode, using tracemalloc.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+import typing as t
+
+from unkey import serializer
+
+KEYS = 100_000
+
+
+def make_listing() -> str:
+    keys = [
+        {
+            "id": f"key_{i:020}",
+            "apiId": "api_7Jq3kPz9XwR2mL5n",
+            "workspaceId": "ws_4Hd8sFq2LpX9vB1c",
+            "start": f"sk_{i % 1000:03}",
+            "ownerId": f"owner_{i % 500}",
+            "createdAt": 1700000000000 + i,
+            "expires": None,
+            "remaining": 100,
+        }
+        for i in range(KEYS)
+    ]
+
+    return json.dumps({"total": KEYS, "cursor": None, "keys": keys})
+
+
+def measure(name: str, s: serializer.Serializer) -> None:
+    text = make_listing()
+    gc.collect()
+    tracemalloc.start()
+
+    # Decoding is traced too, since the decoder creates every string.
+    data: t.Dict[str, t.Any] = json.loads(text)
+    listing = s.to_api_key_list(data)
+
+    # The decoded JSON is released, as it would be after a request.
+    del data
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<24} {used / 2**20:>8.1f} MiB {used / len(listing.keys):>8.1f} B/key")
+
+
+def main() -> None:
+    measure("default", serializer.Serializer())
+    measure("intern", serializer.Serializer(intern=True))
+    measure("compact", serializer.Serializer(compact=True))
+    measure("compact + intern", serializer.Serializer(compact=True, intern=True))
+    measure("lazy", serializer.Serializer(lazy=True))
+
+
+if __name__ == "__main__":
+    main()
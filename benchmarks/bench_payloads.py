@@ -0,0 +1,81 @@
+"""Benchmarks building request payloads for key service methods."""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from datetime import datetime
+from datetime import timedelta
+from unittest import mock
+
+from helpers import report
+
+from unkey import models
+from unkey import serializer
+from unkey import services
+from unkey.services import keys
+
+RATELIMIT = models.Ratelimit(
+    type=models.RatelimitType.Fast, limit=10, refill_rate=1, refill_interval=1000
+)
+REFILL = models.Refill(amount=5, interval=models.RefillInterval.Daily)
+
+
+def main() -> None:
+    service = services.KeyService(mock.Mock(), serializer.Serializer())
+    generate_map = service._generate_map  # type: ignore
+
+    def expires_in(milliseconds: int) -> int:
+        # How expiry times were computed before `_expires_at`.
+        delta = timedelta(milliseconds=milliseconds)
+        return int((datetime.now() + delta).timestamp()) * 1000
+
+    def generated() -> t.Dict[str, t.Any]:
+        # How create_key built its payload before the explicit builders.
+        return generate_map(
+            meta={"a": 1},
+            name="name",
+            apiId="api_123",
+            prefix="sk",
+            ownerId="owner_123",
+            remaining=10,
+            byteLength=32,
+            expires=expires_in(5000),
+            ratelimit=generate_map(
+                limit=RATELIMIT.limit,
+                type=RATELIMIT.type.value,
+                refillRate=RATELIMIT.refill_rate,
+                refillInterval=RATELIMIT.refill_interval,
+            ),
+            refill=generate_map(amount=REFILL.amount, interval=REFILL.interval.value),
+        )
+
+    def built() -> t.Dict[str, t.Any]:
+        payload = service._key_payload(  # type: ignore
+            {"apiId": "api_123", "prefix": "sk", "ownerId": "owner_123"},
+            "name",
+            {"a": 1},
+            10,
+            5000,
+            RATELIMIT,
+            REFILL,
+        )
+        payload["byteLength"] = 32
+        return payload  # type: ignore[no-any-return]
+
+    report("create_key payload with _generate_map", generated)
+    report("create_key payload with builders", built)
+    report("datetime based expiry", lambda: expires_in(5000))
+    report("_expires_at(5000)", lambda: service._expires_at(5000))  # type: ignore
+    report(
+        "verify_key payload json.dumps",
+        lambda: json.dumps(generate_map(key="sk_123", apiId="api_123")).encode(),
+    )
+    report(
+        "verify_key payload pre-encoded",
+        lambda: keys._verify_payload("sk_123", "api_123"),  # type: ignore
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Benchmarks building the url of a verify_key request."""
+
+from __future__ import annotations
+
+from helpers import report
+
+from unkey import routes
+from unkey import services
+
+
+def main() -> None:
+    http = services.HttpService(None, None, None)
+    base = http._base_url + http._api_version  # type: ignore
+
+    def compiled() -> str:
+        route = routes.VERIFY_KEY.compile()
+        return base + route.uri
+
+    report("compile() + url concatenation", compiled)
+    report("HttpService._url(VERIFY_KEY)", lambda: http._url(routes.VERIFY_KEY))  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmarks converting models to dictionaries and JSON."""
+
+from __future__ import annotations
+
+import json
+
+import attrs
+from helpers import report
+
+from unkey import models
+from unkey import serializer
+
+VERIFICATION = {
+    "keyId": "key_123",
+    "valid": True,
+    "ownerId": "owner_123",
+    "meta": {"plan": "pro", "tags": ["a", "b"]},
+    "remaining": 10,
+    "expires": 1700000000000,
+    "ratelimit": {"limit": 10, "remaining": 9, "reset": 1700000000000},
+    "refill": {"amount": 10, "interval": "daily"},
+}
+
+KEY = {
+    "id": "key_123",
+    "apiId": "api_123",
+    "workspaceId": "ws_123",
+    "start": "sk_abc",
+    "createdAt": 1700000000000,
+    "meta": {"plan": "pro"},
+    "ratelimit": {"type": "fast", "limit": 10, "refillRate": 1, "refillInterval": 1000},
+}
+
+
+def _serialize(_: type, __: object, value: object) -> object:
+    return str(value) if isinstance(value, models.ErrorCode) else value
+
+
+def _default(value: object) -> object:
+    return value.value if isinstance(value, models.BaseEnum) else value
+
+
+def main() -> None:
+    s = serializer.Serializer()
+    verification = s.to_api_key_verification(VERIFICATION)
+    key = s.to_api_key_meta(KEY)
+
+    report(
+        "ApiKeyVerification attrs.asdict",
+        lambda: attrs.asdict(verification, value_serializer=_serialize),
+    )
+    report("ApiKeyVerification.to_dict", verification.to_dict)
+    report(
+        "ApiKeyVerification json.dumps(attrs.asdict)",
+        lambda: json.dumps(
+            attrs.asdict(verification, value_serializer=_serialize), default=_default
+        ).encode(),
+    )
+    report("ApiKeyVerification.to_json_bytes", verification.to_json_bytes)
+    report("ApiKeyMeta attrs.asdict", lambda: attrs.asdict(key))
+    report("ApiKeyMeta.to_dict", key.to_dict)
+    report(
+        "ApiKeyMeta json.dumps(attrs.asdict)",
+        lambda: json.dumps(attrs.asdict(key), default=_default).encode(),
+    )
+    report("ApiKeyMeta.to_json_bytes", key.to_json_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import timeit
+import typing as t
+
+__all__ = ("report",)
+
+
+def report(name: str, func: t.Callable[[], t.Any], *, number: int = 100_000) -> float:
+    """Times the function and prints the best time per call.
+
+    Args:
+        name: The name to print for the benchmark.
+
+        func: The function to time.
+
+    Keyword Args:
+        number: The number of calls per timing run. Defaults to 100,000.
+
+    Returns:
+        The best time per call in nanoseconds.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+    print(f"{name:<48} {best:>10.1f} ns")
+    return best
@@ -108,3 +108,11 @@ def imports(session: nox.Session) -> None:
 def alls(session: nox.Session) -> None:
     session.install(".")
     session.run("python", "scripts/alls.py")
+
+
+@nox.session(reuse_venv=True)
+def benchmarks(session: nox.Session) -> None:
+    session.install(".")
+
+    for script in sorted(Path("benchmarks").glob("bench_*.py")):
+        session.run("python", str(script))
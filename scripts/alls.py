@@ -21,17 +21,26 @@ def should_include_module(module: str) -> bool:
 
 
 def get_modules() -> t.List[str]:
-    return [m for m in unkey.__dict__ if should_include_module(m)]
+    return [m for m in unkey.__all__ if should_include_module(m)]
 
 
 def get_alls() -> t.Tuple[t.Set[str], t.Set[str]]:
     modules = get_modules()
     return (
-        set(item for module in modules for item in unkey.__dict__[module].__all__),
+        set(item for module in modules for item in getattr(unkey, module).__all__),
         set(i for i in unkey.__all__ if i not in modules),
     )
 
 
+def get_misplaced() -> t.Set[str]:
+    # Every name must be lazily loaded from the module that exports it.
+    return set(
+        f"{name} -> unkey.{module}"
+        for name, module in unkey._EXPORTS.items()
+        if name not in getattr(unkey, module).__all__
+    )
+
+
 def validate_alls() -> None:
     modules, lib = get_alls()
     err = None
@@ -44,6 +53,12 @@ def validate_alls() -> None:
         err = "Missing exported items at module level:\n" + "\n".join(f" - {m}" for m in missing)
         print(err, file=sys.stderr)
 
+    if misplaced := get_misplaced():
+        err = "Exported items mapped to the wrong module:\n" + "\n".join(
+            f" - {m}" for m in misplaced
+        )
+        print(err, file=sys.stderr)
+
     if err:
         sys.exit(1)
 
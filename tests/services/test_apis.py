@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from unkey import ApiService
+from unkey import HttpResponse
+from unkey import ResourceCache
+from unkey import Serializer
+
+
+async def test_get_api_uses_resource_cache() -> None:
+    http = mock.AsyncMock()
+    http.fetch.return_value = {"id": "api_123", "name": "test", "workspaceId": "ws_123"}
+    service = ApiService(http, Serializer(), resource_cache=ResourceCache())
+
+    first = await service.get_api("api_123")
+    second = await service.get_api("api_123")
+
+    assert first.unwrap() == second.unwrap()
+    assert first.unwrap() is not second.unwrap()
+    assert http.fetch.await_count == 1
+
+
+async def test_list_keys_raw() -> None:
+    http = mock.AsyncMock()
+    http.fetch.side_effect = [{"keys": [], "total": 0}, HttpResponse(500, "Oops")]
+    service = ApiService(http, Serializer())
+
+    assert (await service.list_keys_raw("api_123", limit=10)).unwrap() == {"keys": [], "total": 0}
+    assert (await service.list_keys_raw("api_123")).unwrap_err().status == 500
+
+    route = http.fetch.await_args_list[0].args[0]
+    assert route.params == {"apiId": "api_123", "limit": 10}
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 from unittest import mock
 
 import pytest
@@ -32,47 +31,15 @@ def test_generate_map_with_none(service: BaseService) -> None:
     assert result == {"one": 1, "two": None}
 
 
-def test_expires_in_returns_undefined(service: BaseService) -> None:
-    result = service._expires_in()  # type: ignore
+@mock.patch("unkey.services.base.time.time", return_value=946688461.4)
+def test_expires_at(_: mock.Mock, service: BaseService) -> None:
+    result = service._expires_at(5700)  # type: ignore
 
-    assert result is UNDEFINED
+    # The expiry is truncated to the second, like the previous
+    # datetime based implementation.
+    assert result == 946688467000
 
 
-@mock.patch("unkey.services.base.datetime", wraps=datetime)
-def test_expires_in_milliseconds(dt: mock.Mock, service: BaseService) -> None:
-    dt.now = mock.Mock(return_value=datetime(2000, 1, 1, 1, 1, 1))
-
-    result = service._expires_in(milliseconds=5000)  # type: ignore
-
-    assert result
-    assert datetime.fromtimestamp(result // 1000) == datetime(2000, 1, 1, 1, 1, 6)
-
-
-@mock.patch("unkey.services.base.datetime", wraps=datetime)
-def test_expires_in_seconds(dt: mock.Mock, service: BaseService) -> None:
-    dt.now = mock.Mock(return_value=datetime(2000, 1, 1, 1, 1, 1))
-
-    result = service._expires_in(seconds=3)  # type: ignore
-
-    assert result
-    assert datetime.fromtimestamp(result // 1000) == datetime(2000, 1, 1, 1, 1, 4)
-
-
-@mock.patch("unkey.services.base.datetime", wraps=datetime)
-def test_expires_in_minutes(dt: mock.Mock, service: BaseService) -> None:
-    dt.now = mock.Mock(return_value=datetime(2000, 1, 1, 1, 1, 1))
-
-    result = service._expires_in(minutes=2)  # type: ignore
-
-    assert result
-    assert datetime.fromtimestamp(result // 1000) == datetime(2000, 1, 1, 1, 3, 1)
-
-
-@mock.patch("unkey.services.base.datetime", wraps=datetime)
-def test_expires_in_days(dt: mock.Mock, service: BaseService) -> None:
-    dt.now = mock.Mock(return_value=datetime(2000, 1, 1, 1, 1, 1))
-
-    result = service._expires_in(days=6)  # type: ignore
-
-    assert result
-    assert datetime.fromtimestamp(result // 1000) == datetime(2000, 1, 7, 1, 1, 1)
+def test_expires_at_returns_undefined(service: BaseService) -> None:
+    assert service._expires_at(None) is UNDEFINED  # type: ignore
+    assert service._expires_at(0) is UNDEFINED  # type: ignore
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import typing as t
+from unittest import mock
+
 import pytest
 
+from unkey import ErrorCode
+from unkey import HttpResponse
 from unkey import HttpService
+from unkey import HttpxTransport
+from unkey import MemoryTransport
+from unkey import TransportRequest
+from unkey import TransportResponse
 from unkey import constants
+from unkey import routes
 
 
 def test_init() -> None:
@@ -39,3 +50,245 @@ def test_full_init() -> None:
         "x-user-agent": constants.USER_AGENT,
         "Authorization": "Bearer abc123",
     }
+
+
+@pytest.fixture()
+def deduped() -> HttpService:
+    return HttpService("abc123", None, None, dedupe_gets=True)
+
+
+async def test_fetch_dedupes_concurrent_gets(deduped: HttpService) -> None:
+    calls = 0
+
+    async def request(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"meta": {"a": 1}}
+
+    route = routes.GET_KEY.compile().with_params({"keyId": "key_123"})
+    same = routes.GET_KEY.compile().with_params({"keyId": "key_123"})
+    other = routes.GET_KEY.compile().with_params({"keyId": "key_456"})
+
+    with mock.patch.object(HttpService, "_request", side_effect=request):
+        first, second, third = await asyncio.gather(
+            deduped.fetch(route), deduped.fetch(same), deduped.fetch(other)
+        )
+
+    assert calls == 2
+    assert first == second == third
+    assert first is not second
+    assert first["meta"] is not second["meta"]  # type: ignore
+    assert not deduped._in_flight  # type: ignore
+
+
+async def test_fetch_dedupe_survives_cancelled_caller(deduped: HttpService) -> None:
+    async def request(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    route = routes.GET_API.compile()
+
+    with mock.patch.object(HttpService, "_request", side_effect=request):
+        leader = asyncio.ensure_future(deduped.fetch(route))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(deduped.fetch(route))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == {"ok": True}
+
+
+async def test_fetch_does_not_dedupe_posts(deduped: HttpService) -> None:
+    with mock.patch.object(HttpService, "_request", return_value={}) as request:
+        await asyncio.gather(
+            deduped.fetch(routes.VERIFY_KEY.compile()),
+            deduped.fetch(routes.VERIFY_KEY.compile()),
+        )
+
+    assert request.await_count == 2
+
+
+async def test_start_warms_connections() -> None:
+    http = HttpService("abc123", None, None, warm_connections=3)
+
+    with mock.patch.object(HttpService, "_request") as request:
+        await http.start()
+
+    assert request.await_count == 3
+    assert request.await_args.args[1] == constants.API_BASE_URL + "/v1/liveness"  # type: ignore
+    await http.close()
+
+
+async def test_warm_ignores_failures() -> None:
+    http = HttpService("abc123", None, None)
+
+    with mock.patch.object(HttpService, "_request", side_effect=OSError) as request:
+        await http.warm()
+        request.assert_not_called()
+
+        await http.warm(2)
+        assert request.await_count == 2
+
+
+async def test_keep_warm_during_quiet_periods() -> None:
+    http = HttpService("abc123", None, None, warm_connections=2, keep_warm_interval=0.01)
+
+    with mock.patch.object(HttpService, "_request") as request:
+        await http.start()
+        await asyncio.sleep(0.05)
+        await http.close()
+
+    # Two on start, then two more each time the service sat idle.
+    assert request.await_count >= 4
+    assert request.await_count % 2 == 0
+    assert http._keep_warm_task is None  # type: ignore
+
+
+@pytest.fixture()
+def memory() -> MemoryTransport:
+    return MemoryTransport()
+
+
+async def test_fetch_sends_through_transport(memory: MemoryTransport) -> None:
+    sent: t.List[TransportRequest] = []
+
+    def handler(request: TransportRequest) -> TransportResponse:
+        sent.append(request)
+        return MemoryTransport.json_response(200, {"valid": True})
+
+    memory.add_route(constants.POST, "/v1/keys.verifyKey", handler)
+    http = HttpService("abc123", None, None, transport=memory)
+    await http.start()
+
+    assert await http.fetch(routes.VERIFY_KEY.compile(), payload={"key": "abc"}) == {"valid": True}
+    assert sent[0].url == constants.API_BASE_URL + "/v1/keys.verifyKey"
+    assert sent[0].body == b'{"key":"abc"}'
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert sent[0].headers["Authorization"] == "Bearer abc123"
+    await http.close()
+
+
+async def test_fetch_maps_transport_errors(memory: MemoryTransport) -> None:
+    error = {"error": {"code": "NOT_FOUND", "message": "Nope"}}
+    memory.add_json_route(constants.GET, "/v1/keys.getKey", error, status=404)
+    memory.add_route(constants.GET, "/v1/apis.getApi", TransportResponse(502, b"Bad gateway"))
+    http = HttpService("abc123", None, None, transport=memory)
+
+    data = await http.fetch(routes.GET_KEY.compile().with_params({"keyId": "key_123"}))
+    assert data == HttpResponse(404, "Nope", ErrorCode.NotFound)
+    assert await http.fetch(routes.GET_API.compile()) == HttpResponse(502, "Bad gateway")
+
+
+async def test_aiohttp_transport_requires_start() -> None:
+    http = HttpService("abc123", None, None)
+
+    with pytest.raises(RuntimeError) as e:
+        await http.fetch(routes.GET_API.compile())
+
+    assert e.exconly() == "RuntimeError: HttpService.start was never called, aborting..."
+
+
+async def test_httpx_transport_sends_requests() -> None:
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    sent: t.List[t.Any] = []
+
+    def handler(request: t.Any) -> t.Any:
+        sent.append(request)
+        return httpx.Response(200, json={"valid": True})
+
+    transport = HttpxTransport()
+    http = HttpService("abc123", None, None, transport=transport)
+    await http.start()
+    await transport._client.aclose()  # type: ignore
+    transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # type: ignore
+
+    data = await http.fetch(routes.VERIFY_KEY.compile(), payload={"key": "abc"})
+    await http.close()
+
+    assert data == {"valid": True}
+    assert sent[0].content == b'{"key":"abc"}'
+    assert sent[0].headers["authorization"] == "Bearer abc123"
+    assert transport._client.is_closed  # type: ignore
+
+
+async def test_fetch_static_route_uses_cached_url(memory: MemoryTransport) -> None:
+    sent: t.List[str] = []
+
+    def handler(request: TransportRequest) -> TransportResponse:
+        sent.append(request.url)
+        return MemoryTransport.json_response(200, {})
+
+    memory.add_route(constants.POST, "/v1/keys.verifyKey", handler)
+    memory.add_route(constants.POST, "/base/v1/keys.verifyKey", handler)
+    http = HttpService("abc123", None, None, transport=memory)
+
+    await http.fetch(routes.VERIFY_KEY)
+    assert http._urls == {"/keys.verifyKey": sent[0]}  # type: ignore
+
+    http.set_base_url("https://localhost/base")
+    await http.fetch(routes.VERIFY_KEY)
+    assert sent == [
+        constants.API_BASE_URL + "/v1/keys.verifyKey",
+        "https://localhost/base/v1/keys.verifyKey",
+    ]
+
+
+def test_url_cache_skips_uri_variables() -> None:
+    http = HttpService("abc123", None, None)
+    route = routes.Route(constants.GET, "/things/{}").compile("thing_123")
+
+    assert http._url(route) == constants.API_BASE_URL + "/v1/things/thing_123"  # type: ignore
+    assert not http._urls  # type: ignore
+
+
+async def test_close_drains_pending_requests(memory: MemoryTransport) -> None:
+    release = asyncio.Event()
+
+    async def handler(request: TransportRequest) -> TransportResponse:
+        await release.wait()
+        return MemoryTransport.json_response(200, {"ok": True})
+
+    memory.add_route(constants.GET, "/v1/apis.getApi", handler)
+    http = HttpService("abc123", None, None, transport=memory)
+    await http.start()
+
+    pending = asyncio.ensure_future(http.fetch(routes.GET_API.compile()))
+    await asyncio.sleep(0)
+    assert http.pending == 1
+
+    closing = asyncio.ensure_future(http.close(drain_timeout=1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError) as e:
+        await http.fetch(routes.GET_API.compile())
+
+    assert e.exconly() == "RuntimeError: HttpService was closed, aborting..."
+    assert not closing.done()
+
+    release.set()
+    assert await pending == {"ok": True}
+    await closing
+    assert http.pending == 0
+
+
+async def test_close_drain_times_out(memory: MemoryTransport) -> None:
+    async def handler(request: TransportRequest) -> TransportResponse:
+        await asyncio.sleep(10)
+        raise AssertionError
+
+    memory.add_route(constants.GET, "/v1/apis.getApi", handler)
+    http = HttpService("abc123", None, None, transport=memory)
+    await http.start()
+
+    pending = asyncio.ensure_future(http.fetch(routes.GET_API.compile()))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(http.close(drain_timeout=0.01), 1)
+    pending.cancel()
+
+    # Starting again accepts requests again.
+    await http.start()
+    assert await http.fetch(routes.GET_KEY.compile()) == HttpResponse(
+        404, "No route for https://api.unkey.dev/v1/keys.getKey", ErrorCode.NotFound
+    )
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+from unittest import mock
+
+import pytest
+
+from unkey import KeyPrefilter
+from unkey import KeyService
+from unkey import MemoryVerificationCache
+from unkey import ResourceCache
+from unkey import Serializer
+from unkey import models
+
+
+@pytest.fixture()
+def http() -> mock.AsyncMock:
+    http = mock.AsyncMock()
+    http.fetch.return_value = {"keyId": "key_123", "valid": True, "ownerId": "jonxslays"}
+    return http
+
+
+async def test_verify_key_without_cache(http: mock.AsyncMock) -> None:
+    service = KeyService(http, Serializer())
+
+    first = await service.verify_key("key", "api")
+    second = await service.verify_key("key", "api")
+
+    assert first.unwrap().owner_id == "jonxslays"
+    assert second.unwrap().owner_id == "jonxslays"
+    assert http.fetch.await_count == 2
+
+
+async def test_verify_key_uses_cache(http: mock.AsyncMock) -> None:
+    cache = MemoryVerificationCache()
+    service = KeyService(http, Serializer(), verification_cache=cache)
+
+    first = await service.verify_key("key", "api")
+    second = await service.verify_key("key", "api")
+    other = await service.verify_key("key", "other_api")
+
+    assert service.verification_cache is cache
+    assert first.unwrap().id == second.unwrap().id == "key_123"
+    assert first.unwrap() is not second.unwrap()
+    assert other.is_ok
+    assert http.fetch.await_count == 2
+
+
+async def test_verify_key_does_not_cache_errors(http: mock.AsyncMock) -> None:
+    http.fetch.return_value = models.HttpResponse(500, "oops")
+    cache = MemoryVerificationCache()
+    service = KeyService(http, Serializer(), verification_cache=cache)
+
+    assert (await service.verify_key("key", "api")).is_err
+    assert (await service.verify_key("key", "api")).is_err
+    assert len(cache) == 0
+    assert http.fetch.await_count == 2
+
+
+async def test_verify_key_refreshes_stale_entries(http: mock.AsyncMock) -> None:
+    cache = MemoryVerificationCache(ttl=10, max_stale=30)
+    service = KeyService(http, Serializer(), verification_cache=cache)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        await service.verify_key("key", "api")
+
+    http.fetch.return_value = {"keyId": "key_123", "valid": True, "ownerId": "new"}
+
+    with mock.patch("unkey.cache.time.time", return_value=1020.0):
+        first = await service.verify_key("key", "api")
+        second = await service.verify_key("key", "api")
+        await asyncio.sleep(0)
+
+        assert first.unwrap().owner_id == second.unwrap().owner_id == "jonxslays"
+        assert http.fetch.await_count == 2
+
+        third = await service.verify_key("key", "api")
+        assert third.unwrap().owner_id == "new"
+
+
+async def test_verify_key_refresh_drops_invalid_keys(http: mock.AsyncMock) -> None:
+    cache = MemoryVerificationCache(ttl=10, max_stale=30)
+    service = KeyService(http, Serializer(), verification_cache=cache)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        await service.verify_key("key", "api")
+
+    http.fetch.return_value = {"valid": False, "code": "NOT_FOUND"}
+
+    with mock.patch("unkey.cache.time.time", return_value=1020.0):
+        assert (await service.verify_key("key", "api")).unwrap().valid
+        await asyncio.sleep(0)
+
+        assert not (await service.verify_key("key", "api")).unwrap().valid
+
+
+async def test_drain_waits_for_refreshes(http: mock.AsyncMock) -> None:
+    cache = MemoryVerificationCache(ttl=10, max_stale=30)
+    service = KeyService(http, Serializer(), verification_cache=cache)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        await service.verify_key("key", "api")
+        await service.verify_key("other", "api")
+
+    async def fetch(*_: t.Any, payload: bytes) -> t.Dict[str, t.Any]:
+        await asyncio.sleep(0.01 if b'"key":"key"' in payload else 10)
+        return {"keyId": "key_123", "valid": True, "ownerId": "new"}
+
+    http.fetch.side_effect = fetch
+
+    with mock.patch("unkey.cache.time.time", return_value=1020.0):
+        await service.verify_key("key", "api")
+        await service.verify_key("other", "api")
+        assert service.refreshing == 2
+
+        await service.drain(0.1)
+
+        assert service.refreshing == 0
+        assert (await service.verify_key("key", "api")).unwrap().owner_id == "new"
+        assert (await service.verify_key("other", "api")).unwrap().owner_id == "jonxslays"
+
+
+async def test_revoke_key_invalidates_cache(http: mock.AsyncMock) -> None:
+    cache = MemoryVerificationCache()
+    service = KeyService(http, Serializer(), verification_cache=cache)
+    await service.verify_key("key", "api")
+
+    http.fetch.return_value = {}
+    await service.revoke_key("key_123")
+
+    assert len(cache) == 0
+
+
+async def test_verify_key_with_prefilter(http: mock.AsyncMock) -> None:
+    prefilter = KeyPrefilter(prefixes=["sk_"])
+    service = KeyService(http, Serializer(), prefilter=prefilter)
+
+    rejected = (await service.verify_key("garbage", "api")).unwrap()
+
+    assert service.prefilter is prefilter
+    assert not rejected.valid
+    assert rejected.code is models.ErrorCode.NotFound
+    http.fetch.assert_not_awaited()
+
+    http.fetch.return_value = {"valid": False, "code": "NOT_FOUND"}
+    await service.verify_key("sk_unknown", "api")
+    await service.verify_key("sk_unknown", "api")
+
+    assert http.fetch.await_count == 1
+
+
+KEY_META = {
+    "id": "key_123",
+    "apiId": "api_123",
+    "workspaceId": "ws_123",
+    "start": "sk_abc",
+    "createdAt": 1,
+    "remaining": 10,
+}
+
+
+async def test_get_key_uses_resource_cache(http: mock.AsyncMock) -> None:
+    http.fetch.return_value = KEY_META
+    service = KeyService(http, Serializer(), resource_cache=ResourceCache())
+
+    await service.get_key("key_123")
+    cached = await service.get_key("key_123")
+
+    assert cached.unwrap().remaining == 10
+    assert http.fetch.await_count == 1
+
+    http.fetch.return_value = {"remaining": 4}
+    await service.update_remaining("key_123", 6, models.UpdateOp.Decrement)
+    patched = await service.get_key("key_123")
+
+    assert patched.unwrap().remaining == 4
+    assert http.fetch.await_count == 2
+
+    http.fetch.return_value = {}
+    await service.update_key("key_123", name="new")
+    http.fetch.return_value = KEY_META
+    await service.get_key("key_123")
+
+    assert http.fetch.await_count == 4
+
+
+async def test_write_listeners(http: mock.AsyncMock) -> None:
+    listener = mock.Mock()
+    service = KeyService(http, Serializer())
+    service.add_write_listener(listener)
+
+    await service.update_key("key_123", owner_id=None, meta={"a": 1})
+    http.fetch.return_value = {"remaining": 5}
+    await service.update_remaining("key_123", 5, models.UpdateOp.Set)
+    await service.revoke_key("key_123")
+
+    assert listener.call_args_list == [
+        mock.call("key_123", {"ownerId": None, "meta": {"a": 1}}),
+        mock.call("key_123", {"remaining": 5}),
+        mock.call("key_123", None),
+    ]
+
+    service.remove_write_listener(listener)
+    http.fetch.return_value = models.HttpResponse(500, "oops")
+    await service.revoke_key("key_123")
+    assert listener.call_count == 3
+
+
+async def test_verify_key_payload(http: mock.AsyncMock) -> None:
+    await KeyService(http, Serializer()).verify_key('k"é\n', "api_123")
+
+    payload = http.fetch.await_args.kwargs["payload"]
+    assert json.loads(payload) == {"key": 'k"é\n', "apiId": "api_123"}
+
+
+@mock.patch("unkey.services.base.time.time", return_value=1000.5)
+async def test_create_key_payload(_: mock.Mock, http: mock.AsyncMock) -> None:
+    http.fetch.return_value = {"key": "sk_123", "keyId": "key_123"}
+    service = KeyService(http, Serializer())
+
+    await service.create_key("api_123", "owner_123", "sk")
+    assert http.fetch.await_args.kwargs["payload"] == {
+        "apiId": "api_123",
+        "prefix": "sk",
+        "ownerId": "owner_123",
+    }
+
+    await service.create_key(
+        "api_123",
+        "owner_123",
+        "sk",
+        name="name",
+        byte_length=32,
+        meta={"a": 1},
+        expires=5000,
+        remaining=10,
+        ratelimit=models.Ratelimit(
+            type=models.RatelimitType.Fast, limit=10, refill_rate=1, refill_interval=1000
+        ),
+        refill=models.Refill(amount=5, interval=models.RefillInterval.Daily),
+    )
+    assert http.fetch.await_args.kwargs["payload"] == {
+        "apiId": "api_123",
+        "prefix": "sk",
+        "ownerId": "owner_123",
+        "meta": {"a": 1},
+        "name": "name",
+        "remaining": 10,
+        "byteLength": 32,
+        "expires": 1005000,
+        "ratelimit": {"limit": 10, "type": "fast", "refillRate": 1, "refillInterval": 1000},
+        "refill": {"amount": 5, "interval": "daily"},
+    }
+
+
+async def test_update_key_payload(http: mock.AsyncMock) -> None:
+    sent = []
+    http.fetch.side_effect = lambda route, payload: sent.append(dict(payload))
+    await KeyService(http, Serializer()).update_key(
+        "key_123", name=None, remaining=5, expires=None, ratelimit=None
+    )
+
+    assert sent == [{"keyId": "key_123", "name": None, "remaining": 5}]
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from unittest import mock
+
+import pytest
+
+from unkey import MemoryVerificationCache
+from unkey import ResourceCache
+from unkey import SharedVerificationCache
+from unkey import VerificationCache
+
+DictT = t.Dict[str, t.Any]
+
+
+@pytest.fixture()
+def cache() -> MemoryVerificationCache:
+    return MemoryVerificationCache(ttl=10, maxsize=2)
+
+
+@pytest.fixture()
+def payload() -> DictT:
+    return {"keyId": "key_123", "valid": True, "meta": {"a": {"b": 1}}}
+
+
+def test_digest_is_stable() -> None:
+    first = VerificationCache.digest("key", "api")
+    second = VerificationCache.digest("key", "api")
+
+    assert first == second
+    assert len(first) == 32
+    assert first != VerificationCache.digest("key", "other")
+
+
+def test_init_fails_with_bad_ttl() -> None:
+    with pytest.raises(ValueError) as e:
+        MemoryVerificationCache(ttl=0)
+
+    assert e.exconly() == "ValueError: Cache ttl must be greater than 0."
+
+
+def test_init_fails_with_bad_maxsize() -> None:
+    with pytest.raises(ValueError) as e:
+        MemoryVerificationCache(maxsize=0)
+
+    assert e.exconly() == "ValueError: Cache maxsize must be at least 1."
+
+
+def test_store_and_get(cache: MemoryVerificationCache, payload: DictT) -> None:
+    assert cache.store(b"a", payload)
+    assert cache.get(b"a") == payload
+    assert cache.get(b"b") is None
+
+
+def test_get_copies_meta(cache: MemoryVerificationCache, payload: DictT) -> None:
+    cache.store(b"a", payload)
+    payload["meta"]["a"]["b"] = 2
+
+    first = cache.get(b"a")
+    assert first
+    first["meta"]["a"]["b"] = 3
+
+    second = cache.get(b"a")
+    assert second
+    assert second["meta"] == {"a": {"b": 1}}
+
+
+def test_store_skips_invalid(cache: MemoryVerificationCache) -> None:
+    assert not cache.store(b"a", {"valid": False, "code": "NOT_FOUND"})
+    assert cache.get(b"a") is None
+
+
+def test_store_skips_limited_keys(cache: MemoryVerificationCache) -> None:
+    assert not cache.store(b"a", {"valid": True, "remaining": 5})
+    assert not cache.store(b"b", {"valid": True, "ratelimit": {"limit": 1}})
+
+
+def test_store_limited_keys_when_enabled() -> None:
+    cache = MemoryVerificationCache(cache_limited=True)
+
+    assert cache.store(b"a", {"valid": True, "remaining": 5})
+
+
+@mock.patch("unkey.cache.time.time", return_value=1000.0)
+def test_expiry_respects_key_expiry(_: mock.Mock, cache: MemoryVerificationCache) -> None:
+    assert cache.expiry_for({"expires": 1_005_000}, 1000.0) == 1005.0
+    assert cache.expiry_for({"expires": 9_000_000}, 1000.0) == 1010.0
+    assert cache.expiry_for({}, 1000.0) == 1010.0
+    assert not cache.store(b"a", {"valid": True, "expires": 999_000})
+
+
+def test_expired_entries_are_removed(cache: MemoryVerificationCache, payload: DictT) -> None:
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        cache.store(b"a", payload)
+
+    with mock.patch("unkey.cache.time.time", return_value=1010.0):
+        assert cache.get(b"a") is None
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted(cache: MemoryVerificationCache, payload: DictT) -> None:
+    cache.store(b"a", payload)
+    cache.store(b"b", payload)
+    cache.get(b"a")
+    cache.store(b"c", payload)
+
+    assert len(cache) == 2
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+
+
+def test_delete_and_clear(cache: MemoryVerificationCache, payload: DictT) -> None:
+    cache.store(b"a", payload)
+    cache.store(b"b", payload)
+
+    cache.delete(b"a")
+    assert cache.get(b"a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.fixture()
+def shared(tmp_path: t.Any) -> t.Iterator[SharedVerificationCache]:
+    cache = SharedVerificationCache(str(tmp_path / "cache"), ttl=10, slots=4, slot_size=128)
+    yield cache
+    cache.close()
+
+
+def test_shared_store_and_get(shared: SharedVerificationCache, payload: DictT) -> None:
+    digest = VerificationCache.digest("key", "api")
+
+    assert shared.store(digest, {**payload, "error": None})
+    assert shared.get(digest) == payload
+    assert shared.get(VerificationCache.digest("other", "api")) is None
+
+
+def test_shared_is_visible_to_other_instances(
+    shared: SharedVerificationCache, payload: DictT
+) -> None:
+    digest = VerificationCache.digest("key", "api")
+    shared.store(digest, payload)
+
+    other = SharedVerificationCache(shared.path, ttl=10, slots=4, slot_size=128)
+    assert other.get(digest) == payload
+
+    other.delete(digest)
+    assert shared.get(digest) is None
+    other.close()
+
+
+def test_shared_fails_with_different_geometry(shared: SharedVerificationCache) -> None:
+    with pytest.raises(ValueError) as e:
+        SharedVerificationCache(shared.path, slots=8, slot_size=128)
+
+    assert e.exconly().endswith("was created with a different geometry.")
+
+
+def test_shared_refuses_files_others_can_write(tmp_path: t.Any) -> None:
+    path = tmp_path / "cache"
+    path.touch()
+    path.chmod(0o666)
+
+    with pytest.raises(ValueError):
+        SharedVerificationCache(str(path), slots=4, slot_size=128)
+
+
+def test_shared_refuses_symlinks(shared: SharedVerificationCache, tmp_path: t.Any) -> None:
+    link = tmp_path / "link"
+    link.symlink_to(shared.path)
+
+    with pytest.raises(OSError):
+        SharedVerificationCache(str(link), slots=4, slot_size=128)
+
+
+def test_shared_default_path_is_private(tmp_path: t.Any) -> None:
+    with mock.patch("tempfile.gettempdir", return_value=str(tmp_path)):
+        cache = SharedVerificationCache(slots=4, slot_size=128)
+
+    cache.close()
+    assert os.path.dirname(cache.path) != str(tmp_path)
+    assert os.stat(os.path.dirname(cache.path)).st_mode & 0o777 == 0o700
+    assert os.stat(cache.path).st_mode & 0o777 == 0o600
+
+
+def test_shared_refuses_shared_default_directory(tmp_path: t.Any) -> None:
+    (tmp_path / f"unkey-{os.geteuid()}").mkdir(mode=0o777)
+    (tmp_path / f"unkey-{os.geteuid()}").chmod(0o777)
+
+    with mock.patch("tempfile.gettempdir", return_value=str(tmp_path)):
+        with pytest.raises(ValueError):
+            SharedVerificationCache(slots=4, slot_size=128)
+
+
+def test_shared_skips_large_payloads(shared: SharedVerificationCache) -> None:
+    digest = VerificationCache.digest("key", "api")
+    shared.store(digest, {"valid": True, "meta": {"a": "b" * 200}})
+
+    assert shared.get(digest) is None
+
+
+def test_shared_ignores_corrupt_slots(shared: SharedVerificationCache, payload: DictT) -> None:
+    digest = VerificationCache.digest("key", "api")
+    shared.store(digest, payload)
+
+    for offset in shared._offsets(digest):  # type: ignore
+        shared._map[offset + 40] ^= 0xFF  # type: ignore
+
+    assert shared.get(digest) is None
+
+
+def test_shared_evicts_when_full(shared: SharedVerificationCache, payload: DictT) -> None:
+    digests = [VerificationCache.digest(str(i), "api") for i in range(6)]
+
+    for digest in digests:
+        shared.store(digest, payload)
+
+    assert sum(shared.get(d) is not None for d in digests) == 4
+
+    shared.clear()
+    assert all(shared.get(d) is None for d in digests)
+
+
+def test_snapshot_round_trip(tmp_path: t.Any, payload: DictT) -> None:
+    path = str(tmp_path / "snapshot.db")
+    cache = MemoryVerificationCache(ttl=10, snapshot_path=path)
+    cache.store(b"a", payload)
+
+    with mock.patch("unkey.cache.time.time", return_value=1.0):
+        cache.store(b"expired", payload)
+
+    cache.save()
+
+    loaded = MemoryVerificationCache(ttl=10, snapshot_path=path)
+    loaded.load()
+
+    assert len(loaded) == 1
+    assert loaded.get(b"a") == payload
+
+
+def test_snapshot_load_discards_expired(tmp_path: t.Any, payload: DictT) -> None:
+    path = str(tmp_path / "snapshot.db")
+    cache = MemoryVerificationCache(ttl=10, snapshot_path=path)
+    cache.store(b"a", payload)
+    cache.save()
+
+    loaded = MemoryVerificationCache(ttl=10, snapshot_path=path)
+
+    with mock.patch("unkey.cache.time.time", return_value=2**40):
+        loaded.load()
+
+    assert len(loaded) == 0
+
+
+def test_snapshot_without_path_does_nothing(cache: MemoryVerificationCache) -> None:
+    cache.save()
+    cache.load()
+
+    assert len(cache) == 0
+
+
+def test_init_fails_with_bad_stale_settings() -> None:
+    with pytest.raises(ValueError) as e:
+        MemoryVerificationCache(max_stale=-1)
+
+    assert e.exconly() == "ValueError: Cache max_stale must not be negative."
+
+    with pytest.raises(ValueError) as e:
+        MemoryVerificationCache(refresh_ahead_at=1)
+
+    assert e.exconly() == "ValueError: Cache refresh_ahead_at must be between 0 and 1."
+
+
+def test_lookup_serves_stale_entries(payload: DictT) -> None:
+    cache = MemoryVerificationCache(ttl=10, max_stale=5)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        cache.store(b"a", payload)
+        assert cache.lookup(b"a") == (payload, False)
+
+    with mock.patch("unkey.cache.time.time", return_value=1012.0):
+        assert cache.get(b"a") is None
+        assert cache.lookup(b"a") == (payload, True)
+
+    with mock.patch("unkey.cache.time.time", return_value=1015.0):
+        assert cache.lookup(b"a") == (None, False)
+
+    assert len(cache) == 0
+
+
+def test_stale_entries_respect_key_expiry(payload: DictT) -> None:
+    cache = MemoryVerificationCache(ttl=10, max_stale=60)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        cache.store(b"a", {**payload, "expires": 1_012_000})
+
+    with mock.patch("unkey.cache.time.time", return_value=1011.0):
+        assert cache.lookup(b"a")[1]
+
+    with mock.patch("unkey.cache.time.time", return_value=1012.0):
+        assert cache.lookup(b"a") == (None, False)
+
+
+def test_lookup_refreshes_hot_entries_ahead(payload: DictT) -> None:
+    cache = MemoryVerificationCache(ttl=10, refresh_ahead_hits=2, refresh_ahead_at=0.5)
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        cache.store(b"a", payload)
+        assert not cache.lookup(b"a")[1]
+
+    with mock.patch("unkey.cache.time.time", return_value=1006.0):
+        assert cache.lookup(b"a")[1]
+        cache.store(b"a", payload)
+        assert not cache.lookup(b"a")[1]
+
+
+def test_invalidate_by_key_id(cache: MemoryVerificationCache, payload: DictT) -> None:
+    cache.store(b"a", payload)
+    cache.store(b"b", {**payload, "keyId": "key_456"})
+
+    cache.invalidate("key_123")
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") is not None
+
+
+def test_shared_invalidate_by_key_id(shared: SharedVerificationCache, payload: DictT) -> None:
+    first = VerificationCache.digest("key", "api")
+    second = VerificationCache.digest("other", "api")
+    shared.store(first, payload)
+    shared.store(second, {**payload, "keyId": "key_456"})
+
+    shared.invalidate("key_123")
+
+    assert shared.get(first) is None
+    assert shared.get(second) is not None
+
+
+@pytest.fixture()
+def resources() -> ResourceCache:
+    return ResourceCache(key_ttl=10, key_maxsize=2, api_ttl=20)
+
+
+def test_resource_cache_init_fails() -> None:
+    with pytest.raises(ValueError):
+        ResourceCache(key_ttl=0)
+
+    with pytest.raises(ValueError):
+        ResourceCache(api_maxsize=0)
+
+
+def test_resource_cache_keys(resources: ResourceCache, payload: DictT) -> None:
+    resources.store_key("key_123", payload)
+    cached = resources.get_key("key_123")
+
+    assert cached == payload
+    assert cached is not payload
+    assert resources.get_key("key_456") is None
+
+    resources.patch_key("key_123", remaining=5)
+    assert resources.get_key("key_123") == {**payload, "remaining": 5}
+
+    resources.invalidate_key("key_123")
+    assert resources.get_key("key_123") is None
+
+
+def test_resource_cache_apis(resources: ResourceCache) -> None:
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        resources.store_api("api_123", {"id": "api_123"})
+        assert resources.get_api("api_123") == {"id": "api_123"}
+
+    with mock.patch("unkey.cache.time.time", return_value=1020.0):
+        assert resources.get_api("api_123") is None
+
+    resources.store_api("api_123", {"id": "api_123"})
+    resources.invalidate_api("api_123")
+    assert resources.get_api("api_123") is None
+
+
+def test_resource_cache_is_bounded(resources: ResourceCache, payload: DictT) -> None:
+    for key_id in ("one", "two", "three"):
+        resources.store_key(key_id, payload)
+
+    assert resources.get_key("one") is None
+    assert resources.get_key("three") is not None
+
+    resources.clear()
+    assert resources.get_key("three") is None
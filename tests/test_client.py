@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import typing as t
 from unittest import mock
 
 import pytest
 
 from unkey import Client
+from unkey import MemoryTransport
+from unkey import MemoryVerificationCache
+from unkey import SlowRequestLogger
+from unkey import TransportRequest
+from unkey import TransportResponse
+from unkey import constants
 from unkey import services
 
 
@@ -19,15 +27,44 @@ async def test_all_services_exist() -> None:
 @mock.patch("unkey.client.services.HttpService")
 async def test_basic_init(http: mock.MagicMock, serializer: mock.MagicMock) -> None:
     _ = Client("abc123")
-    http.assert_called_once_with("abc123", None, None)
+    http.assert_called_once_with(
+        "abc123",
+        None,
+        None,
+        dedupe_gets=False,
+        warm_connections=0,
+        keep_warm_interval=None,
+        transport=None,
+        slow_request_log=None,
+    )
     serializer.assert_called_once()
 
 
 @mock.patch("unkey.client.serializer.Serializer")
 @mock.patch("unkey.client.services.HttpService")
 async def test_full_init(http: mock.MagicMock, serializer: mock.MagicMock) -> None:
-    _ = Client("abc", api_version=69, api_base_url="fake")
-    http.assert_called_once_with("abc", 69, "fake")
+    transport = MemoryTransport()
+    logger = SlowRequestLogger()
+    _ = Client(
+        "abc",
+        api_version=69,
+        api_base_url="fake",
+        dedupe_gets=True,
+        warm_connections=4,
+        keep_warm_interval=10,
+        transport=transport,
+        slow_request_log=logger,
+    )
+    http.assert_called_once_with(
+        "abc",
+        69,
+        "fake",
+        dedupe_gets=True,
+        warm_connections=4,
+        keep_warm_interval=10,
+        transport=transport,
+        slow_request_log=logger,
+    )
     serializer.assert_called_once()
 
 
@@ -77,8 +114,13 @@ async def test_init_services(init_service: mock.MagicMock) -> None:
     _ = Client("abc")
     init_service.assert_has_calls(
         (
-            mock.call(services.ApiService),
-            mock.call(services.KeyService),
+            mock.call(services.ApiService, resource_cache=None),
+            mock.call(
+                services.KeyService,
+                resource_cache=None,
+                verification_cache=None,
+                prefilter=None,
+            ),
         )
     )
 
@@ -91,3 +133,42 @@ async def test_init_service_fails() -> None:
 
     assert e.exconly() == "TypeError: 'int' can not be initialized as a service."
     await client.close()
+
+
+@mock.patch("unkey.client.services.HttpService.close")
+@mock.patch("unkey.client.services.HttpService.start")
+async def test_start_and_close_with_cache(start: mock.MagicMock, close: mock.MagicMock) -> None:
+    verification_cache = mock.Mock()
+    client = Client("abc123", verification_cache=verification_cache)
+
+    await client.start()
+    verification_cache.load.assert_called_once()
+    verification_cache.save.assert_not_called()
+
+    await client.close()
+    verification_cache.save.assert_called_once()
+
+
+async def test_close_drains_refreshes() -> None:
+    verifications: t.List[TransportRequest] = []
+
+    async def verify(request: TransportRequest) -> TransportResponse:
+        verifications.append(request)
+        await asyncio.sleep(0.01)
+        return MemoryTransport.json_response(200, {"keyId": "key_123", "valid": True})
+
+    transport = MemoryTransport()
+    transport.add_route(constants.POST, "/v1/keys.verifyKey", verify)
+    cache = MemoryVerificationCache(ttl=1, max_stale=1)
+    client = Client("abc123", transport=transport, verification_cache=cache)
+    await client.start()
+
+    with mock.patch("unkey.cache.time.time", return_value=1000.0):
+        assert (await client.keys.verify_key("key", "api")).is_ok
+
+    with mock.patch("unkey.cache.time.time", return_value=1001.5):
+        assert (await client.keys.verify_key("key", "api")).is_ok
+        await client.close(drain_timeout=1)
+
+    assert len(verifications) == 2
+    assert client.keys.refreshing == 0
@@ -44,3 +44,14 @@ def test_from_str_maybe_none() -> None:
 def test_str() -> None:
     period = models.RatelimitType.Consistent
     assert str(period) == "consistent"
+
+
+def test_from_str_maybe_unhashable() -> None:
+    code = models.ErrorCode.from_str_maybe([])  # type: ignore
+    assert code is None
+
+
+def test_from_str_maybe_every_variant() -> None:
+    for enum in (models.ErrorCode, models.RatelimitType, models.RefillInterval, models.UpdateOp):
+        for member in enum:
+            assert enum.from_str_maybe(member.value) is member
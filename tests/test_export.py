@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import csv
+import json
+import threading
+import typing as t
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from tests.utils import make_client
+from tests.utils import make_key
+from tests.utils import make_page
+from unkey import ErrorCode
+from unkey import HttpResponse
+from unkey import KeyExporter
+from unkey import Ok
+from unkey import Serializer
+
+serializer = Serializer()
+
+
+def make_list(ids: t.List[str], cursor: t.Optional[str] = None) -> t.Any:
+    keys = [make_key(id, meta={"n": id}) for id in ids]
+    return serializer.to_api_key_list(make_page(*keys, cursor=cursor))
+
+
+async def test_export_ndjson(tmp_path: Path) -> None:
+    client = make_client(make_list(["key_1", "key_2"], "c1"), make_list(["key_3"]))
+    path = str(tmp_path / "keys.ndjson")
+
+    assert await KeyExporter(client, page_size=2).export("api_123", path) == 3
+
+    rows = [json.loads(line) for line in open(path)]
+    assert [row["id"] for row in rows] == ["key_1", "key_2", "key_3"]
+    assert rows[0]["meta"] == {"n": "key_1"}
+    assert not Path(KeyExporter.checkpoint_path(path)).exists()
+    client.apis.list_keys.assert_awaited_with("api_123", owner_id=mock.ANY, limit=2, cursor="c1")
+
+
+async def test_export_writes_off_the_event_loop(tmp_path: Path) -> None:
+    client = make_client(make_list(["key_1"], "c1"), make_list(["key_2"]))
+    write = KeyExporter._write_page
+    threads: t.List[int] = []
+
+    def record(*args: t.Any) -> None:
+        threads.append(threading.get_ident())
+        write(*args)
+
+    with mock.patch.object(KeyExporter, "_write_page", record):
+        await KeyExporter(client).export("api_123", str(tmp_path / "keys.ndjson"))
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+async def test_export_csv(tmp_path: Path) -> None:
+    client = make_client(make_list(["key_1", "key_2"]))
+    path = str(tmp_path / "keys.csv")
+
+    assert await KeyExporter(client).export("api_123", path, format="csv") == 2
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["id"] for row in rows] == ["key_1", "key_2"]
+    assert rows[1]["meta"] == '{"n":"key_2"}'
+    assert rows[1]["expires"] == ""
+
+
+async def test_export_resumes_from_checkpoint(tmp_path: Path) -> None:
+    error = HttpResponse(500, "Boom", ErrorCode.InternalServerError)
+    client = make_client(make_list(["key_1"], "c1"), error)
+    path = str(tmp_path / "keys.ndjson")
+    exporter = KeyExporter(client)
+
+    with pytest.raises(RuntimeError):
+        await exporter.export("api_123", path)
+
+    checkpoint = json.loads(Path(KeyExporter.checkpoint_path(path)).read_text())
+    assert checkpoint["cursor"] == "c1"
+    assert checkpoint["rows"] == 1
+
+    # Simulate a partial write after the checkpoint was saved.
+    with open(path, "a") as f:
+        f.write('{"id": "partial"')
+
+    client.apis.list_keys = mock.AsyncMock(side_effect=[Ok(make_list(["key_2"]))])
+    assert await exporter.export("api_123", path) == 2
+
+    client.apis.list_keys.assert_awaited_once_with(
+        "api_123", owner_id=mock.ANY, limit=100, cursor="c1"
+    )
+    rows = [json.loads(line) for line in open(path)]
+    assert [row["id"] for row in rows] == ["key_1", "key_2"]
+
+
+async def test_export_without_resume_restarts(tmp_path: Path) -> None:
+    path = tmp_path / "keys.ndjson"
+    path.write_text('{"id": "old"}\n')
+    Path(KeyExporter.checkpoint_path(str(path))).write_text(
+        json.dumps({"format": "ndjson", "cursor": "c1", "rows": 1, "offset": 14})
+    )
+    client = make_client(make_list(["key_1"]))
+
+    assert await KeyExporter(client).export("api_123", str(path), resume=False) == 1
+    client.apis.list_keys.assert_awaited_once_with(
+        "api_123", owner_id=mock.ANY, limit=100, cursor=mock.ANY
+    )
+    assert [json.loads(line)["id"] for line in open(path)] == ["key_1"]
+
+
+async def test_export_parquet(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    client = make_client(make_list(["key_1"], "c1"), make_list(["key_2"]))
+    path = str(tmp_path / "keys.parquet")
+
+    assert await KeyExporter(client).export("api_123", path, format="parquet") == 2
+
+    table = pq.read_table(path)
+    assert table.column("id").to_pylist() == ["key_1", "key_2"]
+    assert table.column("meta").to_pylist() == ['{"n":"key_1"}', '{"n":"key_2"}']
+
+
+async def test_export_invalid_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        await KeyExporter(mock.Mock()).export("api_123", str(tmp_path / "x"), format="xml")
+
+
+async def test_export_many(tmp_path: Path) -> None:
+    client = make_client(make_list(["key_1"]), make_list(["key_2", "key_3"]))
+
+    counts = await KeyExporter(client, concurrency=1).export_many(
+        ["api_1", "api_2", "api_1"], str(tmp_path / "out")
+    )
+
+    assert counts == {"api_1": 1, "api_2": 2}
+    assert (tmp_path / "out" / "api_1.ndjson").exists()
+    assert (tmp_path / "out" / "api_2.ndjson").exists()
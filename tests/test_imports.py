@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import unkey
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.strip()
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, unkey; "
+        "print(sorted(m for m in sys.modules if m.startswith(('unkey.', 'aiohttp'))))"
+    )
+    assert run(code) == "[]"
+
+
+def test_models_do_not_import_aiohttp() -> None:
+    code = "import sys, unkey; unkey.ApiKeyMeta; unkey.Client; print('aiohttp' in sys.modules)"
+    assert run(code) == "False"
+
+
+def test_lazy_attributes() -> None:
+    from unkey import client
+    from unkey import models
+
+    assert unkey.client is client
+    assert unkey.Client is client.Client
+    assert unkey.ApiKeyMeta is models.ApiKeyMeta
+    assert "Client" in dir(unkey)
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError) as e:
+        unkey.fake  # type: ignore
+
+    assert e.exconly() == "AttributeError: module 'unkey' has no attribute 'fake'"
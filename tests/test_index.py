@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from tests.utils import make_client
+from tests.utils import make_key
+from unkey import HttpResponse
+from unkey import KeyIndex
+from unkey import SyncStats
+
+
+def make_raw_client(*pages: t.Any) -> mock.Mock:
+    return make_client(*pages, method="list_keys_raw")
+
+
+@pytest.fixture()
+async def index() -> KeyIndex:
+    index = KeyIndex()
+    client = make_raw_client(
+        {"cursor": "c1", "keys": [make_key("key_1", ownerId="one", expires=500, createdAt=10)]},
+        {"keys": [make_key("key_2", ownerId="one", expires=1500), make_key("key_3")]},
+        {"keys": [make_key("key_4", "api_2", ownerId="one", createdAt=300)]},
+    )
+
+    stats = (await index.sync(client, ["api_123", "api_2"])).unwrap()
+    assert stats == SyncStats(added=4)
+    return index
+
+
+async def test_queries(index: KeyIndex) -> None:
+    assert len(index) == 4
+    assert "key_1" in index
+    assert index.watermark("api_123") == 100
+    assert index.get("key_3").id == "key_3"  # type: ignore[union-attr]
+    assert index.get("key_5") is None
+    assert [k.id for k in index.by_owner("one")] == ["key_1", "key_2", "key_4"]
+    assert [k.id for k in index.by_owner("one", api_id="api_2")] == ["key_4"]
+    assert [k.id for k in index.by_api("api_123")] == ["key_1", "key_2", "key_3"]
+    assert [k.id for k in index.expiring_between(0, 1000)] == ["key_1"]
+    assert [k.id for k in index.expiring_between(500, 1501)] == ["key_1", "key_2"]
+    assert [k.id for k in index.created_between(50, 300)] == ["key_2", "key_3"]
+
+
+async def test_incremental_sync(index: KeyIndex) -> None:
+    client = make_raw_client(
+        {
+            "keys": [
+                make_key("key_1", ownerId="one", expires=500, createdAt=10),
+                make_key("key_2", ownerId="two", expires=1500),
+                make_key("key_5", createdAt=200),
+            ]
+        }
+    )
+
+    stats = (await index.sync(client, ["api_123"])).unwrap()
+
+    assert stats == SyncStats(added=1, updated=1, removed=1, unchanged=1)
+    assert "key_3" not in index
+    assert [k.id for k in index.by_owner("one")] == ["key_1", "key_4"]
+    assert [k.id for k in index.by_owner("two")] == ["key_2"]
+    assert index.watermark("api_123") == 200
+
+
+async def test_full_sync(index: KeyIndex) -> None:
+    client = make_raw_client({"keys": [make_key("key_1", createdAt=10)]})
+
+    stats = (await index.sync(client, ["api_123"], full=True)).unwrap()
+
+    assert stats == SyncStats(added=1)
+    assert [k.id for k in index.by_api("api_123")] == ["key_1"]
+    assert index.by_owner("one")[0].id == "key_4"
+
+
+async def test_sync_error_keeps_keys(index: KeyIndex) -> None:
+    client = make_raw_client(HttpResponse(500, "Oops"))
+
+    assert (await index.sync(client, ["api_123"])).is_err
+    assert len(index) == 4
+
+
+async def test_apply_write(index: KeyIndex) -> None:
+    index.apply_write("key_1", {"ownerId": None, "expires": 2000, "remaining": 3})
+    index.apply_write("key_3", None)
+    index.apply_write("key_9", {"remaining": 1})
+
+    key = index.get("key_1")
+    assert key is not None
+    assert key.owner_id is None
+    assert key.remaining == 3
+    assert "key_3" not in index
+    assert "key_9" not in index
+    assert [k.id for k in index.by_owner("one")] == ["key_2", "key_4"]
+    assert [k.id for k in index.expiring_between(0, 1000)] == []
+    assert [k.id for k in index.expiring_between(1000, 3000)] == ["key_2", "key_1"]
+
+
+async def test_attach(index: KeyIndex) -> None:
+    client = mock.Mock()
+    index.attach(client)
+    client.keys.add_write_listener.assert_called_once_with(index.apply_write)
+
+    index.detach(client)
+    client.keys.remove_write_listener.assert_called_once_with(index.apply_write)
+
+
+async def test_save_and_load(index: KeyIndex, tmp_path: Path) -> None:
+    path = str(tmp_path / "index.db")
+    index._path = path
+    index.save()
+
+    loaded = KeyIndex(path=path)
+    loaded.load()
+
+    assert len(loaded) == 4
+    assert loaded.watermark("api_2") == 300
+    assert [k.id for k in loaded.by_owner("one")] == ["key_1", "key_2", "key_4"]
+
+
+async def test_models_do_not_share_meta(index: KeyIndex) -> None:
+    client = make_raw_client({"keys": [make_key("key_5", "api_3", meta={"plan": "pro"})]})
+    await index.sync(client, ["api_3"])
+
+    key = index.get("key_5")
+    assert key is not None and key.meta is not None
+    key.meta["plan"] = "free"
+
+    assert index.by_api("api_3")[0].meta == {"plan": "pro"}
+
+
+async def test_range_queries_follow_writes(index: KeyIndex) -> None:
+    assert [k.id for k in index.expiring_between(0, 1000)] == ["key_1"]
+
+    index.apply_write("key_3", {"expires": 200})
+    index.apply_write("key_1", None)
+
+    assert [k.id for k in index.expiring_between(0, 1000)] == ["key_3"]
+    assert [k.id for k in index.created_between(0, 50)] == []
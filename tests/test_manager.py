@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from unkey import ClientManager
+from unkey import MemoryTransport
+from unkey import TransportRequest
+from unkey import TransportResponse
+from unkey import constants
+
+KEY = {"id": "key_123", "apiId": "api_123", "workspaceId": "ws_123", "start": "sk", "createdAt": 1}
+
+
+class CountingTransport(MemoryTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.starts = 0
+        self.closes = 0
+        self.sent: t.List[TransportRequest] = []
+
+    async def start(self) -> None:
+        self.starts += 1
+
+    async def close(self) -> None:
+        self.closes += 1
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        self.sent.append(request)
+        return await super().send(request)
+
+
+@pytest.fixture()
+def transport() -> CountingTransport:
+    transport = CountingTransport()
+    transport.add_json_route(constants.GET, "/v1/keys.getKey", KEY)
+    return transport
+
+
+async def test_clients_share_transport(transport: CountingTransport) -> None:
+    async with ClientManager(transport=transport) as manager:
+        first = await manager.client("ws_1", "root_1")
+        second = await manager.client("ws_2", "root_2")
+
+        assert await manager.client("ws_1", "root_1") is first
+        assert (await first.keys.get_key("key_123")).is_ok
+        assert (await second.keys.get_key("key_123")).is_ok
+        assert len(manager) == 2
+
+    assert [r.headers["Authorization"] for r in transport.sent] == [
+        "Bearer root_1",
+        "Bearer root_2",
+    ]
+    # Closing the tenant clients leaves the shared transport alone.
+    assert (transport.starts, transport.closes) == (1, 1)
+    assert len(manager) == 0
+
+
+async def test_least_recently_used_is_evicted(transport: CountingTransport) -> None:
+    manager = ClientManager(transport=transport, max_clients=2)
+    await manager.client("ws_1", "root_1")
+    await manager.client("ws_2", "root_2")
+    await manager.client("ws_1", "root_1")
+    await manager.client("ws_3", "root_3")
+
+    assert "ws_1" in manager
+    assert "ws_2" not in manager
+    assert "ws_3" in manager
+
+
+async def test_evicted_client_is_usable(transport: CountingTransport) -> None:
+    manager = ClientManager(transport=transport, max_clients=1)
+    first = await manager.client("ws_1", "root_1")
+    await manager.client("ws_2", "root_2")
+
+    assert "ws_1" not in manager
+    assert (await first.keys.get_key("key_123")).is_ok
+    assert transport.sent[-1].headers["Authorization"] == "Bearer root_1"
+
+    stats = manager.stats("ws_1")
+    assert stats is not None and stats.requests == 1
+
+
+async def test_stats_are_bounded(transport: CountingTransport) -> None:
+    manager = ClientManager(transport=transport, max_clients=1, max_stats=2)
+    await manager.client("ws_1", "root_1")
+    await manager.client("ws_2", "root_2")
+    await manager.client("ws_1", "root_1")
+    await manager.client("ws_3", "root_3")
+
+    assert list(manager.all_stats()) == ["ws_1", "ws_3"]
+    assert manager.stats("ws_2") is None
+
+
+async def test_changed_key_replaces_client(transport: CountingTransport) -> None:
+    manager = ClientManager(transport=transport)
+    first = await manager.client("ws_1", "root_1")
+
+    assert await manager.client("ws_1", "root_2") is not first
+    assert len(manager) == 1
+
+
+async def test_tenant_stats(transport: CountingTransport) -> None:
+    manager = ClientManager(transport=transport)
+    client = await manager.client("ws_1", "root_1")
+    await client.keys.get_key("key_123")
+    await client.apis.get_api("api_123")
+    manager.evict("ws_1")
+
+    stats = manager.stats("ws_1")
+    assert stats is not None
+    assert (stats.requests, stats.errors) == (2, 1)
+    assert stats.average_time == stats.total_time / 2
+    assert stats.last_used > 0
+    assert manager.all_stats() == {"ws_1": stats}
+    assert manager.stats("ws_2") is None
+
+
+async def test_tenant_stats_count_exceptions() -> None:
+    async def handler(request: TransportRequest) -> TransportResponse:
+        raise OSError
+
+    manager = ClientManager(transport=MemoryTransport(handler))
+    client = await manager.client("ws_1", "root_1")
+
+    with pytest.raises(OSError):
+        await client.keys.get_key("key_123")
+
+    assert manager.stats("ws_1") == manager.all_stats()["ws_1"]
+    assert manager.all_stats()["ws_1"].errors == 1
+
+
+def test_invalid_max_clients() -> None:
+    with pytest.raises(ValueError):
+        ClientManager(max_clients=0)
+
+    with pytest.raises(ValueError):
+        ClientManager(max_clients=2, max_stats=1)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+from unittest import mock
+
+import pytest
+
+from unkey import ApiKeyVerification
+from unkey import ErrorCode
+from unkey import HttpResponse
+from unkey import UnkeyMiddleware
+from unkey import result
+
+MessageT = t.MutableMapping[str, t.Any]
+
+
+def make_verification(valid: bool, code: t.Optional[ErrorCode] = None) -> ApiKeyVerification:
+    verification = ApiKeyVerification()
+    verification.valid = valid
+    verification.code = code
+    verification.error = None if valid else "Nope"
+    return verification
+
+
+@pytest.fixture()
+def client() -> mock.MagicMock:
+    client = mock.MagicMock()
+    client.start = mock.AsyncMock()
+    client.close = mock.AsyncMock()
+    client.keys.verify_key = mock.AsyncMock(return_value=result.Ok(make_verification(True)))
+    return client
+
+
+@pytest.fixture()
+def app() -> mock.AsyncMock:
+    return mock.AsyncMock()
+
+
+def http_scope(*headers: t.Tuple[bytes, bytes], path: str = "/") -> MessageT:
+    return {"type": "http", "path": path, "headers": list(headers)}
+
+
+async def run(
+    middleware: UnkeyMiddleware, scope: MessageT
+) -> t.Tuple[t.List[MessageT], mock.AsyncMock]:
+    sent: t.List[MessageT] = []
+
+    async def send(message: MessageT) -> None:
+        sent.append(message)
+
+    receive = mock.AsyncMock()
+    await middleware(scope, receive, send)
+    return sent, receive
+
+
+async def test_valid_key_reaches_app(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+    scope = http_scope((b"host", b"x"), (b"authorization", b"Bearer key_abc"))
+
+    sent, _ = await run(middleware, scope)
+
+    assert not sent
+    client.start.assert_awaited_once()
+    client.keys.verify_key.assert_awaited_once_with("key_abc", "api_123")
+    assert scope["state"]["unkey_verification"].valid
+    app.assert_awaited_once()
+
+
+async def test_concurrent_first_requests_wait_for_start(
+    app: mock.AsyncMock, client: mock.MagicMock
+) -> None:
+    started = False
+
+    async def start() -> None:
+        nonlocal started
+        await asyncio.sleep(0.01)
+        started = True
+
+    async def verify_key(*_: t.Any) -> t.Any:
+        assert started, "client used before it started"
+        return result.Ok(make_verification(True))
+
+    client.start = mock.AsyncMock(side_effect=start)
+    client.keys.verify_key = mock.AsyncMock(side_effect=verify_key)
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+    scope = http_scope((b"authorization", b"Bearer key_abc"))
+
+    await asyncio.gather(*(run(middleware, dict(scope)) for _ in range(3)))
+
+    client.start.assert_awaited_once()
+    assert app.await_count == 3
+
+
+async def test_failed_start_is_retried(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    client.start = mock.AsyncMock(side_effect=[RuntimeError("boom"), None])
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+    scope = http_scope((b"authorization", b"Bearer key_abc"))
+
+    with pytest.raises(RuntimeError):
+        await run(middleware, dict(scope))
+
+    await run(middleware, dict(scope))
+    assert client.start.await_count == 2
+    app.assert_awaited_once()
+
+
+async def test_missing_key_is_rejected(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+
+    sent, _ = await run(middleware, http_scope((b"authorization", b"Bearer ")))
+
+    assert sent[0]["status"] == 401
+    assert json.loads(sent[1]["body"]) == {"code": None, "message": "Failed to extract API key"}
+    client.keys.verify_key.assert_not_awaited()
+    app.assert_not_awaited()
+
+
+async def test_invalid_key_is_rejected(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    verification = make_verification(False, ErrorCode.Ratelimited)
+    client.keys.verify_key.return_value = result.Ok(verification)
+    middleware = UnkeyMiddleware(app, "api_123", client=client, header="x-api-key")
+
+    sent, _ = await run(middleware, http_scope((b"x-api-key", b"key_abc")))
+
+    assert sent[0]["status"] == 429
+    assert json.loads(sent[1]["body"]) == {"code": "RATELIMITED", "message": "Nope"}
+    app.assert_not_awaited()
+
+
+async def test_error_is_rejected(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    client.keys.verify_key.return_value = result.Err(HttpResponse(500, "Broken"))
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+
+    sent, _ = await run(middleware, http_scope((b"authorization", b"key_abc")))
+
+    assert sent[0]["status"] == 500
+    assert json.loads(sent[1]["body"]) == {"code": "UNKNOWN", "message": "Broken"}
+
+
+async def test_websocket_is_closed(app: mock.AsyncMock, client: mock.MagicMock) -> None:
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+    scope = http_scope()
+    scope["type"] = "websocket"
+
+    sent, _ = await run(middleware, scope)
+
+    assert sent == [{"type": "websocket.close", "code": 1008}]
+
+
+async def test_excluded_path_skips_verification(
+    app: mock.AsyncMock, client: mock.MagicMock
+) -> None:
+    middleware = UnkeyMiddleware(app, "api_123", client=client, exclude_paths=["/health"])
+
+    await run(middleware, http_scope(path="/health"))
+
+    client.keys.verify_key.assert_not_awaited()
+    app.assert_awaited_once()
+
+
+async def test_lifespan_manages_client(client: mock.MagicMock) -> None:
+    async def app(scope: MessageT, receive: t.Any, send: t.Any) -> None:
+        assert (await receive())["type"] == "lifespan.startup"
+        client.start.assert_awaited_once()
+        await send({"type": "lifespan.startup.complete"})
+
+        assert (await receive())["type"] == "lifespan.shutdown"
+        client.close.assert_not_awaited()
+        await send({"type": "lifespan.shutdown.complete"})
+
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    receive = mock.AsyncMock(side_effect=messages)
+    send = mock.AsyncMock()
+
+    with mock.patch("unkey.middleware.client_.Client", return_value=client):
+        middleware = UnkeyMiddleware(app, "api_123")
+        await middleware({"type": "lifespan"}, receive, send)
+
+    client.close.assert_awaited_once()
+    assert send.await_count == 2
+
+
+async def test_lifespan_does_not_close_provided_client(client: mock.MagicMock) -> None:
+    async def app(scope: MessageT, receive: t.Any, send: t.Any) -> None:
+        await receive()
+        await send({"type": "lifespan.shutdown.complete"})
+
+    receive = mock.AsyncMock(return_value={"type": "lifespan.startup"})
+    middleware = UnkeyMiddleware(app, "api_123", client=client)
+    await middleware({"type": "lifespan"}, receive, mock.AsyncMock())
+
+    client.start.assert_awaited_once()
+    client.close.assert_not_awaited()
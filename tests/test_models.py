@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import json
+
+import attrs
+
 from unkey import BaseModel
+from unkey import ErrorCode
 from unkey import Ratelimit
 from unkey import RatelimitType
+from unkey import RefillInterval
+from unkey import Serializer
+
+serializer = Serializer()
 
 
 def test_base_to_dict() -> None:
@@ -27,3 +36,64 @@ def test_ratelimit() -> None:
         "refill_interval": 1000,
         "type": RatelimitType.Fast,
     }
+
+
+def test_to_dict_matches_asdict() -> None:
+    data = {
+        "total": 1,
+        "cursor": None,
+        "keys": [
+            {
+                "id": "key_123",
+                "apiId": "api_123",
+                "workspaceId": "ws_123",
+                "start": "sk_abc",
+                "createdAt": 100,
+                "meta": {"nested": [{"a": 1}], "tuple": (1, 2)},
+                "ratelimit": {"type": "fast", "limit": 1, "refillRate": 2, "refillInterval": 3},
+                "refill": {"amount": 5, "interval": "daily"},
+            }
+        ],
+    }
+
+    for model in (
+        serializer.to_api_key_list(data),
+        Serializer(lazy=True).to_api_key_list(data),
+        serializer.to_api_key_meta(data["keys"][0]),
+    ):
+        result = model.to_dict()
+        assert result == attrs.asdict(model)
+
+    meta = data["keys"][0]["meta"]
+    assert result["meta"] == {"nested": [{"a": 1}], "tuple": (1, 2)}
+    assert result["meta"] is not meta
+    assert result["meta"]["nested"][0] is not meta["nested"][0]
+    assert result["refill"]["interval"] is RefillInterval.Daily
+
+
+def test_verification_to_dict() -> None:
+    model = serializer.to_api_key_verification(
+        {
+            "valid": False,
+            "code": "NOT_FOUND",
+            "ratelimit": {"limit": 1, "remaining": 0, "reset": 5},
+        }
+    )
+
+    assert model.to_dict() == attrs.asdict(
+        model, value_serializer=lambda _, __, v: str(v) if isinstance(v, ErrorCode) else v
+    )
+    assert model.to_dict()["code"] == "NOT_FOUND"
+    assert model.to_dict()["ratelimit"] == {"limit": 1, "remaining": 0, "reset": 5}
+
+
+def test_to_json_bytes() -> None:
+    model = Ratelimit(RatelimitType.Fast, limit=10, refill_rate=9, refill_interval=1000)
+
+    assert json.loads(model.to_json_bytes()) == {
+        "type": "fast",
+        "limit": 10,
+        "refill_rate": 9,
+        "refill_interval": 1000,
+    }
+    assert model.to_json_bytes().startswith(b'{"type":"fast",')
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from unkey import KeyPrefilter
+
+
+@pytest.fixture()
+def prefilter() -> KeyPrefilter:
+    return KeyPrefilter(prefixes=["sk_", "pk_"], min_length=8, max_length=32)
+
+
+def test_init_fails_with_bad_lengths() -> None:
+    with pytest.raises(ValueError) as e:
+        KeyPrefilter(min_length=10, max_length=5)
+
+    assert e.exconly() == "ValueError: Prefilter min_length must not exceed max_length."
+
+
+def test_well_formed_keys(prefilter: KeyPrefilter) -> None:
+    assert prefilter.is_well_formed("sk_3ZbHkzYhxB4o")
+    assert prefilter.is_well_formed("pk_3ZbHkzYhxB4o")
+    assert not prefilter.is_well_formed("xx_3ZbHkzYhxB4o")
+    assert not prefilter.is_well_formed("sk_3Z")
+    assert not prefilter.is_well_formed("sk_" + "a" * 30)
+    assert not prefilter.is_well_formed("sk_3ZbHk' OR 1=1")
+    assert not prefilter.is_well_formed("")
+
+
+def test_default_allows_any_prefix() -> None:
+    prefilter = KeyPrefilter()
+
+    assert prefilter.is_well_formed("anything_at_all123")
+    assert not prefilter.is_well_formed("spaces are bad")
+    assert not prefilter.is_well_formed("")
+
+
+def test_rejects_remembered_keys(prefilter: KeyPrefilter) -> None:
+    key = "sk_3ZbHkzYhxB4o"
+    assert not prefilter.rejects(key, "api")
+
+    prefilter.remember_not_found(key, "api")
+
+    assert prefilter.rejects(key, "api")
+    assert not prefilter.rejects(key, "other_api")
+
+    prefilter.clear()
+    assert not prefilter.rejects(key, "api")
+
+
+def test_remembered_keys_expire() -> None:
+    prefilter = KeyPrefilter(negative_ttl=10)
+
+    with mock.patch("unkey.prefilter.time.time", return_value=1000.0):
+        prefilter.remember_not_found("sk_abc", "api")
+        assert prefilter.rejects("sk_abc", "api")
+
+    with mock.patch("unkey.prefilter.time.time", return_value=1010.0):
+        assert not prefilter.rejects("sk_abc", "api")
+
+
+def test_negative_cache_is_bounded() -> None:
+    prefilter = KeyPrefilter(negative_cache_size=2)
+
+    for key in ("one", "two", "three"):
+        prefilter.remember_not_found(key, "api")
+
+    assert not prefilter.rejects("one", "api")
+    assert prefilter.rejects("two", "api")
+    assert prefilter.rejects("three", "api")
+
+
+def test_negative_cache_can_be_disabled() -> None:
+    prefilter = KeyPrefilter(negative_cache_size=0)
+    prefilter.remember_not_found("one", "api")
+
+    assert not prefilter.rejects("one", "api")
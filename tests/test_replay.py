@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from unkey import Client
+from unkey import MemoryTransport
+from unkey import TrafficReplayer
+from unkey import TransportRequest
+from unkey import TransportResponse
+from unkey import constants
+
+
+def make_exchange(at: float, method: str, path: str, **kwargs: t.Any) -> t.Dict[str, t.Any]:
+    return {
+        "at": at,
+        "elapsed": 0.01,
+        "method": method,
+        "path": path,
+        "params": kwargs.get("params", {}),
+        "payload": kwargs.get("payload"),
+        "status": 200,
+        "contentType": "application/json",
+        "body": "{}",
+    }
+
+
+EXCHANGES = [
+    make_exchange(0, "POST", "/v1/keys.verifyKey", payload={"key": "sk_1", "apiId": "api_1"}),
+    make_exchange(0.01, "GET", "/v1/keys.getKey", params={"keyId": "key_1"}),
+    make_exchange(0.02, "POST", "/v1/keys.verifyKey", payload={"key": "sk_2"}),
+    make_exchange(0.03, "GET", "/v1/apis.getApi", params={"apiId": "api_1"}),
+]
+
+
+@pytest.fixture()
+async def client() -> t.AsyncIterator[t.Tuple[Client, MemoryTransport]]:
+    memory = MemoryTransport()
+    memory.add_json_route(constants.POST, "/v1/keys.verifyKey", {"valid": True})
+    memory.add_json_route(
+        constants.GET,
+        "/v1/keys.getKey",
+        {"id": "key_1", "apiId": "api_1", "workspaceId": "ws_1", "start": "sk", "createdAt": 1},
+    )
+
+    async with Client("abc123", transport=memory) as client:
+        yield client, memory
+
+
+async def test_replay(client: t.Tuple[Client, MemoryTransport]) -> None:
+    stats = await TrafficReplayer(client[0], speed=None).replay(EXCHANGES)
+
+    assert stats.requests == stats.recorded_requests == 4
+    assert len(stats.latencies) == 4
+    assert stats.latencies == sorted(stats.latencies)
+    assert stats.recorded_duration == pytest.approx(0.04)
+    assert stats.recorded_throughput == pytest.approx(100)
+    assert stats.percentile(99, recorded=True) == 0.01
+    # getApi has no route, so the memory transport answers with a 404.
+    assert stats.errors == {"NOT_FOUND": 1}
+
+
+async def test_replay_uses_services(client: t.Tuple[Client, MemoryTransport]) -> None:
+    unkey, memory = client
+    sent: t.List[TransportRequest] = []
+
+    def handler(request: TransportRequest) -> TransportResponse:
+        sent.append(request)
+        return memory.json_response(200, {"valid": True})
+
+    memory.add_route(constants.POST, "/v1/keys.verifyKey", handler)
+
+    await TrafficReplayer(unkey, speed=None).replay(EXCHANGES[:1] + EXCHANGES[2:3])
+
+    # The first is replayed through KeyService.verify_key, the second
+    # is missing its api id, so it is sent as recorded.
+    assert sent[0].body == b'{"key":"sk_1","apiId":"api_1"}'
+    assert sent[1].body == b'{"key":"sk_2"}'
+
+
+async def test_replay_skips_writes(client: t.Tuple[Client, MemoryTransport]) -> None:
+    unkey, memory = client
+    sent: t.List[str] = []
+
+    def handler(request: TransportRequest) -> TransportResponse:
+        sent.append(request.url)
+        return memory.json_response(200, {})
+
+    memory.add_route(constants.POST, "/v1/keys.createKey", handler)
+    memory.add_route(constants.POST, "/v1/keys.deleteKey", handler)
+    writes = [
+        make_exchange(0.04, "POST", "/v1/keys.createKey", payload={"apiId": "api_1"}),
+        make_exchange(0.05, "POST", "/v1/keys.deleteKey", payload={"keyId": "key_1"}),
+    ]
+
+    stats = await TrafficReplayer(unkey, speed=None).replay(EXCHANGES + writes)
+
+    assert sent == []
+    assert (stats.requests, stats.recorded_requests, stats.skipped) == (4, 6, 2)
+    assert len(stats.latencies) == 4
+
+    stats = await TrafficReplayer(unkey, speed=None, include_writes=True).replay(writes)
+
+    assert len(sent) == 2
+    assert (stats.requests, stats.skipped) == (2, 0)
+
+
+async def test_replay_keeps_recorded_timings(client: t.Tuple[Client, MemoryTransport]) -> None:
+    stats = await TrafficReplayer(client[0], speed=2, concurrency=1).replay(EXCHANGES)
+
+    assert stats.duration >= 0.015
+    assert stats.throughput == pytest.approx(stats.requests / stats.duration)
+
+
+async def test_replay_nothing(client: t.Tuple[Client, MemoryTransport]) -> None:
+    stats = await TrafficReplayer(client[0]).replay([])
+
+    assert stats.requests == 0
+    assert stats.throughput == 0
+    assert stats.percentile(99) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"speed": 0}, {"concurrency": 0}])
+def test_invalid_options(kwargs: t.Dict[str, t.Any]) -> None:
+    with pytest.raises(ValueError):
+        TrafficReplayer(Client(), **kwargs)
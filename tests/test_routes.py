@@ -21,6 +21,13 @@ def test_route_instantiation(mock_route: Route) -> None:
     assert mock_route.uri == "/69420"
 
 
+def test_route_has_no_params(mock_route: Route) -> None:
+    assert not mock_route.params
+
+    with pytest.raises(TypeError):
+        mock_route.params["a"] = 1  # type: ignore
+
+
 def test_route_compiles(mock_route: Route) -> None:
     compiled = mock_route.compile()
     assert isinstance(compiled, CompiledRoute)
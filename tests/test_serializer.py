@@ -441,3 +441,114 @@ def test_to_api_key_list(
     result = serializer.to_api_key_list(raw_api_key_list)
 
     assert result == full_api_key_list
+
+
+def test_to_api_key_list_lazy() -> None:
+    lazy = Serializer(lazy=True)
+    ratelimit = {"type": "fast", "limit": 10, "refillRate": 1, "refillInterval": 1000}
+    data = {
+        "total": 2,
+        "cursor": None,
+        "keys": [
+            {"id": "key_1", "ownerId": "jonxslays", "createdAt": 1, "ratelimit": ratelimit},
+            {"id": "key_2", "ownerId": None, "createdAt": 2},
+        ],
+    }
+
+    expected = serializer.to_ratelimit(ratelimit)
+
+    with mock.patch.object(Serializer, "to_ratelimit", wraps=lazy.to_ratelimit) as to_ratelimit:
+        result = lazy.to_api_key_list(data)
+        first, second = result.keys
+
+        assert lazy.lazy
+        assert isinstance(first, models.ApiKeyMeta)
+        assert isinstance(first, models.LazyApiKeyMeta)
+        assert [k.id for k in result.keys] == ["key_1", "key_2"]
+        assert first.owner_id == "jonxslays"
+        to_ratelimit.assert_not_called()
+
+        assert first.ratelimit == first.ratelimit == expected
+        assert second.ratelimit is None
+        to_ratelimit.assert_called_once()
+
+    assert first.to_dict() == serializer.to_api_key_meta(data["keys"][0]).to_dict()
+
+
+def make_listed_key(id: str, owner_id: t.Optional[str]) -> DictT:
+    # Build the strings at runtime, like the JSON decoder does.
+    return {
+        "id": id,
+        "apiId": "".join(("api_", "123")),
+        "workspaceId": "".join(("ws_", "123")),
+        "start": "sk_abc",
+        "ownerId": owner_id and "".join(("owner_", owner_id)),
+        "createdAt": 1,
+        "refill": {"amount": 1, "interval": "daily"},
+    }
+
+
+def test_to_api_key_list_interned() -> None:
+    interning = Serializer(intern=True)
+    data = {"total": 3, "keys": [make_listed_key(str(i), "one") for i in range(3)]}
+
+    first, *rest = interning.to_api_key_list(data).keys
+
+    assert interning.intern
+    assert not serializer.intern
+    assert all(k.api_id is first.api_id for k in rest)
+    assert all(k.workspace_id is first.workspace_id for k in rest)
+    assert all(k.owner_id is first.owner_id for k in rest)
+    assert first.to_dict() == serializer.to_api_key_meta(data["keys"][0]).to_dict()
+
+
+def test_to_api_key_list_interned_maxsize() -> None:
+    interning = Serializer(intern=True, intern_maxsize=2)
+    data = {"total": 2, "keys": [make_listed_key(str(i), None) for i in range(2)]}
+
+    first, second = interning.to_api_key_list(data).keys
+
+    assert first.api_id is second.api_id
+    assert first.owner_id is None
+    # The table is full, so new owners are not interned.
+    assert interning._intern("".join(("owner", "_1"))) is not interning._intern("owner_1")
+
+
+def test_to_api_key_list_compact() -> None:
+    compact = Serializer(compact=True, intern=True)
+    data = {"total": 2, "keys": [make_listed_key(str(i), "one") for i in range(2)]}
+
+    first, second = compact.to_api_key_list(data).keys
+
+    assert compact.compact
+    assert isinstance(first, models.CompactApiKeyMeta)
+    assert isinstance(first, models.ApiKeyMeta)
+    assert first.owner_id is second.owner_id
+    assert first.to_dict() == serializer.to_api_key_meta(data["keys"][0]).to_dict()
+
+    with pytest.raises(AttributeError):
+        first.remaining = 10  # type: ignore[misc]
+
+
+def test_to_api_key_list_compact_partial_keys() -> None:
+    compact = Serializer(compact=True)
+    data = {"total": 1, "keys": [{"id": "key_123", "apiId": "api_123"}]}
+
+    (key,) = compact.to_api_key_list(data).keys
+
+    assert key.to_dict() == serializer.to_api_key_meta(data["keys"][0]).to_dict()
+    assert key.workspace_id is None and key.created_at is None
+
+
+def test_lazy_and_compact() -> None:
+    with pytest.raises(ValueError):
+        Serializer(lazy=True, compact=True)
+
+
+def test_lazy_model_unknown_attribute() -> None:
+    model = Serializer(lazy=True).to_api_key_list({"total": 1, "keys": [{}]}).keys[0]
+
+    with pytest.raises(AttributeError) as e:
+        model.fake  # type: ignore
+
+    assert e.exconly() == "AttributeError: 'LazyApiKeyMeta' object has no attribute 'fake'"
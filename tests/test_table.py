@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from tests.utils import make_key
+from tests.utils import make_page
+from unkey import ApiKeyTable
+from unkey import ApiService
+from unkey import HttpResponse
+from unkey import Serializer
+
+serializer = Serializer()
+
+
+@pytest.fixture()
+def table() -> ApiKeyTable:
+    return serializer.to_api_key_table(
+        make_page(
+            make_key("key_1", ownerId="one", expires=500, remaining=3),
+            make_key("key_2", expires=1500),
+            make_key("key_3", ownerId="three", remaining=10, createdAt=50),
+        )
+    )
+
+
+def test_to_api_key_table(table: ApiKeyTable) -> None:
+    assert len(table) == 3
+    assert repr(table) == "ApiKeyTable(rows=3)"
+    assert table.id == ["key_1", "key_2", "key_3"]
+    assert table.owner_id == ["one", None, "three"]
+    assert list(table.expires) == [500, 1500, -1]
+    assert list(table.remaining) == [3, -1, 10]
+
+
+def test_to_api_key_table_appends(table: ApiKeyTable) -> None:
+    serializer.to_api_key_table(make_page(make_key("key_4")), table)
+
+    assert len(table) == 4
+    assert table.id[-1] == "key_4"
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_filters(table: ApiKeyTable, numpy: bool) -> None:
+    np = pytest.importorskip("numpy") if numpy else None
+
+    with mock.patch("unkey.models.table._optional_import", return_value=np):
+        assert table.expires_before(1000).id == ["key_1"]
+        assert table.expires_before(2000).id == ["key_1", "key_2"]
+        assert table.remaining_below(5).id == ["key_1"]
+        assert table.created_before(100).id == ["key_3"]
+        assert list(table.remaining_below(100).remaining) == [3, 10]
+
+
+def test_to_numpy(table: ApiKeyTable) -> None:
+    np = pytest.importorskip("numpy")
+    columns = table.to_numpy()
+
+    assert columns["expires"].dtype == np.int64
+    assert columns["expires"].tolist() == [500, 1500, -1]
+    assert columns["id"].tolist() == ["key_1", "key_2", "key_3"]
+
+
+def test_optional_dependencies_missing(table: ApiKeyTable) -> None:
+    with mock.patch("unkey.models.table._optional_import", return_value=None):
+        with pytest.raises(RuntimeError):
+            table.to_numpy()
+
+        with pytest.raises(RuntimeError):
+            table.to_arrow()
+
+
+async def test_list_keys_table_walks_pages() -> None:
+    http = mock.AsyncMock()
+    http.fetch.side_effect = [
+        make_page(make_key("key_1"), make_key("key_2"), cursor="key_2"),
+        make_page(make_key("key_3"), cursor="key_3"),
+        make_page(cursor=None),
+    ]
+
+    result = await ApiService(http, serializer).list_keys_table("api_123", limit=2)
+
+    assert result.unwrap().id == ["key_1", "key_2", "key_3"]
+    assert http.fetch.await_count == 3
+    assert http.fetch.await_args_list[1].args[0].params["cursor"] == "key_2"
+
+
+async def test_list_keys_table_error() -> None:
+    http = mock.AsyncMock()
+    http.fetch.return_value = HttpResponse(500, "Oops")
+
+    result = await ApiService(http, serializer).list_keys_table("api_123")
+
+    assert result.is_err
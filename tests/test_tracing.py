@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+
+import pytest
+
+from unkey import AiohttpTransport
+from unkey import Client
+from unkey import ErrorCode
+from unkey import HttpService
+from unkey import MemoryTransport
+from unkey import RequestTrace
+from unkey import SlowRequestLogger
+from unkey import TransportRequest
+from unkey import TransportResponse
+from unkey import TransportTimings
+from unkey import constants
+from unkey import routes
+
+KEY = {"id": "key_123", "apiId": "api_123", "workspaceId": "ws_123", "start": "sk", "createdAt": 1}
+
+
+def records(caplog: pytest.LogCaptureFixture) -> t.List[t.Dict[str, t.Any]]:
+    return [r.unkey_request for r in caplog.records if r.name == "unkey.slow_requests"]
+
+
+async def make_client(logger: SlowRequestLogger) -> Client:
+    transport = MemoryTransport()
+    transport.add_json_route(constants.GET, "/v1/keys.getKey", KEY)
+    transport.add_route(
+        constants.GET,
+        "/v1/apis.getApi",
+        MemoryTransport.json_response(404, {"error": {"code": "NOT_FOUND", "message": "No"}}),
+    )
+
+    client = Client("abc", transport=transport, slow_request_log=logger)
+    await client.start()
+    return client
+
+
+async def test_slow_request_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    client = await make_client(SlowRequestLogger(threshold=0))
+
+    with caplog.at_level(logging.WARNING, "unkey.slow_requests"):
+        assert (await client.keys.get_key("key_123")).is_ok
+        await asyncio.sleep(0)
+
+    await client.close()
+    (record,) = records(caplog)
+
+    assert record["method"] == "GET"
+    assert record["path"] == "/v1/keys.getKey"
+    assert record["status"] == 200
+    assert record["code"] is None
+    assert record["deserializing"] is not None
+    # The memory transport does not measure the phases of a request.
+    assert record["queued"] is None and record["reused"] is None
+
+
+async def test_error_code_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    client = await make_client(SlowRequestLogger(threshold=0))
+
+    with caplog.at_level(logging.WARNING, "unkey.slow_requests"):
+        assert (await client.apis.get_api("api_123")).is_err
+        await asyncio.sleep(0)
+
+    await client.close()
+    (record,) = records(caplog)
+
+    assert record["status"] == 404
+    assert record["code"] == "NOT_FOUND"
+    assert record["deserializing"] is None
+
+
+async def test_fast_requests_are_sampled(caplog: pytest.LogCaptureFixture) -> None:
+    unsampled = await make_client(SlowRequestLogger(threshold=60))
+    sampled = await make_client(SlowRequestLogger(threshold=None, sample_rate=1))
+
+    with caplog.at_level(logging.WARNING, "unkey.slow_requests"):
+        assert (await unsampled.keys.get_key("key_123")).is_ok
+        await asyncio.sleep(0)
+        assert records(caplog) == []
+
+        assert (await sampled.keys.get_key("key_123")).is_ok
+        await asyncio.sleep(0)
+
+    await unsampled.close()
+    await sampled.close()
+    assert caplog.records[-1].getMessage().startswith("Sampled request: GET /v1/keys.getKey")
+
+
+def test_trace_to_dict() -> None:
+    trace = RequestTrace(
+        "POST",
+        "/v1/keys.verifyKey",
+        429,
+        0.5,
+        0.001,
+        code=ErrorCode.Ratelimited,
+        reused=True,
+        waiting=0.25,
+        deserializing=0.002,
+    )
+
+    assert trace.total == pytest.approx(0.503)
+    data = trace.to_dict()
+    assert data["total"] == 503.0
+    assert data["waiting"] == 250.0
+    assert data["code"] == "RATELIMITED"
+    assert data["connecting"] is None
+
+
+def test_invalid_sample_rate() -> None:
+    with pytest.raises(ValueError):
+        SlowRequestLogger(sample_rate=2)
+
+
+async def test_transport_timings_are_traced(caplog: pytest.LogCaptureFixture) -> None:
+    timings = TransportTimings(queued=0.1, connecting=0.2, waiting=0.3, reading=0.4, reused=False)
+    response = TransportResponse(200, b"{}", {"content-type": "application/json"}, timings)
+    transport = MemoryTransport(lambda _: response)
+    http = HttpService(
+        "abc", None, None, transport=transport, slow_request_log=SlowRequestLogger(threshold=0)
+    )
+    await http.start()
+
+    with caplog.at_level(logging.WARNING, "unkey.slow_requests"):
+        assert await http.fetch(routes.LIVENESS) == {}
+        await asyncio.sleep(0)
+
+    await http.close()
+    (record,) = records(caplog)
+
+    assert record["reused"] is False
+    assert record["queued"] == 100.0
+    assert record["reading"] == 400.0
+
+
+async def test_aiohttp_transport_timings() -> None:
+    from aiohttp import web
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    transport = AiohttpTransport(trace=True)
+    await transport.start()
+    request = TransportRequest(constants.GET, f"http://127.0.0.1:{port}/", {})
+
+    try:
+        first = await transport.send(request)
+        second = await transport.send(request)
+    finally:
+        await transport.close()
+        await runner.cleanup()
+
+    assert first.json() == {"ok": True}
+    assert first.timings is not None and second.timings is not None
+    assert first.timings.reused is False
+    assert first.timings.connecting > 0
+    assert second.timings.reused is True
+    assert second.timings.connecting == 0
+    assert second.timings.waiting > 0
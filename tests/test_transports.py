@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from unkey import HttpResponse
+from unkey import HttpService
+from unkey import MemoryTransport
+from unkey import RecordingTransport
+from unkey import ReplayTransport
+from unkey import TransportRequest
+from unkey import TransportResponse
+from unkey import constants
+from unkey import routes
+
+DIGEST = hashlib.sha256(b"abc").hexdigest()
+
+
+def make_memory() -> MemoryTransport:
+    memory = MemoryTransport()
+    memory.add_json_route(constants.POST, "/v1/keys.verifyKey", {"valid": True})
+    memory.add_json_route(constants.GET, "/v1/keys.getKey", {"id": "key_123"})
+    return memory
+
+
+async def record(path: str, *, redact_keys: bool = True) -> None:
+    transport = RecordingTransport(make_memory(), path, redact_keys=redact_keys)
+    http = HttpService("abc123", None, None, transport=transport)
+    await http.start()
+    await http.fetch(routes.VERIFY_KEY.compile(), payload={"key": "abc", "apiId": "api_1"})
+    await http.fetch(routes.GET_KEY.compile().with_params({"keyId": "key_123"}))
+    await http.close()
+
+
+@pytest.mark.parametrize("name", ["traffic.ndjson", "traffic.ndjson.gz"])
+async def test_recording_transport(tmp_path: Path, name: str) -> None:
+    path = str(tmp_path / name)
+    await record(path)
+
+    verify, get = RecordingTransport.load(path)
+    assert verify["method"] == constants.POST
+    assert verify["path"] == "/v1/keys.verifyKey"
+    assert verify["payload"] == {"key": f"sha256:{DIGEST}", "apiId": "api_1"}
+    assert verify["status"] == 200
+    assert json.loads(verify["body"]) == {"valid": True}
+    assert get["params"] == {"keyId": "key_123"}
+    assert get["at"] >= verify["at"] == 0
+
+
+async def test_recording_times_concurrent_requests(tmp_path: Path) -> None:
+    async def slow(_: TransportRequest) -> TransportResponse:
+        await asyncio.sleep(0.02)
+        return MemoryTransport.json_response(200, {"valid": True})
+
+    memory = make_memory()
+    memory.add_route(constants.POST, "/v1/keys.verifyKey", slow)
+    path = str(tmp_path / "traffic.ndjson")
+    http = HttpService("abc123", None, None, transport=RecordingTransport(memory, path))
+    await http.start()
+
+    verify = http.fetch(routes.VERIFY_KEY.compile(), payload={"key": "abc", "apiId": "api_1"})
+    get = http.fetch(routes.GET_KEY.compile().with_params({"keyId": "key_123"}))
+    await asyncio.gather(verify, get)
+    await http.close()
+
+    first, second = RecordingTransport.load(path)
+    assert first["path"] == "/v1/keys.verifyKey"
+    assert second["at"] >= first["at"] == 0
+
+
+async def test_recording_omits_headers_and_keys(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.ndjson"
+    await record(str(path))
+
+    assert "abc123" not in path.read_text()
+    assert '"abc"' not in path.read_text()
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+async def test_recording_without_redaction(tmp_path: Path) -> None:
+    path = str(tmp_path / "traffic.ndjson")
+    await record(path, redact_keys=False)
+
+    verify, _ = RecordingTransport.load(path)
+    assert verify["payload"] == {"key": "abc", "apiId": "api_1"}
+
+
+async def test_replay_transport(tmp_path: Path) -> None:
+    path = str(tmp_path / "traffic.ndjson")
+    await record(path)
+    http = HttpService("abc123", None, None, transport=ReplayTransport(path, speed=None))
+
+    verify = routes.VERIFY_KEY.compile()
+    assert await http.fetch(verify, payload={"apiId": "api_1", "key": "abc"}) == {"valid": True}
+    # Unrecorded payloads fall back to a response for the same route.
+    assert await http.fetch(verify, payload={"key": "other"}) == {"valid": True}
+    assert await http.fetch(routes.GET_API.compile()) == HttpResponse(
+        404, "No recording for /v1/apis.getApi", code=mock.ANY
+    )
+
+
+async def test_replay_transport_cycles_responses(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.ndjson"
+    lines = [
+        {
+            "at": i,
+            "elapsed": 0.5,
+            "method": "GET",
+            "path": "/v1/x",
+            "params": {},
+            "payload": None,
+            "status": 200,
+            "contentType": None,
+            "body": str(i),
+        }
+        for i in range(2)
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    transport = ReplayTransport(str(path), speed=2)
+    request = TransportRequest("GET", "https://api.unkey.dev/v1/x", {})
+
+    with mock.patch("asyncio.sleep") as sleep:
+        bodies = [(await transport.send(request)).body for _ in range(3)]
+
+    assert bodies == [b"0", b"1", b"0"]
+    sleep.assert_awaited_with(0.25)
+
+
+def test_replay_transport_invalid_speed(tmp_path: Path) -> None:
+    (tmp_path / "traffic.ndjson").write_text("")
+
+    with pytest.raises(ValueError):
+        ReplayTransport(str(tmp_path / "traffic.ndjson"), speed=0)
+
+
+async def test_memory_transport_awaits_handlers() -> None:
+    async def handler(request: TransportRequest) -> TransportResponse:
+        return TransportResponse(201, request.body or b"")
+
+    transport = MemoryTransport(handler)
+    response = await transport.send(TransportRequest("POST", "http://x/y", {}, body=b"hi"))
+    assert (response.status, response.body) == (201, b"hi")
+
+
+def test_transport_response_decoding() -> None:
+    response = TransportResponse(200, b"", {"content-type": "application/json"})
+    assert response.is_json
+    assert response.json() is None
+    assert TransportResponse(200, b"\xff").text() == "�"
+    assert not TransportResponse(200, b"{}").is_json
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+from unkey import Err
+from unkey import HttpResponse
+from unkey import Ok
+
+
+def make_key(id: str, api_id: str = "api_123", **fields: t.Any) -> t.Dict[str, t.Any]:
+    return {
+        "id": id,
+        "apiId": api_id,
+        "workspaceId": "ws_123",
+        "start": "sk_abc",
+        "createdAt": 100,
+        **fields,
+    }
+
+
+def make_page(*keys: t.Dict[str, t.Any], cursor: t.Optional[str] = None) -> t.Dict[str, t.Any]:
+    return {"total": len(keys), "cursor": cursor, "keys": list(keys)}
+
+
+def make_client(*pages: t.Any, method: str = "list_keys") -> mock.Mock:
+    # Each call to the api method returns the next page, or an error for
+    # pages that are http responses.
+    client = mock.Mock()
+    results = [Err(p) if isinstance(p, HttpResponse) else Ok(p) for p in pages]
+    setattr(client.apis, method, mock.AsyncMock(side_effect=results))
+    return client
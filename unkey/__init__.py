@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
 from typing import Final
+from typing import FrozenSet
+from typing import List
 
 __packagename__: Final[str] = "unkey.py"
 __version__: Final[str] = "0.7.2"
@@ -13,68 +19,214 @@ __repository__: Final[str] = __url__
 __license__: Final[str] = "GPL-3.0"
 __git_sha__: Final[str] = "[HEAD]"
 
-from . import client
-from . import decorators
-from . import constants
-from . import errors
-from . import models
-from . import result
-from . import routes
-from . import serializer
-from . import services
-from . import undefined
-from .client import *
-from .decorators import *
-from .errors import *
-from .models import *
-from .result import *
-from .routes import *
-from .serializer import *
-from .services import *
-from .undefined import *
+if TYPE_CHECKING:
+    from . import cache
+    from . import client
+    from . import decorators
+    from . import constants
+    from . import errors
+    from . import export
+    from . import index
+    from . import manager
+    from . import middleware
+    from . import models
+    from . import prefilter
+    from . import replay
+    from . import result
+    from . import routes
+    from . import serializer
+    from . import services
+    from . import tracing
+    from . import transports
+    from . import undefined
+    from .cache import *
+    from .client import *
+    from .decorators import *
+    from .errors import *
+    from .export import *
+    from .index import *
+    from .manager import *
+    from .middleware import *
+    from .models import *
+    from .prefilter import *
+    from .replay import *
+    from .result import *
+    from .routes import *
+    from .serializer import *
+    from .services import *
+    from .tracing import *
+    from .transports import *
+    from .undefined import *
 
 __all__ = (
+    "cache",
     "client",
     "constants",
     "decorators",
     "errors",
+    "export",
+    "index",
+    "manager",
+    "middleware",
     "models",
+    "prefilter",
     "protected",
+    "replay",
     "result",
     "routes",
     "serializer",
     "services",
+    "tracing",
+    "transports",
     "undefined",
+    "AiohttpTransport",
     "Api",
     "ApiKey",
     "ApiKeyList",
     "ApiKeyMeta",
+    "ApiKeyTable",
     "ApiKeyVerification",
     "ApiService",
     "BaseEnum",
     "BaseError",
     "BaseModel",
     "BaseService",
+    "CacheEntry",
     "Client",
+    "ClientManager",
+    "CompactApiKeyMeta",
     "CompiledRoute",
     "Err",
     "ErrorCode",
     "HttpResponse",
     "HttpService",
+    "HttpxTransport",
+    "KeyExporter",
+    "KeyIndex",
+    "KeyPrefilter",
     "KeyService",
+    "LazyApiKeyMeta",
+    "LazyModel",
+    "MemoryTransport",
+    "MemoryVerificationCache",
     "MissingRequiredArgument",
     "Ok",
     "Ratelimit",
     "RatelimitState",
     "RatelimitType",
+    "RecordingTransport",
     "Refill",
     "RefillInterval",
+    "ReplayStats",
+    "ReplayTransport",
+    "RequestTrace",
+    "ResourceCache",
     "Result",
     "Route",
     "Serializer",
+    "SharedVerificationCache",
+    "SlowRequestLogger",
+    "SyncStats",
+    "TenantStats",
+    "TrafficReplayer",
+    "Transport",
+    "TransportRequest",
+    "TransportResponse",
+    "TransportTimings",
     "UndefinedNoneOr",
     "UndefinedOr",
+    "UnkeyMiddleware",
     "UnwrapError",
     "UNDEFINED",
     "UpdateOp",
+    "VerificationCache",
 )
+
+_SUBMODULES: Final[FrozenSet[str]] = frozenset(
+    name for name in __all__ if name[0].islower() and name != "protected"
+)
+
+_EXPORTS: Final[Dict[str, str]] = {
+    "protected": "decorators",
+    "AiohttpTransport": "transports",
+    "Api": "models",
+    "ApiKey": "models",
+    "ApiKeyList": "models",
+    "ApiKeyMeta": "models",
+    "ApiKeyTable": "models",
+    "ApiKeyVerification": "models",
+    "ApiService": "services",
+    "BaseEnum": "models",
+    "BaseError": "errors",
+    "BaseModel": "models",
+    "BaseService": "services",
+    "CacheEntry": "cache",
+    "Client": "client",
+    "ClientManager": "manager",
+    "CompactApiKeyMeta": "models",
+    "CompiledRoute": "routes",
+    "Err": "result",
+    "ErrorCode": "models",
+    "HttpResponse": "models",
+    "HttpService": "services",
+    "HttpxTransport": "transports",
+    "KeyExporter": "export",
+    "KeyIndex": "index",
+    "KeyPrefilter": "prefilter",
+    "KeyService": "services",
+    "LazyApiKeyMeta": "models",
+    "LazyModel": "models",
+    "MemoryTransport": "transports",
+    "MemoryVerificationCache": "cache",
+    "MissingRequiredArgument": "errors",
+    "Ok": "result",
+    "Ratelimit": "models",
+    "RatelimitState": "models",
+    "RatelimitType": "models",
+    "RecordingTransport": "transports",
+    "Refill": "models",
+    "RefillInterval": "models",
+    "ReplayStats": "replay",
+    "ReplayTransport": "transports",
+    "RequestTrace": "tracing",
+    "ResourceCache": "cache",
+    "Result": "result",
+    "Route": "routes",
+    "Serializer": "serializer",
+    "SharedVerificationCache": "cache",
+    "SlowRequestLogger": "tracing",
+    "SyncStats": "index",
+    "TenantStats": "manager",
+    "TrafficReplayer": "replay",
+    "Transport": "transports",
+    "TransportRequest": "transports",
+    "TransportResponse": "transports",
+    "TransportTimings": "transports",
+    "UndefinedNoneOr": "undefined",
+    "UndefinedOr": "undefined",
+    "UnkeyMiddleware": "middleware",
+    "UnwrapError": "errors",
+    "UNDEFINED": "undefined",
+    "UpdateOp": "models",
+    "VerificationCache": "cache",
+}
+"""The submodule each exported name is defined in."""
+
+
+def __getattr__(name: str) -> Any:
+    # Submodules are only imported the first time one of them, or one of
+    # their exports, is accessed. This keeps `import unkey` cheap for code
+    # that only needs a few of them.
+    if name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif (module := _EXPORTS.get(name)) is not None:
+        value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
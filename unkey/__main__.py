@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+import os
 import platform
+import typing as t
 from pathlib import Path
 
 from unkey import __git_sha__
 from unkey import __version__
 
 
-def _main() -> None:
-    """Prints package/system info and exits."""
+def _info() -> None:
+    """Prints package/system info."""
     path = Path(__file__).parent.absolute()
     py_impl = platform.python_implementation()
     py_ver = platform.python_version()
@@ -22,5 +26,126 @@ def _main() -> None:
     print(p.version)
 
 
+async def _export(args: argparse.Namespace) -> None:
+    """Exports the keys for the requested apis."""
+    from unkey import client
+    from unkey import export
+
+    api_key = args.api_key or os.environ.get("UNKEY_ROOT_KEY")
+
+    if not api_key:
+        raise SystemExit("A root key is required, pass --api-key or set UNKEY_ROOT_KEY.")
+
+    unkey = client.Client(api_key, api_base_url=args.base_url)
+    exporter = export.KeyExporter(unkey, page_size=args.page_size, concurrency=args.concurrency)
+    await unkey.start()
+
+    try:
+        counts = await exporter.export_many(
+            args.api_ids, args.output, format=args.format, resume=not args.no_resume
+        )
+    finally:
+        await unkey.close()
+
+    for api_id, count in counts.items():
+        print(f"{api_id}: exported {count} keys")
+
+
+def _speed(value: str) -> t.Optional[float]:
+    """Parses a replay speed, i.e. 1, 2.5x or max."""
+    if value.lower() == "max":
+        return None
+
+    try:
+        speed = float(value.lower().rstrip("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value!r}") from None
+
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be greater than 0")
+
+    return speed
+
+
+async def _replay(args: argparse.Namespace) -> None:
+    """Replays recorded traffic and reports how it performed."""
+    from unkey import client
+    from unkey import replay
+
+    api_key = args.api_key or os.environ.get("UNKEY_ROOT_KEY")
+    unkey = client.Client(api_key, api_base_url=args.base_url)
+    replayer = replay.TrafficReplayer(
+        unkey, speed=args.speed, concurrency=args.concurrency, include_writes=args.include_writes
+    )
+    await unkey.start()
+
+    try:
+        stats = await replayer.replay_file(args.recording)
+    finally:
+        await unkey.close()
+
+    print(f"{'':<12} {'replayed':>12} {'recorded':>12}")
+    print(f"{'requests':<12} {stats.requests:>12} {stats.recorded_requests:>12}")
+    print(f"{'duration':<12} {stats.duration:>11.2f}s {stats.recorded_duration:>11.2f}s")
+    print(f"{'req/s':<12} {stats.throughput:>12.1f} {stats.recorded_throughput:>12.1f}")
+
+    for percent in (50, 95, 99):
+        replayed = stats.percentile(percent) * 1000
+        recorded = stats.percentile(percent, recorded=True) * 1000
+        print(f"{f'p{percent}':<12} {replayed:>10.1f}ms {recorded:>10.1f}ms")
+
+    if stats.skipped:
+        print(f"skipped {stats.skipped} writes, pass --include-writes to replay them")
+
+    for code, count in sorted(stats.errors.items()):
+        print(f"error {code}: {count}")
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="unkeypy", description="Prints package/system info when run without a command."
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    export = commands.add_parser("export", help="Export every key for one or more apis.")
+    export.add_argument("api_ids", nargs="+", metavar="API_ID", help="The apis to export.")
+    export.add_argument("-o", "--output", default=".", help="The directory to write to.")
+    export.add_argument("-f", "--format", default="ndjson", choices=("ndjson", "csv", "parquet"))
+    export.add_argument("--api-key", help="The root key, defaults to $UNKEY_ROOT_KEY.")
+    export.add_argument("--base-url", help="The optional api base url.")
+    export.add_argument("--page-size", type=int, default=100, help="Keys per page.")
+    export.add_argument("--concurrency", type=int, default=4, help="Apis exported at once.")
+    export.add_argument("--no-resume", action="store_true", help="Ignore saved checkpoints.")
+
+    replay = commands.add_parser("replay", help="Replay recorded traffic against an api.")
+    replay.add_argument("recording", help="A recording made with RecordingTransport.")
+    replay.add_argument("--base-url", required=True, help="The api base url to replay against.")
+    replay.add_argument("--api-key", help="The root key, defaults to $UNKEY_ROOT_KEY.")
+    replay.add_argument(
+        "-s", "--speed", type=_speed, default=1.0, help="1, Nx, or max. Defaults to 1."
+    )
+    replay.add_argument("--concurrency", type=int, default=100, help="Requests in flight.")
+    replay.add_argument(
+        "--include-writes",
+        action="store_true",
+        help="Also replay requests that create, update or delete keys.",
+    )
+
+    return parser
+
+
+def _main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    """Runs the unkeypy command line interface."""
+    args = _parser().parse_args(argv)
+
+    if args.command == "export":
+        return asyncio.run(_export(args))
+
+    if args.command == "replay":
+        return asyncio.run(_replay(args))
+
+    _info()
+
+
 if __name__ == "__main__":
     _main()
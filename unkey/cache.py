@@ -0,0 +1,880 @@
+from __future__ import annotations
+
+import abc
+import copy
+import hashlib
+import json
+import math
+import mmap
+import os
+import sqlite3
+import stat
+import struct
+import tempfile
+import time
+import typing as t
+import zlib
+from collections import OrderedDict
+
+import attrs
+
+__all__ = (
+    "CacheEntry",
+    "MemoryVerificationCache",
+    "ResourceCache",
+    "SharedVerificationCache",
+    "VerificationCache",
+)
+
+DictT = t.Dict[str, t.Any]
+
+
+def copy_payload(data: DictT) -> DictT:
+    """Copies a key payload so the model the serializer creates from it
+    can be changed without changing the stored payload.
+
+    Args:
+        data: The payload to copy.
+
+    Returns:
+        The payload with its meta copied, or the same payload if it has
+            no meta.
+    """
+    # The serializer never mutates the payload it is given, and every
+    # nested mapping other than meta is converted into a fresh model.
+    # Only meta ends up shared with the caller, so copy just that.
+    if meta := data.get("meta"):
+        return {**data, "meta": copy.deepcopy(meta)}
+
+    return data
+
+
+def connect(path: str, *tables: str) -> sqlite3.Connection:
+    """Opens a sqlite database in WAL mode, so readers in other
+    processes are not blocked while it is written.
+
+    Args:
+        path: The path of the database.
+
+        *tables: The `name (columns)` definitions of the tables to
+            create if they do not exist.
+
+    Returns:
+        The open connection.
+    """
+    connection = sqlite3.connect(path, timeout=10)
+    connection.execute("PRAGMA journal_mode=WAL")
+
+    for table in tables:
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {table}")
+
+    return connection
+
+
+@attrs.define(weakref_slot=False)
+class CacheEntry:
+    """A cached verification payload."""
+
+    data: DictT
+    """The raw verification payload returned by the api."""
+
+    expires_at: float
+    """The unix timestamp in seconds when this entry expires."""
+
+
+class VerificationCache(abc.ABC):
+    """The base cache all verification caches inherit from.
+
+    Verification caches store the raw payloads returned by the api,
+    keyed by a digest of the api id and key. The raw key is never
+    stored.
+
+    !!! warning
+
+        A cached verification is served without contacting unkey, so
+        it does not consume remaining uses or ratelimit tokens. Keys
+        with `remaining` or a `ratelimit` are not cached unless
+        `cache_limited` is `True`.
+
+    Keyword Args:
+        ttl: The number of seconds a verification remains cached.
+            Defaults to 60.
+
+        cache_limited: Whether or not to cache keys that have a
+            remaining usage count or ratelimit. Defaults to `False`.
+
+        max_stale: The number of seconds past its ttl an entry may still
+            be served while a single background request refreshes it.
+            Never extends past the keys own expiry. Defaults to 0.
+
+        refresh_ahead_hits: The optional number of hits after which an
+            entry is refreshed in the background before it expires.
+            Defaults to `None`, which disables refresh ahead.
+
+        refresh_ahead_at: The fraction of the ttl after which a hot entry
+            becomes eligible for refresh ahead. Defaults to 0.75.
+    """
+
+    __slots__ = (
+        "_cache_limited",
+        "_hits",
+        "_max_stale",
+        "_refresh_ahead_at",
+        "_refresh_ahead_hits",
+        "_ttl",
+    )
+
+    _MAX_TRACKED_HITS = 100_000
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        cache_limited: bool = False,
+        max_stale: float = 0,
+        refresh_ahead_hits: t.Optional[int] = None,
+        refresh_ahead_at: float = 0.75,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("Cache ttl must be greater than 0.")
+
+        if max_stale < 0:
+            raise ValueError("Cache max_stale must not be negative.")
+
+        if not 0 < refresh_ahead_at < 1:
+            raise ValueError("Cache refresh_ahead_at must be between 0 and 1.")
+
+        self._ttl = ttl
+        self._cache_limited = cache_limited
+        self._max_stale = max_stale
+        self._refresh_ahead_hits = refresh_ahead_hits
+        self._refresh_ahead_at = refresh_ahead_at
+        self._hits: t.Dict[bytes, int] = {}
+
+    @property
+    def ttl(self) -> float:
+        """The number of seconds a verification remains cached."""
+        return self._ttl
+
+    @staticmethod
+    def digest(key: str, api_id: str) -> bytes:
+        """Generates the cache key for the given key and api id.
+
+        Args:
+            key: The api key.
+
+            api_id: The id of the api the key belongs to.
+
+        Returns:
+            The sha256 digest of the api id and key.
+        """
+        return hashlib.sha256(f"{api_id}:{key}".encode()).digest()
+
+    def is_cacheable(self, data: DictT) -> bool:
+        """Whether or not the given verification payload can be cached.
+
+        Args:
+            data: The raw verification payload.
+
+        Returns:
+            `True` if the payload should be cached.
+        """
+        if data.get("valid") is not True:
+            return False
+
+        if self._cache_limited:
+            return True
+
+        return data.get("remaining") is None and not data.get("ratelimit")
+
+    def expiry_for(self, data: DictT, now: float) -> float:
+        """Computes when a verification payload should expire.
+
+        Args:
+            data: The raw verification payload.
+
+            now: The current unix timestamp in seconds.
+
+        Returns:
+            The unix timestamp in seconds, never later than the keys
+                own expiry.
+        """
+        expires_at = now + self._ttl
+        expires: t.Optional[int] = data.get("expires")
+
+        if expires:
+            return min(expires_at, expires / 1000)
+
+        return expires_at
+
+    def stale_until(self, entry: CacheEntry) -> float:
+        """Computes when an entry can no longer be served stale.
+
+        Args:
+            entry: The cache entry.
+
+        Returns:
+            The unix timestamp in seconds, never later than the keys
+                own expiry.
+        """
+        stale_until = entry.expires_at + self._max_stale
+        expires: t.Optional[int] = entry.data.get("expires")
+
+        if expires:
+            return min(stale_until, expires / 1000)
+
+        return stale_until
+
+    def get(self, digest: bytes) -> t.Optional[DictT]:
+        """Gets a fresh cached verification payload.
+
+        Args:
+            digest: The digest generated by `digest`.
+
+        Returns:
+            The cached payload, or `None` if it was missing or expired.
+        """
+        entry = self._get(digest)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at > (now := time.time()):
+            return copy_payload(entry.data)
+
+        if now >= self.stale_until(entry):
+            self.delete(digest)
+
+        return None
+
+    def lookup(self, digest: bytes) -> t.Tuple[t.Optional[DictT], bool]:
+        """Gets a cached verification payload, including stale ones,
+        and whether or not it should be refreshed in the background.
+
+        Args:
+            digest: The digest generated by `digest`.
+
+        Returns:
+            The cached payload or `None` if it was missing or too stale,
+                and `True` if the entry is stale or hot enough to be
+                refreshed ahead of its expiry.
+        """
+        entry = self._get(digest)
+
+        if entry is None:
+            return None, False
+
+        now = time.time()
+
+        if entry.expires_at > now:
+            return copy_payload(entry.data), self._should_refresh_ahead(digest, entry, now)
+
+        if now < self.stale_until(entry):
+            return copy_payload(entry.data), True
+
+        self.delete(digest)
+        return None, False
+
+    def _should_refresh_ahead(self, digest: bytes, entry: CacheEntry, now: float) -> bool:
+        if self._refresh_ahead_hits is None:
+            return False
+
+        if len(self._hits) >= self._MAX_TRACKED_HITS:
+            self._hits.clear()
+
+        hits = self._hits[digest] = self._hits.get(digest, 0) + 1
+
+        if hits < self._refresh_ahead_hits:
+            return False
+
+        return entry.expires_at - now <= self._ttl * (1 - self._refresh_ahead_at)
+
+    def store(self, digest: bytes, data: DictT) -> bool:
+        """Stores a verification payload if it is cacheable.
+
+        Args:
+            digest: The digest generated by `digest`.
+
+            data: The raw verification payload.
+
+        Returns:
+            `True` if the payload was stored.
+        """
+        if not self.is_cacheable(data):
+            return False
+
+        now = time.time()
+
+        if (expires_at := self.expiry_for(data, now)) <= now:
+            return False
+
+        self._hits.pop(digest, None)
+        self._set(digest, CacheEntry(copy_payload(data), expires_at))
+        return True
+
+    @abc.abstractmethod
+    def _get(self, digest: bytes) -> t.Optional[CacheEntry]:
+        ...
+
+    @abc.abstractmethod
+    def _set(self, digest: bytes, entry: CacheEntry) -> None:
+        ...
+
+    @abc.abstractmethod
+    def delete(self, digest: bytes) -> None:
+        """Removes a cached verification, if it exists.
+
+        Args:
+            digest: The digest generated by `digest`.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, key_id: str) -> None:
+        """Removes every cached verification for the given key.
+
+        Args:
+            key_id: The id of the key.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all cached verifications."""
+
+    def load(self) -> None:
+        """Loads previously saved verifications, if supported.
+
+        Called by `Client.start`. Does nothing by default.
+        """
+
+    def save(self) -> None:
+        """Saves the cached verifications, if supported.
+
+        Called by `Client.close`. Does nothing by default.
+        """
+
+
+class MemoryVerificationCache(VerificationCache):
+    """An in process, least recently used verification cache.
+
+    Keyword Args:
+        ttl: The number of seconds a verification remains cached.
+            Defaults to 60.
+
+        maxsize: The maximum number of cached verifications.
+            Defaults to 10,000.
+
+        cache_limited: Whether or not to cache keys that have a
+            remaining usage count or ratelimit. Defaults to `False`.
+
+        max_stale: The number of seconds past its ttl an entry may still
+            be served while a single background request refreshes it.
+            Never extends past the keys own expiry. Defaults to 0.
+
+        refresh_ahead_hits: The optional number of hits after which an
+            entry is refreshed in the background before it expires.
+            Defaults to `None`, which disables refresh ahead.
+
+        refresh_ahead_at: The fraction of the ttl after which a hot entry
+            becomes eligible for refresh ahead. Defaults to 0.75.
+
+        snapshot_path: The optional path of a SQLite database used to
+            persist the cache between restarts. When set, the cache is
+            saved when the client closes and loaded when it starts,
+            discarding any expired entries. Several processes may
+            share the same snapshot.
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_snapshot_path")
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        maxsize: int = 10_000,
+        cache_limited: bool = False,
+        max_stale: float = 0,
+        refresh_ahead_hits: t.Optional[int] = None,
+        refresh_ahead_at: float = 0.75,
+        snapshot_path: t.Optional[str] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1.")
+
+        super().__init__(
+            ttl=ttl,
+            cache_limited=cache_limited,
+            max_stale=max_stale,
+            refresh_ahead_hits=refresh_ahead_hits,
+            refresh_ahead_at=refresh_ahead_at,
+        )
+        self._maxsize = maxsize
+        self._snapshot_path = snapshot_path
+        self._entries: OrderedDict[bytes, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, digest: bytes) -> t.Optional[CacheEntry]:
+        if (entry := self._entries.get(digest)) is not None:
+            self._entries.move_to_end(digest)
+
+        return entry
+
+    def _set(self, digest: bytes, entry: CacheEntry) -> None:
+        self._entries[digest] = entry
+        self._entries.move_to_end(digest)
+
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, digest: bytes) -> None:
+        self._entries.pop(digest, None)
+
+    def invalidate(self, key_id: str) -> None:
+        for digest in [d for d, e in self._entries.items() if e.data.get("keyId") == key_id]:
+            del self._entries[digest]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        return connect(
+            path,
+            "verifications "
+            "(digest BLOB PRIMARY KEY, expires_at REAL NOT NULL, data TEXT NOT NULL)",
+        )
+
+    def load(self) -> None:
+        """Loads unexpired verifications from the snapshot, if one was
+        configured. Entries already in the cache are kept.
+        """
+        if not self._snapshot_path:
+            return None
+
+        connection = self._connect(self._snapshot_path)
+
+        try:
+            rows = connection.execute(
+                "SELECT digest, expires_at, data FROM verifications "
+                "WHERE expires_at > ? ORDER BY expires_at DESC LIMIT ?",
+                (time.time(), self._maxsize),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        # Oldest first, so the longest lived entries are the most recent.
+        for digest, expires_at, data in reversed(rows):
+            if digest not in self._entries:
+                self._set(digest, CacheEntry(json.loads(data), expires_at))
+
+    def save(self) -> None:
+        """Saves unexpired verifications to the snapshot, if one was
+        configured. Expired rows left by other processes are removed.
+        """
+        if not self._snapshot_path:
+            return None
+
+        now = time.time()
+        rows = [
+            (digest, entry.expires_at, json.dumps(entry.data, separators=(",", ":")))
+            for digest, entry in self._entries.items()
+            if entry.expires_at > now
+        ]
+
+        connection = self._connect(self._snapshot_path)
+
+        try:
+            with connection:
+                connection.execute("DELETE FROM verifications WHERE expires_at <= ?", (now,))
+                connection.executemany(
+                    "INSERT OR REPLACE INTO verifications VALUES (?, ?, ?)", rows
+                )
+        finally:
+            connection.close()
+
+
+class SharedVerificationCache(VerificationCache):
+    """A verification cache shared by every process on the host.
+
+    Entries live in a fixed size, open addressing hash table inside a
+    memory mapped file, so workers started by gunicorn or uvicorn on the
+    same machine share each others hits without a network service.
+
+    Each slot holds a truncated digest, the expiry, and the compact JSON
+    payload, guarded by a checksum. Writers do not lock; a torn or
+    concurrent write fails the checksum and is treated as a miss.
+    Payloads larger than the slot are not cached.
+
+    Args:
+        path: The path of the file backing the table. Every process
+            sharing the cache must use the same path and geometry.
+            Defaults to a file in a directory private to the current
+            user, inside the system temp directory.
+
+    Keyword Args:
+        ttl: The number of seconds a verification remains cached.
+            Defaults to 60.
+
+        slots: The number of slots in the table. Defaults to 16,384.
+
+        slot_size: The size of each slot in bytes. Defaults to 512.
+
+        cache_limited: Whether or not to cache keys that have a
+            remaining usage count or ratelimit. Defaults to `False`.
+
+        max_stale: The number of seconds past its ttl an entry may still
+            be served while a single background request refreshes it.
+            Never extends past the keys own expiry. Defaults to 0.
+
+        refresh_ahead_hits: The optional number of hits after which an
+            entry is refreshed in the background before it expires. Hits
+            are counted per process. Defaults to `None`, which disables
+            refresh ahead.
+
+        refresh_ahead_at: The fraction of the ttl after which a hot entry
+            becomes eligible for refresh ahead. Defaults to 0.75.
+
+    Since the table lives in a file, it already survives restarts and
+    `load` and `save` do nothing.
+
+    !!! warning
+
+        Anyone who can write to the file can plant verifications. The
+        file, and the default directory, must be owned by the current
+        user and not be accessible by anyone else, and the file must not
+        be a symlink.
+
+    Raises:
+        ValueError: If the file exists with a different geometry, or is
+            not private to the current user.
+    """
+
+    __slots__ = ("_file", "_map", "_path", "_slot_size", "_slots")
+
+    _MAGIC = b"UNKEYVC1"
+    _HEADER = struct.Struct("<8sII")
+    _SLOT = struct.Struct("<IHxxd16s")
+    _PROBES = 8
+
+    def __init__(
+        self,
+        path: t.Optional[str] = None,
+        *,
+        ttl: float = 60,
+        slots: int = 16_384,
+        slot_size: int = 512,
+        cache_limited: bool = False,
+        max_stale: float = 0,
+        refresh_ahead_hits: t.Optional[int] = None,
+        refresh_ahead_at: float = 0.75,
+    ) -> None:
+        if slots < 1:
+            raise ValueError("Cache slots must be at least 1.")
+
+        if slot_size <= self._SLOT.size:
+            raise ValueError(f"Cache slot size must be greater than {self._SLOT.size}.")
+
+        super().__init__(
+            ttl=ttl,
+            cache_limited=cache_limited,
+            max_stale=max_stale,
+            refresh_ahead_hits=refresh_ahead_hits,
+            refresh_ahead_at=refresh_ahead_at,
+        )
+        self._path = path or self._default_path()
+        self._slots = slots
+        self._slot_size = slot_size
+        self._file, self._map = self._open()
+
+    @staticmethod
+    def _check_private(path: str, info: os.stat_result, is_type: t.Callable[[int], bool]) -> None:
+        if not is_type(info.st_mode):
+            raise ValueError(f"{path!r} is not a regular file or directory.")
+
+        # Ownership and permission bits are only meaningful on posix.
+        if hasattr(os, "geteuid") and (
+            info.st_uid != os.geteuid() or info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+        ):
+            raise ValueError(f"{path!r} must be owned by and private to the current user.")
+
+    @classmethod
+    def _default_path(cls) -> str:
+        user = os.geteuid() if hasattr(os, "geteuid") else os.getlogin()
+        directory = os.path.join(tempfile.gettempdir(), f"unkey-{user}")
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        cls._check_private(directory, os.lstat(directory), stat.S_ISDIR)
+        return os.path.join(directory, "verifications.cache")
+
+    def _open(self) -> t.Tuple[t.BinaryIO, mmap.mmap]:
+        size = self._HEADER.size + self._slots * self._slot_size
+        header = self._HEADER.pack(self._MAGIC, self._slots, self._slot_size)
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(self._path, flags, 0o600)
+        file = os.fdopen(fd, "r+b")
+
+        try:
+            self._check_private(self._path, os.fstat(fd), stat.S_ISREG)
+            existing = file.read(self._HEADER.size)
+
+            if existing and existing != header and any(existing):
+                raise ValueError(f"{self._path!r} was created with a different geometry.")
+
+            if os.fstat(fd).st_size < size:
+                # Every process writes the same header and size, so racing
+                # creators produce the same file.
+                file.truncate(size)
+                file.seek(0)
+                file.write(header)
+                file.flush()
+
+            return file, mmap.mmap(fd, size)
+        except BaseException:
+            file.close()
+            raise
+
+    @property
+    def path(self) -> str:
+        """The path of the file backing the table."""
+        return self._path
+
+    def _offsets(self, digest: bytes) -> t.Iterator[int]:
+        start = int.from_bytes(digest[:8], "little")
+
+        for probe in range(min(self._PROBES, self._slots)):
+            yield self._HEADER.size + ((start + probe) % self._slots) * self._slot_size
+
+    def _read(self, offset: int) -> t.Optional[t.Tuple[float, bytes, bytes]]:
+        crc, length, expires_at, digest = self._SLOT.unpack_from(self._map, offset)
+
+        if not length or length > self._slot_size - self._SLOT.size:
+            return None
+
+        end = offset + self._SLOT.size + length
+
+        if zlib.crc32(self._map[offset + 4 : end]) != crc:
+            return None
+
+        return expires_at, digest, self._map[offset + self._SLOT.size : end]
+
+    def _get(self, digest: bytes) -> t.Optional[CacheEntry]:
+        short = digest[:16]
+
+        for offset in self._offsets(digest):
+            if (record := self._read(offset)) and record[1] == short:
+                return CacheEntry(json.loads(record[2]), record[0])
+
+        return None
+
+    def _set(self, digest: bytes, entry: CacheEntry) -> None:
+        data = {k: v for k, v in entry.data.items() if v is not None}
+        payload = json.dumps(data, separators=(",", ":")).encode()
+
+        if len(payload) > self._slot_size - self._SLOT.size:
+            return None
+
+        short = digest[:16]
+        now = time.time()
+        target = next(self._offsets(digest))
+        oldest = math.inf
+
+        for offset in self._offsets(digest):
+            record = self._read(offset)
+
+            if record is None or record[0] + self._max_stale <= now or record[1] == short:
+                target = offset
+                break
+
+            if record[0] < oldest:
+                target, oldest = offset, record[0]
+
+        body = self._SLOT.pack(0, len(payload), entry.expires_at, short)[4:] + payload
+        self._map[target : target + 4 + len(body)] = struct.pack("<I", zlib.crc32(body)) + body
+
+    def delete(self, digest: bytes) -> None:
+        short = digest[:16]
+
+        for offset in self._offsets(digest):
+            if (record := self._read(offset)) and record[1] == short:
+                self._map[offset : offset + self._SLOT.size] = bytes(self._SLOT.size)
+
+    def invalidate(self, key_id: str) -> None:
+        needle = json.dumps(key_id).encode()
+
+        for slot in range(self._slots):
+            offset = self._HEADER.size + slot * self._slot_size
+
+            if (record := self._read(offset)) and needle in record[2]:
+                if json.loads(record[2]).get("keyId") == key_id:
+                    self._map[offset : offset + self._SLOT.size] = bytes(self._SLOT.size)
+
+    def clear(self) -> None:
+        empty = bytes(self._SLOT.size)
+
+        for slot in range(self._slots):
+            offset = self._HEADER.size + slot * self._slot_size
+            self._map[offset : offset + self._SLOT.size] = empty
+
+    def close(self) -> None:
+        """Unmaps the table and closes the backing file.
+
+        The file itself is left in place for other processes.
+        """
+        if not self._map.closed:
+            self._map.close()
+            self._file.close()
+
+
+class ResourceCache:
+    """An in process read through cache for `KeyService.get_key` and
+    `ApiService.get_api`.
+
+    Writes made through the same `Client` keep the cache consistent.
+    Updating or revoking a key removes it, and updating its remaining
+    uses patches the cached value.
+
+    Keyword Args:
+        key_ttl: The number of seconds a key remains cached.
+            Defaults to 30.
+
+        key_maxsize: The maximum number of cached keys.
+            Defaults to 10,000.
+
+        api_ttl: The number of seconds an api remains cached.
+            Defaults to 300.
+
+        api_maxsize: The maximum number of cached apis.
+            Defaults to 1,000.
+    """
+
+    __slots__ = ("_apis", "_api_ttl", "_keys", "_key_ttl")
+
+    def __init__(
+        self,
+        *,
+        key_ttl: float = 30,
+        key_maxsize: int = 10_000,
+        api_ttl: float = 300,
+        api_maxsize: int = 1_000,
+    ) -> None:
+        if key_ttl <= 0 or api_ttl <= 0:
+            raise ValueError("Cache ttl must be greater than 0.")
+
+        if key_maxsize < 1 or api_maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1.")
+
+        self._key_ttl = key_ttl
+        self._api_ttl = api_ttl
+        self._keys = _LruCache(key_maxsize)
+        self._apis = _LruCache(api_maxsize)
+
+    def get_key(self, key_id: str) -> t.Optional[DictT]:
+        """Gets a cached key payload.
+
+        Args:
+            key_id: The id of the key.
+
+        Returns:
+            The cached payload, or `None` if it was missing or expired.
+        """
+        return self._keys.get(key_id)
+
+    def store_key(self, key_id: str, data: DictT) -> None:
+        """Caches a key payload.
+
+        Args:
+            key_id: The id of the key.
+
+            data: The raw key payload.
+        """
+        self._keys.set(key_id, data, self._key_ttl)
+
+    def patch_key(self, key_id: str, **fields: t.Any) -> None:
+        """Updates fields of a cached key payload, if it is cached.
+
+        Args:
+            key_id: The id of the key.
+
+            **fields: The raw payload fields to update.
+        """
+        self._keys.patch(key_id, fields)
+
+    def invalidate_key(self, key_id: str) -> None:
+        """Removes a cached key payload, if it exists.
+
+        Args:
+            key_id: The id of the key.
+        """
+        self._keys.delete(key_id)
+
+    def get_api(self, api_id: str) -> t.Optional[DictT]:
+        """Gets a cached api payload.
+
+        Args:
+            api_id: The id of the api.
+
+        Returns:
+            The cached payload, or `None` if it was missing or expired.
+        """
+        return self._apis.get(api_id)
+
+    def store_api(self, api_id: str, data: DictT) -> None:
+        """Caches an api payload.
+
+        Args:
+            api_id: The id of the api.
+
+            data: The raw api payload.
+        """
+        self._apis.set(api_id, data, self._api_ttl)
+
+    def invalidate_api(self, api_id: str) -> None:
+        """Removes a cached api payload, if it exists.
+
+        Args:
+            api_id: The id of the api.
+        """
+        self._apis.delete(api_id)
+
+    def clear(self) -> None:
+        """Removes all cached payloads."""
+        self._keys.clear()
+        self._apis.clear()
+
+
+class _LruCache:
+    __slots__ = ("_entries", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Optional[DictT]:
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy_payload(entry.data)
+
+    def set(self, key: str, data: DictT, ttl: float) -> None:
+        self._entries[key] = CacheEntry(copy_payload(data), time.time() + ttl)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def patch(self, key: str, fields: DictT) -> None:
+        if (entry := self._entries.get(key)) is not None:
+            entry.data = {**entry.data, **fields}
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
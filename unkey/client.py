@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
+from unkey import cache
+from unkey import prefilter as prefilter_
 from unkey import serializer
 from unkey import services
+from unkey import tracing
+from unkey import transports
 
 __all__ = ("Client",)
 
@@ -21,6 +26,43 @@ class Client:
 
         api_base_url: The base url to use for the api (no trailing /).
             Defaults to `https://api.unkey.dev`.
+
+        dedupe_gets: Whether or not concurrent identical GET requests
+            should share a single network call. Defaults to `False`.
+
+        warm_connections: The number of keep alive connections to open
+            when the client starts. Defaults to 0.
+
+        keep_warm_interval: The optional number of idle seconds after
+            which `warm_connections` connections are reopened. Defaults
+            to `None`, which disables keeping connections warm.
+
+        transport: The optional transport used to send requests.
+            Defaults to an `AiohttpTransport`.
+
+        slow_request_log: The optional logger for slow and sampled
+            requests, recording the time each spent in every phase.
+            Defaults to `None`.
+
+        lazy_models: Whether or not large listings should produce lazy
+            models that only convert the fields that are accessed.
+            Defaults to `False`.
+
+        compact_models: Whether or not large listings should produce
+            frozen compact models. Defaults to `False`.
+
+        intern_strings: Whether or not repeated api, workspace and owner
+            ids should share a single string object. Defaults to `False`.
+
+        resource_cache: The optional read through cache used by
+            `KeyService.get_key` and `ApiService.get_api`. Defaults to
+            no caching.
+
+        verification_cache: The optional cache used to store successful
+            key verifications. Defaults to no caching.
+
+        prefilter: The optional prefilter used to reject malformed or
+            recently not found keys without contacting the api.
     """
 
     __slots__ = (
@@ -36,20 +78,52 @@ class Client:
         *,
         api_version: t.Optional[int] = None,
         api_base_url: t.Optional[str] = None,
+        dedupe_gets: bool = False,
+        warm_connections: int = 0,
+        keep_warm_interval: t.Optional[float] = None,
+        transport: t.Optional[transports.Transport] = None,
+        slow_request_log: t.Optional[tracing.SlowRequestLogger] = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        intern_strings: bool = False,
+        resource_cache: t.Optional[cache.ResourceCache] = None,
+        verification_cache: t.Optional[cache.VerificationCache] = None,
+        prefilter: t.Optional[prefilter_.KeyPrefilter] = None,
     ) -> None:
-        self._serializer = serializer.Serializer()
-        self._http = services.HttpService(api_key, api_version, api_base_url)
-        self.__init_core_services()
-
-    def __init_core_services(self) -> None:
-        self._apis = self.__init_service(services.ApiService)
-        self._keys = self.__init_service(services.KeyService)
-
-    def __init_service(self, service: t.Type[ServiceT]) -> ServiceT:
+        self._serializer = serializer.Serializer(
+            lazy=lazy_models, compact=compact_models, intern=intern_strings
+        )
+        self._http = services.HttpService(
+            api_key,
+            api_version,
+            api_base_url,
+            dedupe_gets=dedupe_gets,
+            warm_connections=warm_connections,
+            keep_warm_interval=keep_warm_interval,
+            transport=transport,
+            slow_request_log=slow_request_log,
+        )
+        self.__init_core_services(resource_cache, verification_cache, prefilter)
+
+    def __init_core_services(
+        self,
+        resource_cache: t.Optional[cache.ResourceCache],
+        verification_cache: t.Optional[cache.VerificationCache],
+        prefilter: t.Optional[prefilter_.KeyPrefilter],
+    ) -> None:
+        self._apis = self.__init_service(services.ApiService, resource_cache=resource_cache)
+        self._keys = self.__init_service(
+            services.KeyService,
+            resource_cache=resource_cache,
+            verification_cache=verification_cache,
+            prefilter=prefilter,
+        )
+
+    def __init_service(self, service: t.Type[ServiceT], **kwargs: t.Any) -> ServiceT:
         if not issubclass(service, services.BaseService):
             raise TypeError(f"{service.__name__!r} can not be initialized as a service.")
 
-        return service(self._http, self._serializer)  # type: ignore[return-value]
+        return service(self._http, self._serializer, **kwargs)  # type: ignore[return-value]
 
     async def __aenter__(self) -> Client:
         await self.start()
@@ -58,6 +132,13 @@ class Client:
     async def __aexit__(self, *_args: t.Any, **_kwargs: t.Any) -> None:
         await self.close()
 
+    @property
+    def http(self) -> services.HttpService:
+        """The http service used to make requests, i.e. to fetch routes
+        the other services do not cover.
+        """
+        return self._http
+
     @property
     def keys(self) -> services.KeyService:
         """The key service used to make key related requests."""
@@ -85,9 +166,37 @@ class Client:
         self._http.set_base_url(base_url)
 
     async def start(self) -> None:
-        """Starts the client session to be used for http requests."""
+        """Starts the client session to be used for http requests.
+
+        If a verification cache was provided, its saved state is loaded.
+        """
         await self._http.start()
 
-    async def close(self) -> None:
-        """Closes the existing client session, if it's still open."""
-        await self._http.close()
+        if (verification_cache := self._keys.verification_cache) is not None:
+            await asyncio.get_running_loop().run_in_executor(None, verification_cache.load)
+
+    async def close(self, *, drain_timeout: t.Optional[float] = None) -> None:
+        """Closes the existing client session, if it's still open.
+
+        Background cache refreshes are drained first, while the http
+        service still accepts requests. New requests are rejected once
+        they finish. If a verification cache was provided, its state is
+        saved.
+
+        Keyword Args:
+            drain_timeout: The optional number of seconds to wait for
+                background cache refreshes and pending requests to
+                finish before closing. Defaults to `None`, which closes
+                immediately.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (drain_timeout or 0)
+        await self._keys.drain(drain_timeout or 0)
+
+        if drain_timeout is not None:
+            drain_timeout = max(0, deadline - loop.time())
+
+        await self._http.close(drain_timeout=drain_timeout)
+
+        if (verification_cache := self._keys.verification_cache) is not None:
+            await asyncio.get_running_loop().run_in_executor(None, verification_cache.save)
@@ -13,6 +13,8 @@ from typing import Union
 
 from unkey import client
 from unkey import models
+from unkey import prefilter as prefilter_
+from unkey import serializer
 
 __all__ = ("protected",)
 
@@ -38,6 +40,7 @@ def protected(
     key_extractor: ExtractorT,
     on_invalid_key: Optional[InvalidKeyHandlerT] = None,
     on_exc: Optional[ExcHandlerT] = None,
+    prefilter: Optional[prefilter_.KeyPrefilter] = None,
 ) -> DecoratorT:
     """A framework agnostic second order decorator that is used to protect
     api routes with Unkey key verification.
@@ -71,6 +74,10 @@ def protected(
         on_exc: The callback function used to handle exceptions that get thrown
             at any point during verification.
 
+        prefilter: The optional prefilter used to reject malformed or
+            recently not found keys before a client is created. Rejected
+            keys are passed to `on_invalid_key` with a `NOT_FOUND` code.
+
     Raises:
         exc: If an exception is raised and no `on_exc` callback was supplied.
 
@@ -97,6 +104,12 @@ def protected(
 
         raise exc
 
+    def _verify_locally(key: str) -> Optional[models.ApiKeyVerification]:
+        if prefilter and prefilter.rejects(key, api_id):
+            return serializer.Serializer().to_api_key_verification(prefilter.NOT_FOUND)
+
+        return None
+
     def wrapper(
         func: CallableT[T],
     ) -> CallableT[Coroutine[Any, Any, VerificationResponseT[T]]]:
@@ -107,7 +120,11 @@ def protected(
                     message = "Failed to extract API key"
                     return _on_invalid_key({"code": None, "message": message})
 
-                async with client.Client() as c:
+                if rejected := _verify_locally(key):
+                    code = models.ErrorCode.NotFound.value
+                    return _on_invalid_key({"code": code, "message": rejected.error}, rejected)
+
+                async with client.Client(prefilter=prefilter) as c:
                     result = await c.keys.verify_key(key, api_id)
 
                 if result.is_err:
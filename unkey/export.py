@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import importlib
+import json
+import os
+import typing as t
+
+from unkey import models
+from unkey import undefined
+
+if t.TYPE_CHECKING:  # pragma: nocover
+    from unkey import client as client_
+
+__all__ = ("KeyExporter",)
+
+DictT = t.Dict[str, t.Any]
+
+FORMATS: t.Final[t.Tuple[str, ...]] = ("ndjson", "csv", "parquet")
+"""The supported export formats."""
+
+COLUMNS: t.Final[t.Tuple[str, ...]] = (
+    "id",
+    "api_id",
+    "workspace_id",
+    "start",
+    "owner_id",
+    "created_at",
+    "expires",
+    "remaining",
+    "meta",
+    "ratelimit",
+    "refill",
+)
+"""The columns written for each key, in order."""
+
+_NESTED = ("meta", "ratelimit", "refill")
+
+
+def _dumps(value: t.Any) -> str:
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+class _Writer:
+    __slots__ = ("_file", "_writer")
+
+    def __init__(self, path: str, format: str, offset: t.Optional[int]) -> None:
+        self._writer: t.Any = None
+
+        if format == "parquet":
+            self._file = None
+            self._writer = _parquet_writer(path)
+            return None
+
+        self._file = open(path, "r+" if offset is not None else "w", newline="", encoding="utf-8")
+
+        if offset is not None:
+            # Drop anything written after the last checkpoint.
+            self._file.seek(offset)
+            self._file.truncate()
+
+        if format == "csv":
+            self._writer = csv.writer(self._file)
+
+            if not offset:
+                self._writer.writerow(COLUMNS)
+
+    def write(self, rows: t.List[DictT]) -> t.Optional[int]:
+        if self._file is None:
+            self._writer.write(rows)
+            return None
+
+        if self._writer is None:
+            self._file.writelines(_dumps(row) + "\n" for row in rows)
+        else:
+            self._writer.writerows(
+                [_dumps(row[c]) if c in _NESTED else row[c] for c in COLUMNS] for row in rows
+            )
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._file is None:
+            self._writer.close()
+        else:
+            self._file.close()
+
+
+class _ParquetWriter:
+    __slots__ = ("_pa", "_schema", "_writer")
+
+    def __init__(self, pa: t.Any, pq: t.Any, path: str) -> None:
+        self._pa = pa
+        int_columns = ("created_at", "expires", "remaining")
+        self._schema = pa.schema(
+            [(c, pa.int64() if c in int_columns else pa.string()) for c in COLUMNS]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows: t.List[DictT]) -> None:
+        for row in rows:
+            for column in _NESTED:
+                row[column] = None if row[column] is None else _dumps(row[column])
+
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _parquet_writer(path: str) -> _ParquetWriter:
+    try:
+        pa = importlib.import_module("pyarrow")
+        pq = importlib.import_module("pyarrow.parquet")
+    except ImportError:
+        raise RuntimeError("pyarrow must be installed to export to parquet.") from None
+
+    return _ParquetWriter(pa, pq, path)
+
+
+class KeyExporter:
+    """Streams every key for one or more apis to disk.
+
+    Keys are fetched a page at a time and written as they arrive, so
+    memory use is bounded by the page size rather than the number of
+    keys.
+
+    NDJSON and CSV exports write a checkpoint file next to the output
+    after every page, containing the cursor and the size of the output.
+    Interrupted exports resume from the last checkpoint, and the
+    checkpoint is removed once the export completes. Parquet exports
+    require pyarrow and always start from the beginning.
+
+    Args:
+        client: The started client to fetch keys with.
+
+    Keyword Args:
+        page_size: The number of keys to request per page.
+            Defaults to 100.
+
+        concurrency: The maximum number of apis exported at once by
+            `export_many`. Defaults to 4.
+    """
+
+    __slots__ = ("_client", "_concurrency", "_page_size")
+
+    def __init__(
+        self, client: client_.Client, *, page_size: int = 100, concurrency: int = 4
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Exporter concurrency must be at least 1.")
+
+        self._client = client
+        self._page_size = page_size
+        self._concurrency = concurrency
+
+    @staticmethod
+    def checkpoint_path(path: str) -> str:
+        """Gets the path of the checkpoint file for an export.
+
+        Args:
+            path: The path of the export.
+
+        Returns:
+            The checkpoint path.
+        """
+        return path + ".checkpoint"
+
+    def _load_checkpoint(self, path: str, format: str, resume: bool) -> t.Optional[DictT]:
+        checkpoint = self.checkpoint_path(path)
+
+        if format == "parquet" or not resume or not os.path.exists(path):
+            return None
+
+        try:
+            with open(checkpoint, encoding="utf-8") as f:
+                data: DictT = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return data if data.get("format") == format else None
+
+    def _save_checkpoint(self, path: str, data: DictT) -> None:
+        checkpoint = self.checkpoint_path(path)
+
+        with open(checkpoint + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        os.replace(checkpoint + ".tmp", checkpoint)
+
+    def _remove_checkpoint(self, path: str) -> None:
+        if os.path.exists(checkpoint := self.checkpoint_path(path)):
+            os.remove(checkpoint)
+
+    def _write_page(
+        self, writer: _Writer, path: str, rows: t.List[DictT], checkpoint: t.Optional[DictT]
+    ) -> None:
+        offset = writer.write(rows)
+
+        if checkpoint is not None and offset is not None:
+            self._save_checkpoint(path, {**checkpoint, "offset": offset})
+
+    async def export(
+        self,
+        api_id: str,
+        path: str,
+        *,
+        format: str = "ndjson",
+        owner_id: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        resume: bool = True,
+    ) -> int:
+        """Exports every key for an api.
+
+        Args:
+            api_id: The id of the api.
+
+            path: The file to write the keys to.
+
+        Keyword Args:
+            format: The format to write, one of `"ndjson"`, `"csv"`, or
+                `"parquet"`. Defaults to `"ndjson"`.
+
+            owner_id: The optional owner id to export the keys for.
+
+            resume: Whether or not to resume from an existing checkpoint.
+                Defaults to `True`.
+
+        Returns:
+            The total number of keys in the export.
+
+        Raises:
+            ValueError: If the format is not supported.
+
+            RuntimeError: If a page could not be fetched. The checkpoint
+                is kept so the export can be resumed.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported export format {format!r}, expected one of {FORMATS}.")
+
+        checkpoint = self._load_checkpoint(path, format, resume)
+        cursor = checkpoint["cursor"] if checkpoint else undefined.UNDEFINED
+        rows: int = checkpoint["rows"] if checkpoint else 0
+        offset = checkpoint["offset"] if checkpoint else None
+
+        # File writes and fsyncs run in the default executor, so they do
+        # not block other exports or anything else on the event loop.
+        loop = asyncio.get_running_loop()
+        writer = await loop.run_in_executor(None, _Writer, path, format, offset)
+
+        try:
+            while True:
+                result = await self._client.apis.list_keys(
+                    api_id, owner_id=owner_id, limit=self._page_size, cursor=cursor
+                )
+
+                if result.is_err:
+                    err = result.unwrap_err()
+                    raise RuntimeError(f"Failed to export keys for {api_id!r}: {err.message}")
+
+                page = result.unwrap()
+                page_rows = [self._to_row(key) for key in page.keys]
+                rows += len(page.keys)
+
+                if not page.keys or not page.cursor:
+                    await loop.run_in_executor(
+                        None, self._write_page, writer, path, page_rows, None
+                    )
+                    break
+
+                cursor = page.cursor
+                data = {"format": format, "cursor": cursor, "rows": rows}
+                await loop.run_in_executor(None, self._write_page, writer, path, page_rows, data)
+        finally:
+            await loop.run_in_executor(None, writer.close)
+
+        await loop.run_in_executor(None, self._remove_checkpoint, path)
+
+        return rows
+
+    async def export_many(
+        self,
+        api_ids: t.Iterable[str],
+        directory: str,
+        *,
+        format: str = "ndjson",
+        resume: bool = True,
+    ) -> t.Dict[str, int]:
+        """Exports every key for several apis concurrently, writing one
+        file per api named after its id.
+
+        Args:
+            api_ids: The ids of the apis.
+
+            directory: The directory to write the exports to.
+
+        Keyword Args:
+            format: The format to write, one of `"ndjson"`, `"csv"`, or
+                `"parquet"`. Defaults to `"ndjson"`.
+
+            resume: Whether or not to resume from existing checkpoints.
+                Defaults to `True`.
+
+        Returns:
+            A mapping of api ids to the number of keys exported.
+        """
+        os.makedirs(directory, exist_ok=True)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        api_ids = list(dict.fromkeys(api_ids))
+
+        async def run(api_id: str) -> int:
+            async with semaphore:
+                path = os.path.join(directory, f"{api_id}.{format}")
+                return await self.export(api_id, path, format=format, resume=resume)
+
+        counts = await asyncio.gather(*(run(api_id) for api_id in api_ids))
+        return dict(zip(api_ids, counts))
+
+    def _to_row(self, key: models.ApiKeyMeta) -> DictT:
+        return {
+            "id": key.id,
+            "api_id": key.api_id,
+            "workspace_id": key.workspace_id,
+            "start": key.start,
+            "owner_id": key.owner_id,
+            "created_at": key.created_at,
+            "expires": key.expires,
+            "remaining": key.remaining,
+            "meta": key.meta,
+            "ratelimit": key.ratelimit.to_dict() if key.ratelimit else None,
+            "refill": key.refill.to_dict() if key.refill else None,
+        }
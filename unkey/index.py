@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import bisect
+import copy
+import json
+import sqlite3
+import typing as t
+
+import attrs
+
+from unkey import cache
+from unkey import models
+from unkey import result
+from unkey import serializer as serializer_
+from unkey import undefined
+
+if t.TYPE_CHECKING:  # pragma: nocover
+    from unkey import client as client_
+
+__all__ = ("KeyIndex", "SyncStats")
+
+DictT = t.Dict[str, t.Any]
+SortedT = t.List[t.Tuple[int, str]]
+ResultT = result.Result["SyncStats", models.HttpResponse]
+
+
+@attrs.define(weakref_slot=False)
+class SyncStats:
+    """The changes applied to a `KeyIndex` by a sync."""
+
+    added: int = 0
+    """The number of keys added to the index."""
+
+    updated: int = 0
+    """The number of existing keys whose data changed."""
+
+    removed: int = 0
+    """The number of keys no longer returned by the api."""
+
+    unchanged: int = 0
+    """The number of existing keys whose data did not change."""
+
+
+class KeyIndex:
+    """A local index of keys across many apis.
+
+    Keys are indexed by owner, api, expiry, and creation time, so
+    questions like "every key for owner X" or "keys expiring this week"
+    are answered without contacting unkey.
+
+    The index is populated with `sync`, and kept current between syncs
+    by `attach`ing it to a client, which applies the key writes made
+    through that client as soon as they succeed.
+
+    Keyword Args:
+        path: The optional path of a SQLite database used to persist the
+            index. When set, `load` and `save` read and write it.
+
+        serializer: The optional serializer used to create models from
+            the indexed data. Defaults to a new `Serializer`.
+    """
+
+    __slots__ = (
+        "_by_api",
+        "_by_owner",
+        "_keys",
+        "_path",
+        "_serializer",
+        "_sorted",
+        "_watermarks",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: t.Optional[str] = None,
+        serializer: t.Optional[serializer_.Serializer] = None,
+    ) -> None:
+        self._path = path
+        self._serializer = serializer or serializer_.Serializer()
+        self._keys: t.Dict[str, DictT] = {}
+        self._by_api: t.Dict[str, t.Set[str]] = {}
+        self._by_owner: t.Dict[str, t.Set[str]] = {}
+        # The (expires, created) orderings, rebuilt on the first range
+        # query after a change, since sorted inserts and removals are
+        # linear and would make syncing large apis quadratic.
+        self._sorted: t.Optional[t.Tuple[SortedT, SortedT]] = None
+        self._watermarks: t.Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._keys
+
+    def watermark(self, api_id: str) -> t.Optional[int]:
+        """Gets the newest creation time seen for an api.
+
+        Args:
+            api_id: The id of the api.
+
+        Returns:
+            The unix epoch in milliseconds, or `None` if the api has
+                not been synced.
+        """
+        return self._watermarks.get(api_id)
+
+    def _add(self, data: DictT) -> None:
+        key_id = data["id"]
+        self._keys[key_id] = data
+        self._by_api.setdefault(data["apiId"], set()).add(key_id)
+
+        if (owner_id := data.get("ownerId")) is not None:
+            self._by_owner.setdefault(owner_id, set()).add(key_id)
+
+        self._sorted = None
+
+    def _remove(self, key_id: str) -> t.Optional[DictT]:
+        if (data := self._keys.pop(key_id, None)) is None:
+            return None
+
+        self._discard(self._by_api, data["apiId"], key_id)
+
+        if (owner_id := data.get("ownerId")) is not None:
+            self._discard(self._by_owner, owner_id, key_id)
+
+        self._sorted = None
+        return data
+
+    @staticmethod
+    def _discard(index: t.Dict[str, t.Set[str]], value: str, key_id: str) -> None:
+        if (ids := index.get(value)) is not None:
+            ids.discard(key_id)
+
+            if not ids:
+                del index[value]
+
+    def _orderings(self) -> t.Tuple[SortedT, SortedT]:
+        if self._sorted is None:
+            expires = [
+                (d["expires"], i) for i, d in self._keys.items() if d.get("expires") is not None
+            ]
+            created = [(d["createdAt"], i) for i, d in self._keys.items()]
+            expires.sort()
+            created.sort()
+            self._sorted = (expires, created)
+
+        return self._sorted
+
+    def _model(self, data: DictT) -> models.ApiKeyMeta:
+        return self._serializer.to_api_key_meta(cache.copy_payload(data))
+
+    def _models(self, key_ids: t.Iterable[str]) -> t.List[models.ApiKeyMeta]:
+        return [self._model(self._keys[i]) for i in key_ids]
+
+    def _oldest_first(self, key_ids: t.Set[str]) -> t.List[models.ApiKeyMeta]:
+        return self._models(sorted(key_ids, key=lambda i: (self._keys[i]["createdAt"], i)))
+
+    def _between(self, values: SortedT, start: int, end: int) -> t.List[models.ApiKeyMeta]:
+        lo = bisect.bisect_left(values, (start, ""))
+        hi = bisect.bisect_left(values, (end, ""))
+        return self._models(key_id for _, key_id in values[lo:hi])
+
+    def get(self, key_id: str) -> t.Optional[models.ApiKeyMeta]:
+        """Gets a single indexed key.
+
+        Args:
+            key_id: The id of the key.
+
+        Returns:
+            The key, or `None` if it is not indexed.
+        """
+        if (data := self._keys.get(key_id)) is None:
+            return None
+
+        return self._model(data)
+
+    def by_owner(
+        self, owner_id: str, *, api_id: t.Optional[str] = None
+    ) -> t.List[models.ApiKeyMeta]:
+        """Gets every indexed key for an owner.
+
+        Args:
+            owner_id: The owner of the keys.
+
+        Keyword Args:
+            api_id: The optional api to limit the keys to.
+
+        Returns:
+            The matching keys, oldest first.
+        """
+        key_ids = self._by_owner.get(owner_id, set())
+
+        if api_id is not None:
+            key_ids = key_ids & self._by_api.get(api_id, set())
+
+        return self._oldest_first(key_ids)
+
+    def by_api(self, api_id: str) -> t.List[models.ApiKeyMeta]:
+        """Gets every indexed key for an api.
+
+        Args:
+            api_id: The id of the api.
+
+        Returns:
+            The matching keys, oldest first.
+        """
+        return self._oldest_first(self._by_api.get(api_id, set()))
+
+    def expiring_between(self, start: int, end: int) -> t.List[models.ApiKeyMeta]:
+        """Gets the indexed keys that expire in the given window. Keys
+        that never expire are excluded.
+
+        Args:
+            start: The inclusive unix epoch in milliseconds.
+
+            end: The exclusive unix epoch in milliseconds.
+
+        Returns:
+            The matching keys, soonest first.
+        """
+        return self._between(self._orderings()[0], start, end)
+
+    def created_between(self, start: int, end: int) -> t.List[models.ApiKeyMeta]:
+        """Gets the indexed keys created in the given window.
+
+        Args:
+            start: The inclusive unix epoch in milliseconds.
+
+            end: The exclusive unix epoch in milliseconds.
+
+        Returns:
+            The matching keys, oldest first.
+        """
+        return self._between(self._orderings()[1], start, end)
+
+    def apply_write(self, key_id: str, fields: t.Optional[DictT]) -> None:
+        """Applies a key write to the index. Writes to keys that are
+        not indexed are ignored.
+
+        Args:
+            key_id: The id of the key that was written.
+
+            fields: The changed fields as they appear in the api
+                payloads, or `None` if the key was revoked.
+        """
+        if (data := self._remove(key_id)) is None or fields is None:
+            return None
+
+        data = {**data, **copy.deepcopy(fields)}
+        self._add({k: v for k, v in data.items() if v is not None})
+
+    def attach(self, client: client_.Client) -> None:
+        """Applies key writes made through the client to this index as
+        soon as they succeed.
+
+        Args:
+            client: The client to listen to.
+        """
+        client.keys.add_write_listener(self.apply_write)
+
+    def detach(self, client: client_.Client) -> None:
+        """Stops applying key writes made through the client.
+
+        Args:
+            client: The client to stop listening to.
+        """
+        client.keys.remove_write_listener(self.apply_write)
+
+    async def sync(
+        self,
+        client: client_.Client,
+        api_ids: t.Iterable[str],
+        *,
+        full: bool = False,
+        page_size: int = 100,
+    ) -> ResultT:
+        """Syncs the index with the keys unkey has for each api.
+
+        !!! info
+
+            Unkey can not list keys changed since a given time, so every
+            page is still walked. An incremental sync only re-indexes keys
+            created after the apis watermark, or whose data changed, and
+            removes keys that are no longer listed.
+
+        Args:
+            client: The started client to fetch keys with.
+
+            api_ids: The ids of the apis to sync.
+
+        Keyword Args:
+            full: Whether or not to drop and re-index every key of each
+                api instead of syncing incrementally. Defaults to `False`.
+
+            page_size: The number of keys to request per page.
+                Defaults to 100.
+
+        Returns:
+            A result containing the applied changes or an error. If an
+                error occurs, keys already fetched remain indexed, but
+                nothing is removed for the failed api.
+        """
+        stats = SyncStats()
+
+        for api_id in api_ids:
+            if full:
+                for key_id in list(self._by_api.get(api_id, ())):
+                    self._remove(key_id)
+
+            watermark = self._watermarks.get(api_id, -1)
+            newest = watermark
+            seen: t.Set[str] = set()
+            cursor: undefined.UndefinedOr[str] = undefined.UNDEFINED
+
+            while True:
+                page = await client.apis.list_keys_raw(api_id, limit=page_size, cursor=cursor)
+
+                if page.is_err:
+                    return result.Err(page.unwrap_err())
+
+                data = page.unwrap()
+
+                for key in data["keys"]:
+                    seen.add(key_id := key["id"])
+                    newest = max(newest, key["createdAt"])
+
+                    if key["createdAt"] <= watermark and self._keys.get(key_id) == key:
+                        stats.unchanged += 1
+                        continue
+
+                    if self._remove(key_id) is None:
+                        stats.added += 1
+                    else:
+                        stats.updated += 1
+
+                    self._add(key)
+
+                if not data["keys"] or not (cursor := data.get("cursor") or undefined.UNDEFINED):
+                    break
+
+            for key_id in self._by_api.get(api_id, set()) - seen:
+                self._remove(key_id)
+                stats.removed += 1
+
+            self._watermarks[api_id] = newest
+
+        return result.Ok(stats)
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        return cache.connect(
+            path,
+            "keys (id TEXT PRIMARY KEY, api_id TEXT NOT NULL, data TEXT NOT NULL)",
+            "watermarks (api_id TEXT PRIMARY KEY, created_at INTEGER NOT NULL)",
+        )
+
+    def load(self) -> None:
+        """Loads the index from its database, if a path was configured,
+        replacing the current contents.
+        """
+        if not self._path:
+            return None
+
+        connection = self._connect(self._path)
+
+        try:
+            keys = connection.execute("SELECT data FROM keys").fetchall()
+            watermarks = connection.execute("SELECT api_id, created_at FROM watermarks")
+            self._watermarks = dict(watermarks.fetchall())
+        finally:
+            connection.close()
+
+        self.clear(watermarks=False)
+
+        for (data,) in keys:
+            self._add(json.loads(data))
+
+    def save(self) -> None:
+        """Saves the index to its database, if a path was configured,
+        replacing its previous contents.
+        """
+        if not self._path:
+            return None
+
+        keys = [
+            (key_id, data["apiId"], json.dumps(data, separators=(",", ":")))
+            for key_id, data in self._keys.items()
+        ]
+        connection = self._connect(self._path)
+
+        try:
+            with connection:
+                connection.execute("DELETE FROM keys")
+                connection.execute("DELETE FROM watermarks")
+                connection.executemany("INSERT INTO keys VALUES (?, ?, ?)", keys)
+                connection.executemany(
+                    "INSERT INTO watermarks VALUES (?, ?)", self._watermarks.items()
+                )
+        finally:
+            connection.close()
+
+    def clear(self, *, watermarks: bool = True) -> None:
+        """Removes every key from the index.
+
+        Keyword Args:
+            watermarks: Whether or not to also forget the sync
+                watermarks. Defaults to `True`.
+        """
+        self._keys.clear()
+        self._by_api.clear()
+        self._by_owner.clear()
+        self._sorted = None
+
+        if watermarks:
+            self._watermarks.clear()
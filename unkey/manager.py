@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+import typing as t
+
+import attrs
+
+from unkey import client as client_
+from unkey import transports
+
+__all__ = ("ClientManager", "TenantStats")
+
+
+@attrs.define(weakref_slot=False)
+class TenantStats:
+    """The requests made on behalf of a tenant."""
+
+    requests: int = 0
+    """The number of requests sent."""
+
+    errors: int = 0
+    """The number of requests that failed or got an error status."""
+
+    total_time: float = 0.0
+    """The total seconds spent on requests."""
+
+    last_used: float = 0.0
+    """The `time.monotonic` time the tenant's client was last handed
+    out.
+    """
+
+    @property
+    def average_time(self) -> float:
+        """The average seconds spent per request."""
+        return self.total_time / self.requests if self.requests else 0.0
+
+
+class _TenantTransport(transports.Transport):
+    """Sends a tenant's requests through the shared transport, recording
+    its stats. Starting and closing are left to the manager.
+    """
+
+    __slots__ = ("_stats", "_transport")
+
+    def __init__(self, transport: transports.Transport, stats: TenantStats) -> None:
+        self._transport = transport
+        self._stats = stats
+
+    async def send(self, request: transports.TransportRequest) -> transports.TransportResponse:
+        stats = self._stats
+        start = time.perf_counter()
+
+        try:
+            response = await self._transport.send(request)
+        except Exception:
+            stats.errors += 1
+            raise
+        else:
+            if response.status >= 400:
+                stats.errors += 1
+
+            return response
+        finally:
+            stats.requests += 1
+            stats.total_time += time.perf_counter() - start
+
+
+class ClientManager:
+    """Hands out a client per tenant, each with its own root key, that
+    all share one transport and its connection pool.
+
+    The api key is sent with each request, so tenant clients hold no
+    connections of their own and are cheap to create. When more than
+    `max_clients` tenants are active, the least recently used client is
+    evicted. Evicted clients are not closed, so callers still holding
+    one can keep using it until the manager is closed.
+
+    ```py
+    async with unkey.ClientManager() as manager:
+        client = await manager.client("workspace_123", root_key)
+        result = await client.keys.get_key("key_123")
+    ```
+
+    Keyword Args:
+        transport: The optional transport shared by every client.
+            Defaults to an `AiohttpTransport`.
+
+        max_clients: The maximum number of clients to keep. Defaults
+            to 100.
+
+        max_stats: The maximum number of tenants to keep stats for.
+            The stats of the least recently used tenants are dropped
+            first. Must be at least `max_clients`. Defaults to 10,000.
+
+        api_version: The api version to access. Defaults to 1.
+
+        api_base_url: The optional base url to use for the api.
+
+        dedupe_gets: Whether or not each client should share a single
+            network call between concurrent identical GET requests.
+            Defaults to `False`.
+    """
+
+    __slots__ = (
+        "_api_base_url",
+        "_api_version",
+        "_clients",
+        "_dedupe_gets",
+        "_keys",
+        "_max_clients",
+        "_max_stats",
+        "_stats",
+        "_transport",
+    )
+
+    def __init__(
+        self,
+        *,
+        transport: t.Optional[transports.Transport] = None,
+        max_clients: int = 100,
+        max_stats: int = 10_000,
+        api_version: t.Optional[int] = None,
+        api_base_url: t.Optional[str] = None,
+        dedupe_gets: bool = False,
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError("Max clients must be at least 1.")
+
+        if max_stats < max_clients:
+            raise ValueError("Max stats must be at least max clients.")
+
+        self._transport = transport or transports.AiohttpTransport()
+        self._max_clients = max_clients
+        self._max_stats = max_stats
+        self._api_version = api_version
+        self._api_base_url = api_base_url
+        self._dedupe_gets = dedupe_gets
+        self._clients: collections.OrderedDict[str, client_.Client] = collections.OrderedDict()
+        self._keys: t.Dict[str, str] = {}
+        self._stats: collections.OrderedDict[str, TenantStats] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._clients
+
+    async def __aenter__(self) -> ClientManager:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_args: t.Any, **_kwargs: t.Any) -> None:
+        await self.close()
+
+    @property
+    def transport(self) -> transports.Transport:
+        """The transport shared by every client."""
+        return self._transport
+
+    def stats(self, tenant_id: str) -> t.Optional[TenantStats]:
+        """Gets the stats for a tenant. Stats are kept when a tenant's
+        client is evicted, for up to `max_stats` tenants.
+
+        Args:
+            tenant_id: The id of the tenant.
+
+        Returns:
+            The stats, or `None` if no client was created for the tenant
+            or its stats were dropped.
+        """
+        return self._stats.get(tenant_id)
+
+    def all_stats(self) -> t.Dict[str, TenantStats]:
+        """Gets the stats for every tenant.
+
+        Returns:
+            A new dictionary of tenant ids to their stats.
+        """
+        return dict(self._stats)
+
+    async def start(self) -> None:
+        """Starts the shared transport."""
+        await self._transport.start()
+
+    async def close(self, *, drain_timeout: t.Optional[float] = None) -> None:
+        """Closes every client, then the shared transport.
+
+        Keyword Args:
+            drain_timeout: The optional number of seconds to wait for
+                each client's pending requests to finish. Defaults to
+                `None`, which closes immediately.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._keys.clear()
+        await asyncio.gather(*(c.close(drain_timeout=drain_timeout) for c in clients))
+        await self._transport.close()
+
+    async def client(self, tenant_id: str, api_key: str) -> client_.Client:
+        """Gets the client for a tenant, creating it if needed.
+
+        Args:
+            tenant_id: The id of the tenant, i.e. its workspace id.
+
+            api_key: The tenant's root key. If it differs from the key
+                the existing client was created with, the client is
+                replaced.
+
+        Returns:
+            The started client.
+        """
+        stats = self._stats.setdefault(tenant_id, TenantStats())
+        stats.last_used = time.monotonic()
+        self._stats.move_to_end(tenant_id)
+
+        # Stats are ordered by use like the clients, so the tenants with
+        # a client are never the ones dropped.
+        while len(self._stats) > self._max_stats:
+            self._stats.popitem(last=False)
+
+        if (client := self._clients.get(tenant_id)) is not None:
+            if self._keys[tenant_id] == api_key:
+                self._clients.move_to_end(tenant_id)
+                return client
+
+            self.evict(tenant_id)
+
+        client = client_.Client(
+            api_key,
+            api_version=self._api_version,
+            api_base_url=self._api_base_url,
+            dedupe_gets=self._dedupe_gets,
+            transport=_TenantTransport(self._transport, stats),
+        )
+
+        # The client is stored before awaiting, so concurrent callers for
+        # the same tenant share it.
+        self._clients[tenant_id] = client
+        self._keys[tenant_id] = api_key
+
+        while len(self._clients) > self._max_clients:
+            self.evict(next(iter(self._clients)))
+
+        await client.start()
+        return client
+
+    def evict(self, tenant_id: str) -> None:
+        """Forgets the client for a tenant, if there is one.
+
+        The client is not closed, since it holds no connections of its
+        own. Callers still holding it can keep using it until the
+        manager is closed.
+
+        Args:
+            tenant_id: The id of the tenant.
+        """
+        if self._clients.pop(tenant_id, None) is not None:
+            del self._keys[tenant_id]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+
+from unkey import client as client_
+from unkey import models
+
+__all__ = ("UnkeyMiddleware",)
+
+MessageT = t.MutableMapping[str, t.Any]
+ScopeT = t.MutableMapping[str, t.Any]
+ReceiveT = t.Callable[[], t.Awaitable[MessageT]]
+SendT = t.Callable[[MessageT], t.Awaitable[None]]
+AsgiAppT = t.Callable[[ScopeT, ReceiveT, SendT], t.Awaitable[None]]
+
+_BEARER = b"bearer "
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+_MISSING_KEY_BODY = b'{"code": null, "message": "Failed to extract API key"}'
+_STATUS_CODES: t.Dict[t.Optional[models.ErrorCode], int] = {
+    models.ErrorCode.Forbidden: 403,
+    models.ErrorCode.Ratelimited: 429,
+    models.ErrorCode.KeyUsageExceeded: 429,
+}
+
+
+class UnkeyMiddleware:
+    """A framework agnostic ASGI middleware that verifies api keys
+    using Unkey before the request reaches the application.
+
+    !!! info
+
+        The key is read directly from the raw ASGI headers. On a
+        successful verification the `ApiKeyVerification` is placed in
+        `scope["state"]` under `state_key`, which frameworks such as
+        Starlette and FastAPI expose as `request.state.unkey_verification`.
+
+        A single `Client` is reused for the lifetime of the app. It is
+        started when the ASGI lifespan starts up and closed after the
+        app completes its shutdown. If the server does not support
+        lifespan events, the client is started on the first request.
+
+    Args:
+        app: The ASGI application to wrap.
+
+        api_id: The ID of the api to verify keys against.
+
+    Keyword Args:
+        client: The optional client to use for verification. If not
+            provided, one is created and managed by the middleware.
+            A provided client is started, but never closed.
+
+        header: The name of the header containing the key.
+            Defaults to `"authorization"`.
+
+        state_key: The key used to store the verification in the
+            scope state. Defaults to `"unkey_verification"`.
+
+        exclude_paths: The optional paths that bypass verification
+            entirely, such as health checks.
+    """
+
+    __slots__ = (
+        "_api_id",
+        "_app",
+        "_client",
+        "_exclude_paths",
+        "_header",
+        "_owns_client",
+        "_started",
+        "_starting",
+        "_state_key",
+    )
+
+    def __init__(
+        self,
+        app: AsgiAppT,
+        api_id: str,
+        *,
+        client: t.Optional[client_.Client] = None,
+        header: str = "authorization",
+        state_key: str = "unkey_verification",
+        exclude_paths: t.Iterable[str] = (),
+    ) -> None:
+        self._app = app
+        self._api_id = api_id
+        self._owns_client = client is None
+        self._client = client or client_.Client()
+        self._header = header.lower().encode("latin-1")
+        self._state_key = state_key
+        self._exclude_paths = frozenset(exclude_paths)
+        self._started = False
+        self._starting: t.Optional[asyncio.Future[None]] = None
+
+    @property
+    def client(self) -> client_.Client:
+        """The client used to verify keys."""
+        return self._client
+
+    async def __call__(self, scope: ScopeT, receive: ReceiveT, send: SendT) -> None:
+        scope_type = scope["type"]
+
+        if scope_type == "lifespan":
+            return await self._app(scope, self._wrap_receive(receive), self._wrap_send(send))
+
+        if scope_type not in ("http", "websocket") or scope["path"] in self._exclude_paths:
+            return await self._app(scope, receive, send)
+
+        if not self._started:
+            await self._start()
+
+        if not (key := self._extract_key(scope["headers"])):
+            return await self._reject(scope_type, send, 401, _MISSING_KEY_BODY)
+
+        result = await self._client.keys.verify_key(key, self._api_id)
+
+        if result.is_err:
+            err = result.unwrap_err()
+            body = self._error_body(err.code, err.message)
+            return await self._reject(scope_type, send, _STATUS_CODES.get(err.code, 500), body)
+
+        verification = result.unwrap()
+
+        if not verification.valid:
+            body = self._error_body(verification.code, verification.error)
+            status = _STATUS_CODES.get(verification.code, 401)
+            return await self._reject(scope_type, send, status, body)
+
+        if (state := scope.get("state")) is None:
+            state = scope["state"] = {}
+
+        state[self._state_key] = verification
+        await self._app(scope, receive, send)
+
+    def _extract_key(self, headers: t.Iterable[t.Tuple[bytes, bytes]]) -> t.Optional[str]:
+        for name, value in headers:
+            if name == self._header:
+                if value[:7].lower() == _BEARER:
+                    value = value[7:]
+
+                return value.strip().decode("latin-1") or None
+
+        return None
+
+    def _error_body(self, code: t.Optional[models.ErrorCode], message: t.Optional[str]) -> bytes:
+        code_value = (code or models.ErrorCode.Unknown).value
+        return json.dumps({"code": code_value, "message": message}).encode()
+
+    async def _reject(self, scope_type: str, send: SendT, status: int, body: bytes) -> None:
+        if scope_type == "websocket":
+            # Closing before accepting rejects the websocket handshake.
+            return await send({"type": "websocket.close", "code": 1008})
+
+        await send({"type": "http.response.start", "status": status, "headers": _JSON_HEADERS})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _start(self) -> None:
+        # Concurrent first requests all wait for the same start, so none
+        # of them use the client before it is ready.
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._client.start())
+
+        starting = self._starting
+
+        try:
+            await asyncio.shield(starting)
+        except BaseException:
+            if starting.done() and self._starting is starting:
+                # Let the next request retry a start that failed.
+                self._starting = None
+
+            raise
+
+        self._started = True
+
+    async def _close(self) -> None:
+        self._started = False
+        self._starting = None
+
+        if self._owns_client:
+            await self._client.close()
+
+    def _wrap_receive(self, receive: ReceiveT) -> ReceiveT:
+        async def inner() -> MessageT:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await self._start()
+
+            return message
+
+        return inner
+
+    def _wrap_send(self, send: SendT) -> SendT:
+        async def inner(message: MessageT) -> None:
+            if message["type"] == "lifespan.shutdown.complete":
+                await self._close()
+
+            await send(message)
+
+        return inner
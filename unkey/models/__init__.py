@@ -3,17 +3,22 @@ from .base import *
 from .apis import *
 from .http import *
 from .keys import *
+from .table import *
 
 __all__ = (
     "Api",
     "ApiKey",
     "ApiKeyList",
     "ApiKeyMeta",
+    "ApiKeyTable",
     "ApiKeyVerification",
     "BaseEnum",
     "BaseModel",
+    "CompactApiKeyMeta",
     "ErrorCode",
     "HttpResponse",
+    "LazyApiKeyMeta",
+    "LazyModel",
     "Ratelimit",
     "RatelimitState",
     "RatelimitType",
@@ -1,26 +1,149 @@
 from __future__ import annotations
 
+import json
 import typing as t
 from enum import Enum
 
 import attrs
 
-__all__ = ("BaseEnum", "BaseModel")
+__all__ = ("BaseEnum", "BaseModel", "LazyModel")
 
 T = t.TypeVar("T", bound="BaseEnum")
+DictT = t.Dict[str, t.Any]
+LoadersT = t.Mapping[str, t.Callable[[DictT], t.Any]]
+"""The type of the mapping used by lazy models to load their fields."""
+
+_TO_DICT: t.Dict[type, t.Callable[[t.Any], DictT]] = {}
+_SCALARS = (bool, float, int, str)
+
+
+def _copy(value: t.Any) -> t.Any:
+    # Matches how attrs.asdict copies values it knows nothing about. The
+    # class is checked rather than the value, so the value stays `Any`.
+    cls: t.Type[t.Any] = value.__class__
+
+    if issubclass(cls, dict):
+        return {_copy(k): _copy(v) for k, v in value.items()}
+
+    if issubclass(cls, (list, tuple, set, frozenset)):
+        return value.__class__([_copy(v) for v in value])
+
+    if attrs.has(cls):
+        return _to_dict(value)
+
+    return value
+
+
+def _to_dict(model: t.Any) -> DictT:
+    cls: t.Type[t.Any] = model.__class__
+
+    if (func := _TO_DICT.get(cls)) is None:
+        func = _TO_DICT[cls] = _generate_to_dict(cls)
+
+    return func(model)
+
+
+def _value_code(var: str, hint: t.Any) -> str:
+    args = t.get_args(hint)
+    origin = t.get_origin(hint)
+
+    if origin is t.Union and len(args) == 2 and type(None) in args:
+        inner = _value_code("v", args[0] if args[1] is type(None) else args[1])
+        return var if inner == "v" else f"(None if (v := {var}) is None else {inner})"
+
+    if hint in _SCALARS or (isinstance(hint, type) and issubclass(hint, Enum)):
+        return var
+
+    if isinstance(hint, type) and attrs.has(hint):
+        return f"_to_dict({var})"
+
+    if origin is list and args and isinstance(args[0], type) and attrs.has(args[0]):
+        return f"[_to_dict(x) for x in {var}]"
+
+    return f"_copy({var})"
+
+
+def _generate_to_dict(cls: type) -> t.Callable[[t.Any], DictT]:
+    # Each model gets a function that builds its dictionary directly,
+    # since the field types are known up front. The output matches
+    # attrs.asdict.
+    hints = t.get_type_hints(cls)
+    items = ", ".join(
+        f"{f.name!r}: {_value_code(f'o.{f.name}', hints.get(f.name, t.Any))}"
+        for f in attrs.fields(cls)
+    )
+
+    namespace = {"_copy": _copy, "_to_dict": _to_dict}
+    exec(f"def to_dict(o):\n    return {{{items}}}", namespace)
+    func: t.Callable[[t.Any], DictT] = namespace["to_dict"]
+    return func
+
+
+def _json_default(value: t.Any) -> t.Any:
+    if isinstance(value, Enum):
+        return value.value
+
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_json_default)
 
 
 @attrs.define(weakref_slot=False)
 class BaseModel:
     """The base model all library models inherit from."""
 
-    def to_dict(self) -> t.Dict[str, t.Any]:
+    def to_dict(self) -> DictT:
         """Converts this class into a dictionary.
 
         Returns:
             The requested dictionary.
         """
-        return attrs.asdict(self)
+        return _to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Converts this class into compact JSON, with enums encoded
+        as their values.
+
+        Returns:
+            The UTF-8 encoded JSON.
+        """
+        return _ENCODER.encode(self.to_dict()).encode()
+
+
+class LazyModel:
+    """A mixin for models that wrap the raw data from the API and only
+    convert each field the first time it is accessed.
+
+    Converted fields are stored on the model, so each field is only
+    converted once.
+
+    Args:
+        raw: The raw data from the API.
+
+        loaders: A mapping of field names to functions that convert the
+            raw data into the fields value.
+    """
+
+    __slots__ = ()
+
+    _raw: t.Dict[str, t.Any]
+    _loaders: LoadersT
+
+    def __init__(self, raw: t.Dict[str, t.Any], loaders: LoadersT) -> None:
+        # The slots are declared by each concrete lazy model, since
+        # they can not be shared with the slotted model it extends.
+        self._raw = raw  # type: ignore[misc]
+        self._loaders = loaders  # type: ignore[misc]
+
+    def __getattr__(self, name: str) -> t.Any:
+        # Only called when the field has not been set yet.
+        if name.startswith("_") or (loader := self._loaders.get(name)) is None:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+        value = loader(self._raw)
+        setattr(self, name, value)
+        return value
 
 
 class BaseEnum(Enum):
@@ -43,13 +166,13 @@ class BaseEnum(Enum):
         Returns:
             The generated enum.
         """
-        try:
-            return cls(value)
-        except ValueError as e:
-            raise ValueError(
-                f"{e} variant. Please report this issue on github at "
-                "https://github.com/Jonxslays/unkey.py/issues/new"
-            ) from None
+        if (member := cls.from_str_maybe(value)) is not None:
+            return member
+
+        raise ValueError(
+            f"{value!r} is not a valid {cls.__name__} variant. Please report this issue "
+            "on github at https://github.com/Jonxslays/unkey.py/issues/new"
+        )
 
     @classmethod
     def from_str_maybe(cls: t.Type[T], value: t.Optional[str]) -> t.Optional[T]:
@@ -63,6 +186,9 @@ class BaseEnum(Enum):
                 enum variant.
         """
         try:
-            return cls(value)
-        except ValueError:
+            # The value to member mapping is built once when the enum
+            # class is created, avoiding an exception for every miss.
+            return cls._value2member_map_.get(value)  # type: ignore[return-value]
+        except TypeError:
+            # Unhashable values can never be a variant.
             return None
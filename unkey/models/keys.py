@@ -6,12 +6,15 @@ import attrs
 
 from .base import BaseEnum
 from .base import BaseModel
+from .base import LazyModel
 from .http import ErrorCode
 
 __all__ = (
     "ApiKey",
     "ApiKeyMeta",
     "ApiKeyVerification",
+    "CompactApiKeyMeta",
+    "LazyApiKeyMeta",
     "Ratelimit",
     "RatelimitState",
     "RatelimitType",
@@ -110,6 +113,24 @@ class ApiKeyMeta(BaseModel):
     """The keys refill state, if any."""
 
 
+class LazyApiKeyMeta(LazyModel, ApiKeyMeta):
+    """An `ApiKeyMeta` that converts its fields from the raw data on
+    first access.
+    """
+
+    __slots__ = ("_loaders", "_raw")
+
+
+@attrs.frozen(weakref_slot=False)
+class CompactApiKeyMeta(ApiKeyMeta):
+    """A frozen `ApiKeyMeta`, produced for the keys of an `ApiKeyList`
+    when the `Serializer` is created with `compact=True`.
+
+    Instances are built in a single constructor call rather than one
+    attribute at a time, and can not be modified afterwards.
+    """
+
+
 @attrs.define(init=False, weakref_slot=False)
 class ApiKeyVerification(BaseModel):
     """Data about whether this api key and its validity."""
@@ -150,21 +171,19 @@ class ApiKeyVerification(BaseModel):
     error: t.Optional[str]
     """The error message if the key was invalid."""
 
-    @staticmethod
-    def __internal_serialize(_: type, __: t.Any, value: t.Any) -> t.Any:
-        if isinstance(value, ErrorCode):
-            # Automatically convert ErrorCodes to strings for to_dict()
-            return str(value)
-
-        return value
-
     def to_dict(self) -> t.Dict[str, t.Any]:
         """Converts this class into a dictionary.
 
         Returns:
             The requested dictionary.
         """
-        return attrs.asdict(self, value_serializer=self.__internal_serialize)
+        data = super().to_dict()
+
+        if data["code"] is not None:
+            # Automatically convert ErrorCodes to strings for to_dict()
+            data["code"] = str(data["code"])
+
+        return data
 
 
 @attrs.define(init=False, weakref_slot=False)
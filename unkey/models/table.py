@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import typing as t
+from array import array
+
+__all__ = ("ApiKeyTable",)
+
+NULL: t.Final[int] = -1
+"""The value stored in integer columns for missing values."""
+
+_INT_COLUMNS = ("created_at", "expires", "remaining")
+_STR_COLUMNS = ("id", "api_id", "workspace_id", "start", "owner_id")
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(name: str) -> t.Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+class ApiKeyTable:
+    """A columnar representation of many api keys.
+
+    Rather than one `ApiKeyMeta` per key, each field is stored in its own
+    column. Integer columns are compact `array`s where missing values are
+    stored as `-1`. The `meta`, `ratelimit` and `refill` fields are not
+    included.
+
+    If NumPy is installed, filtering is vectorized over zero copy views
+    of the integer columns.
+    """
+
+    __slots__ = (
+        "api_id",
+        "created_at",
+        "expires",
+        "id",
+        "owner_id",
+        "remaining",
+        "start",
+        "workspace_id",
+    )
+
+    id: t.List[str]
+    """The ids of the keys."""
+
+    api_id: t.List[str]
+    """The ids of the apis the keys belong to."""
+
+    workspace_id: t.List[str]
+    """The ids of the workspaces the keys belong to."""
+
+    start: t.List[str]
+    """The prefixes and beginning characters of the keys."""
+
+    owner_id: t.List[t.Optional[str]]
+    """The owners of the keys, if they were specified."""
+
+    created_at: array[int]
+    """The unix epochs in milliseconds when the keys were created."""
+
+    expires: array[int]
+    """The unix epochs in milliseconds when the keys expire, or `-1`."""
+
+    remaining: array[int]
+    """The remaining verifications of the keys, or `-1`."""
+
+    def __init__(self) -> None:
+        for column in _STR_COLUMNS:
+            setattr(self, column, [])
+
+        for column in _INT_COLUMNS:
+            setattr(self, column, array("q"))
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"ApiKeyTable(rows={len(self)})"
+
+    def append(
+        self,
+        id: str,
+        api_id: str,
+        workspace_id: str,
+        start: str,
+        owner_id: t.Optional[str],
+        created_at: int,
+        expires: t.Optional[int],
+        remaining: t.Optional[int],
+    ) -> None:
+        """Appends a single key to the table.
+
+        Args:
+            id: The id of the key.
+
+            api_id: The id of the api the key belongs to.
+
+            workspace_id: The id of the workspace the key belongs to.
+
+            start: The prefix and beginning characters of the key.
+
+            owner_id: The owner of the key, if any.
+
+            created_at: The unix epoch in milliseconds when the key
+                was created.
+
+            expires: The unix epoch in milliseconds when the key
+                expires, if it does.
+
+            remaining: The remaining verifications of the key, if any.
+        """
+        self.id.append(id)
+        self.api_id.append(api_id)
+        self.workspace_id.append(workspace_id)
+        self.start.append(start)
+        self.owner_id.append(owner_id)
+        self.created_at.append(created_at)
+        self.expires.append(NULL if expires is None else expires)
+        self.remaining.append(NULL if remaining is None else remaining)
+
+    def take(self, indices: t.Iterable[int]) -> ApiKeyTable:
+        """Creates a new table from the rows at the given indices.
+
+        Args:
+            indices: The indices of the rows to take.
+
+        Returns:
+            The new table.
+        """
+        indices = list(indices)
+        table = ApiKeyTable()
+
+        for column in _STR_COLUMNS:
+            values = getattr(self, column)
+            setattr(table, column, [values[i] for i in indices])
+
+        for column in _INT_COLUMNS:
+            values = getattr(self, column)
+            setattr(table, column, array("q", [values[i] for i in indices]))
+
+        return table
+
+    def _where(self, column: str, value: int) -> ApiKeyTable:
+        values: array[int] = getattr(self, column)
+
+        if (np := _optional_import("numpy")) is not None:
+            view = np.frombuffer(values, dtype=np.int64)
+            return self.take(np.flatnonzero((view != NULL) & (view < value)).tolist())
+
+        return self.take(i for i, v in enumerate(values) if v != NULL and v < value)
+
+    def expires_before(self, timestamp: int) -> ApiKeyTable:
+        """Filters the table to keys that expire before the given time.
+        Keys that never expire are excluded.
+
+        Args:
+            timestamp: The unix epoch in milliseconds.
+
+        Returns:
+            A new table containing only the matching keys.
+        """
+        return self._where("expires", timestamp)
+
+    def remaining_below(self, value: int) -> ApiKeyTable:
+        """Filters the table to keys with fewer remaining verifications
+        than the given value. Keys without a remaining limit are excluded.
+
+        Args:
+            value: The exclusive upper bound.
+
+        Returns:
+            A new table containing only the matching keys.
+        """
+        return self._where("remaining", value)
+
+    def created_before(self, timestamp: int) -> ApiKeyTable:
+        """Filters the table to keys created before the given time.
+
+        Args:
+            timestamp: The unix epoch in milliseconds.
+
+        Returns:
+            A new table containing only the matching keys.
+        """
+        return self._where("created_at", timestamp)
+
+    def to_numpy(self) -> t.Dict[str, t.Any]:
+        """Converts the table into NumPy arrays. Requires NumPy.
+
+        Integer columns are zero copy views over the table.
+
+        Returns:
+            A mapping of column names to arrays.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if (np := _optional_import("numpy")) is None:
+            raise RuntimeError("NumPy must be installed to use ApiKeyTable.to_numpy.")
+
+        columns = {c: np.array(getattr(self, c), dtype=object) for c in _STR_COLUMNS}
+        columns.update({c: np.frombuffer(getattr(self, c), dtype=np.int64) for c in _INT_COLUMNS})
+        return columns
+
+    def to_arrow(self) -> t.Any:
+        """Converts the table into a `pyarrow.Table`. Requires pyarrow.
+
+        Missing integer values become nulls.
+
+        Returns:
+            The arrow table.
+
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+        """
+        if (pa := _optional_import("pyarrow")) is None:
+            raise RuntimeError("pyarrow must be installed to use ApiKeyTable.to_arrow.")
+
+        columns = {c: pa.array(getattr(self, c), type=pa.string()) for c in _STR_COLUMNS}
+
+        for column in _INT_COLUMNS:
+            values = getattr(self, column)
+            columns[column] = pa.array([None if v == NULL else v for v in values], pa.int64())
+
+        return pa.table(columns)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import string
+import time
+import typing as t
+from collections import OrderedDict
+
+__all__ = ("KeyPrefilter",)
+
+DictT = t.Dict[str, t.Any]
+
+DEFAULT_CHARSET: t.Final[str] = string.ascii_letters + string.digits + "_"
+"""The characters that can appear in keys created by unkey."""
+
+
+class KeyPrefilter:
+    """Rejects keys that can never be valid without contacting unkey.
+
+    Keys are checked against their expected shape, then against a
+    bounded cache of keys that unkey recently reported as not found.
+    Rejected keys produce a synthetic `NOT_FOUND` verification.
+
+    Keyword Args:
+        prefixes: The prefixes keys are expected to start with,
+            including the separator, i.e. `"sk_"`. Defaults to
+            allowing any prefix.
+
+        min_length: The optional minimum length of a key.
+
+        max_length: The optional maximum length of a key.
+
+        charset: The characters a key may contain. Defaults to
+            ascii letters, digits and underscores.
+
+        negative_cache_size: The maximum number of not found keys to
+            remember. Set to 0 to disable. Defaults to 10,000.
+
+        negative_ttl: The number of seconds a not found key is
+            remembered for. Defaults to 300.
+    """
+
+    __slots__ = (
+        "_max_length",
+        "_min_length",
+        "_missing",
+        "_negative_cache_size",
+        "_negative_ttl",
+        "_pattern",
+        "_prefixes",
+    )
+
+    NOT_FOUND: t.Final[DictT] = {"valid": False, "code": "NOT_FOUND", "error": "Key not found"}
+    """The payload used for rejected keys."""
+
+    def __init__(
+        self,
+        *,
+        prefixes: t.Iterable[str] = (),
+        min_length: t.Optional[int] = None,
+        max_length: t.Optional[int] = None,
+        charset: str = DEFAULT_CHARSET,
+        negative_cache_size: int = 10_000,
+        negative_ttl: float = 300,
+    ) -> None:
+        if min_length and max_length and min_length > max_length:
+            raise ValueError("Prefilter min_length must not exceed max_length.")
+
+        self._prefixes = tuple(prefixes)
+        self._min_length = min_length or 1
+        self._max_length = max_length
+        self._pattern = re.compile(f"[{re.escape(charset)}]+")
+        self._negative_cache_size = negative_cache_size
+        self._negative_ttl = negative_ttl
+        self._missing: OrderedDict[bytes, float] = OrderedDict()
+
+    @staticmethod
+    def _digest(key: str, api_id: str) -> bytes:
+        return hashlib.blake2b(f"{api_id}:{key}".encode(), digest_size=16).digest()
+
+    def is_well_formed(self, key: str) -> bool:
+        """Whether or not the key has the shape of a real key.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            `True` if the key passes the prefix, length, and charset
+                checks.
+        """
+        length = len(key)
+
+        if length < self._min_length or (self._max_length and length > self._max_length):
+            return False
+
+        if self._prefixes and not key.startswith(self._prefixes):
+            return False
+
+        return self._pattern.fullmatch(key) is not None
+
+    def rejects(self, key: str, api_id: str) -> bool:
+        """Whether or not the key can be rejected without contacting
+        unkey.
+
+        Args:
+            key: The key to check.
+
+            api_id: The id of the api the key is being verified for.
+
+        Returns:
+            `True` if the key is malformed or was recently not found.
+        """
+        if not self.is_well_formed(key):
+            return True
+
+        if not self._missing:
+            return False
+
+        digest = self._digest(key, api_id)
+
+        if (expires_at := self._missing.get(digest)) is None:
+            return False
+
+        if expires_at > time.time():
+            return True
+
+        del self._missing[digest]
+        return False
+
+    def remember_not_found(self, key: str, api_id: str) -> None:
+        """Remembers that unkey reported the key as not found.
+
+        Args:
+            key: The key that was not found.
+
+            api_id: The id of the api the key was verified for.
+        """
+        if self._negative_cache_size < 1:
+            return None
+
+        digest = self._digest(key, api_id)
+        self._missing[digest] = time.time() + self._negative_ttl
+        self._missing.move_to_end(digest)
+
+        if len(self._missing) > self._negative_cache_size:
+            self._missing.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forgets every remembered not found key."""
+        self._missing.clear()
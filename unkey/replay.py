@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+import typing as t
+
+import attrs
+
+from unkey import constants
+from unkey import models
+from unkey import result
+from unkey import routes
+from unkey import transports
+
+if t.TYPE_CHECKING:  # pragma: nocover
+    from unkey import client as client_
+
+__all__ = ("ReplayStats", "TrafficReplayer")
+
+DictT = t.Dict[str, t.Any]
+ResultT = result.Result[t.Any, models.HttpResponse]
+CallT = t.Callable[["client_.Client", DictT], t.Awaitable[ResultT]]
+
+_VERSION = re.compile(r"^/v\d+(?=/)")
+
+
+def _percentile(values: t.List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def _floats() -> t.List[float]:
+    return []
+
+
+def _counts() -> t.Dict[str, int]:
+    return {}
+
+
+@attrs.define(weakref_slot=False)
+class ReplayStats:
+    """The outcome of replaying recorded traffic."""
+
+    requests: int = 0
+    """The number of requests replayed."""
+
+    recorded_requests: int = 0
+    """The number of requests in the recording."""
+
+    skipped: int = 0
+    """The number of recorded writes that were not replayed."""
+
+    duration: float = 0.0
+    """The seconds the replay took."""
+
+    recorded_duration: float = 0.0
+    """The seconds the recorded traffic took."""
+
+    latencies: t.List[float] = attrs.field(factory=_floats)
+    """The latency of each replayed request in seconds, sorted."""
+
+    recorded_latencies: t.List[float] = attrs.field(factory=_floats)
+    """The recorded latency of each request in seconds, sorted."""
+
+    errors: t.Dict[str, int] = attrs.field(factory=_counts)
+    """The number of failed requests by error code."""
+
+    @property
+    def throughput(self) -> float:
+        """The replayed requests per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def recorded_throughput(self) -> float:
+        """The recorded requests per second."""
+        if not self.recorded_duration:
+            return 0.0
+
+        return self.recorded_requests / self.recorded_duration
+
+    def percentile(self, percent: float, *, recorded: bool = False) -> float:
+        """Gets a latency percentile.
+
+        Args:
+            percent: The percentile to get, i.e. 99.
+
+        Keyword Args:
+            recorded: Whether or not to use the recorded latencies
+                instead of the replayed ones. Defaults to `False`.
+
+        Returns:
+            The latency in seconds.
+        """
+        return _percentile(self.recorded_latencies if recorded else self.latencies, percent)
+
+
+def _verify_key(client: client_.Client, exchange: DictT) -> t.Awaitable[ResultT]:
+    payload = exchange["payload"]
+    return client.keys.verify_key(payload["key"], payload["apiId"])
+
+
+def _get_key(client: client_.Client, exchange: DictT) -> t.Awaitable[ResultT]:
+    return client.keys.get_key(exchange["params"]["keyId"])
+
+
+def _get_api(client: client_.Client, exchange: DictT) -> t.Awaitable[ResultT]:
+    return client.apis.get_api(exchange["params"]["apiId"])
+
+
+class TrafficReplayer:
+    """Replays traffic recorded by a `RecordingTransport` through a
+    client, to measure how its configuration handles a real traffic
+    shape.
+
+    Key verifications and key and api lookups are replayed through the
+    client's services, so its caches and prefilter are exercised. Other
+    reads are sent as recorded. Writes, such as creating, updating or
+    deleting keys, are skipped unless `include_writes` is enabled.
+
+    Args:
+        client: The started client to replay the traffic through.
+
+    Keyword Args:
+        speed: How many times faster than recorded to send requests.
+            `None` sends them as fast as the concurrency allows.
+            Defaults to 1, the recorded timings.
+
+        concurrency: The maximum number of requests in flight.
+            Defaults to 100.
+
+        include_writes: Whether or not to also replay requests that
+            change keys or apis on the target. Defaults to `False`.
+    """
+
+    __slots__ = ("_client", "_concurrency", "_include_writes", "_speed")
+
+    _CALLS: t.Dict[t.Tuple[str, str], CallT] = {
+        (routes.VERIFY_KEY.method, routes.VERIFY_KEY.uri): _verify_key,
+        (routes.GET_KEY.method, routes.GET_KEY.uri): _get_key,
+        (routes.GET_API.method, routes.GET_API.uri): _get_api,
+    }
+
+    def __init__(
+        self,
+        client: client_.Client,
+        *,
+        speed: t.Optional[float] = 1.0,
+        concurrency: int = 100,
+        include_writes: bool = False,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be greater than 0.")
+
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+
+        self._client = client
+        self._speed = speed
+        self._concurrency = concurrency
+        self._include_writes = include_writes
+
+    def _is_write(self, exchange: DictT) -> bool:
+        method, uri = exchange["method"], _VERSION.sub("", exchange["path"])
+        return method != constants.GET and (method, uri) not in self._CALLS
+
+    async def _send(self, exchange: DictT) -> t.Optional[models.HttpResponse]:
+        method, uri = exchange["method"], _VERSION.sub("", exchange["path"])
+
+        if (call := self._CALLS.get((method, uri))) is not None:
+            try:
+                pending = call(self._client, exchange)
+            except (KeyError, TypeError):
+                # The recorded arguments did not fit the service method,
+                # so the request is sent as recorded instead.
+                pass
+            else:
+                outcome = await pending
+                return outcome.unwrap_err() if outcome.is_err else None
+
+        route = routes.Route(method, uri).compile().with_params(exchange["params"])
+        data = await self._client.http.fetch(route, payload=exchange["payload"])
+        return data if isinstance(data, models.HttpResponse) else None
+
+    async def replay_file(self, path: str) -> ReplayStats:
+        """Replays a recording.
+
+        Args:
+            path: The path of the recording.
+
+        Returns:
+            The replay statistics.
+        """
+        return await self.replay(transports.RecordingTransport.load(path))
+
+    async def replay(self, exchanges: t.Sequence[DictT]) -> ReplayStats:
+        """Replays recorded exchanges.
+
+        Args:
+            exchanges: The exchanges to replay, in the order they were
+                recorded.
+
+        Returns:
+            The replay statistics.
+        """
+        stats = ReplayStats(recorded_requests=len(exchanges))
+
+        if not exchanges:
+            return stats
+
+        first = exchanges[0]["at"]
+        stats.recorded_duration = max(e["at"] + e["elapsed"] for e in exchanges) - first
+        stats.recorded_latencies = sorted(e["elapsed"] for e in exchanges)
+
+        if not self._include_writes:
+            replayed = [e for e in exchanges if not self._is_write(e)]
+            stats.skipped = len(exchanges) - len(replayed)
+            exchanges = replayed
+
+        stats.requests = len(exchanges)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks: t.Set[asyncio.Task[None]] = set()
+
+        async def send(exchange: DictT) -> None:
+            sent = time.perf_counter()
+            code: t.Optional[str] = None
+
+            try:
+                error = await self._send(exchange)
+            except Exception as e:
+                code = type(e).__name__
+            else:
+                if error is not None:
+                    code = str(error.code or error.status)
+            finally:
+                stats.latencies.append(time.perf_counter() - sent)
+                semaphore.release()
+
+            if code is not None:
+                stats.errors[code] = stats.errors.get(code, 0) + 1
+
+        start = time.perf_counter()
+
+        for exchange in exchanges:
+            if self._speed is not None:
+                due = start + (exchange["at"] - first) / self._speed
+
+                if (delay := due - time.perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+
+            # Waiting for a free slot delays the following requests, the
+            # same way a saturated connection pool would.
+            await semaphore.acquire()
+            task = asyncio.ensure_future(send(exchange))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        stats.duration = time.perf_counter() - start
+        stats.latencies.sort()
+        return stats
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import types
 import typing as t
 
 import attrs
@@ -8,6 +9,8 @@ from unkey import constants as c
 
 __all__ = ("CompiledRoute", "Route")
 
+_NO_PARAMS: t.Mapping[str, t.Union[str, int]] = types.MappingProxyType({})
+
 
 @attrs.define(weakref_slot=False)
 class CompiledRoute:
@@ -62,6 +65,15 @@ class Route:
     uri: str
     """The request uri."""
 
+    @property
+    def params(self) -> t.Mapping[str, t.Union[str, int]]:
+        """The query params for the route, which is always empty.
+
+        Routes without uri variables or query params can be fetched
+        without being compiled.
+        """
+        return _NO_PARAMS
+
     def compile(self, *args: t.Union[str, int]) -> CompiledRoute:
         """Turn this route into a compiled route.
 
@@ -90,3 +102,6 @@ GET_KEY: t.Final[Route] = Route(c.GET, "/keys.getKey")
 # Apis
 GET_API: t.Final[Route] = Route(c.GET, "/apis.getApi")
 GET_KEYS: t.Final[Route] = Route(c.GET, "/apis.listKeys")
+
+# Health
+LIVENESS: t.Final[Route] = Route(c.GET, "/liveness")
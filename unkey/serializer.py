@@ -13,9 +13,95 @@ TransformT = t.Optional[t.Callable[[t.Any], t.Any]]
 
 
 class Serializer:
-    """Deserializes JSON data into wom.py model classes."""
+    """Deserializes JSON data into unkey.py model classes.
 
-    __slots__ = ()
+    Keyword Args:
+        lazy: Whether or not large listings, such as the keys in an
+            `ApiKeyList`, should produce lazy models that only convert
+            the fields that are accessed. Defaults to `False`.
+
+        compact: Whether or not the keys in an `ApiKeyList` should be
+            produced as frozen `CompactApiKeyMeta` models. Can not be
+            combined with `lazy`. Defaults to `False`.
+
+        intern: Whether or not repeated `api_id`, `workspace_id` and
+            `owner_id` strings of keys should share a single string
+            object. Defaults to `False`.
+
+        intern_maxsize: The maximum number of distinct strings kept for
+            interning. Once full, new strings are no longer interned.
+            Defaults to 10,000.
+    """
+
+    __slots__ = ("_api_key_meta_loaders", "_compact", "_interned", "_intern_maxsize", "_lazy")
+
+    def __init__(
+        self,
+        *,
+        lazy: bool = False,
+        compact: bool = False,
+        intern: bool = False,
+        intern_maxsize: int = 10_000,
+    ) -> None:
+        if lazy and compact:
+            raise ValueError("Only one of 'lazy' and 'compact' may be used.")
+
+        self._lazy = lazy
+        self._compact = compact
+        self._interned: t.Optional[t.Dict[str, str]] = {} if intern else None
+        self._intern_maxsize = intern_maxsize
+        self._api_key_meta_loaders = self._generate_api_key_meta_loaders()
+
+    @property
+    def lazy(self) -> bool:
+        """Whether or not this serializer produces lazy models."""
+        return self._lazy
+
+    @property
+    def compact(self) -> bool:
+        """Whether or not this serializer produces compact models."""
+        return self._compact
+
+    @property
+    def intern(self) -> bool:
+        """Whether or not this serializer interns repeated strings."""
+        return self._interned is not None
+
+    def _intern(self, value: t.Any) -> t.Any:
+        if value is None or (interned := self._interned) is None:
+            return value
+
+        if (existing := interned.get(value)) is not None:
+            return existing
+
+        if len(interned) < self._intern_maxsize:
+            interned[value] = value
+
+        return value
+
+    def _generate_api_key_meta_loaders(self) -> models.base.LoadersT:
+        attrs = ("id", "meta", "start", "expires", "remaining", "created_at")
+
+        def load(cased_attr: str) -> t.Callable[[DictT], t.Any]:
+            return lambda data: data.get(cased_attr)
+
+        def load_interned(cased_attr: str) -> t.Callable[[DictT], t.Any]:
+            return lambda data: self._intern(data.get(cased_attr))
+
+        def load_ratelimit(data: DictT) -> t.Optional[models.Ratelimit]:
+            return self.to_ratelimit(ratelimit) if (ratelimit := data.get("ratelimit")) else None
+
+        def load_refill(data: DictT) -> t.Optional[models.Refill]:
+            return self.to_refill(refill) if (refill := data.get("refill")) else None
+
+        loaders = {attr: load(self.to_camel_case(attr)) for attr in attrs}
+        loaders.update(
+            {
+                attr: load_interned(self.to_camel_case(attr))
+                for attr in ("api_id", "owner_id", "workspace_id")
+            }
+        )
+        return {**loaders, "ratelimit": load_ratelimit, "refill": load_refill}
 
     def _dt_from_iso(self, timestamp: str) -> datetime:
         return datetime.fromisoformat(timestamp.rstrip("Z"))
@@ -77,8 +163,9 @@ class Serializer:
         model.refill = self.to_refill(refill) if refill else refill
 
         model.code = models.ErrorCode.from_str_maybe(data.get("code", ""))
+        model.owner_id = self._intern(data.get("ownerId"))
         self._set_attrs_cased(
-            model, data, "valid", "owner_id", "meta", "remaining", "error", "expires", maybe=True
+            model, data, "valid", "meta", "remaining", "error", "expires", maybe=True
         )
 
         return model
@@ -110,30 +197,71 @@ class Serializer:
         refill = data.get("refill")
         model.refill = self.to_refill(refill) if refill else refill
 
+        model.api_id = self._intern(data.get("apiId"))
+        model.owner_id = self._intern(data.get("ownerId"))
+        model.workspace_id = self._intern(data.get("workspaceId"))
         self._set_attrs_cased(
-            model,
-            data,
-            "id",
-            "meta",
-            "start",
-            "api_id",
-            "expires",
-            "remaining",
-            "owner_id",
-            "created_at",
-            "workspace_id",
-            maybe=True,
+            model, data, "id", "meta", "start", "expires", "remaining", "created_at", maybe=True
         )
 
         return model
 
+    def to_compact_api_key_meta(self, data: DictT) -> models.CompactApiKeyMeta:
+        # Missing fields become None, the same as in `to_api_key_meta`.
+        get = t.cast(t.Callable[[str], t.Any], data.get)
+        ratelimit = get("ratelimit")
+        refill = get("refill")
+
+        return models.CompactApiKeyMeta(
+            id=get("id"),
+            api_id=self._intern(get("apiId")),
+            workspace_id=self._intern(get("workspaceId")),
+            start=get("start"),
+            created_at=get("createdAt"),
+            owner_id=self._intern(get("ownerId")),
+            expires=get("expires"),
+            ratelimit=self.to_ratelimit(ratelimit) if ratelimit else ratelimit,
+            meta=get("meta"),
+            remaining=get("remaining"),
+            refill=self.to_refill(refill) if refill else refill,
+        )
+
     def to_api_key_list(self, data: DictT) -> models.ApiKeyList:
         model = models.ApiKeyList()
         model.cursor = data.get("cursor")
         model.total = data["total"]
-        model.keys = [self.to_api_key_meta(key) for key in data["keys"]]
+
+        if self._lazy:
+            loaders = self._api_key_meta_loaders
+            model.keys = [models.LazyApiKeyMeta(key, loaders) for key in data["keys"]]
+        elif self._compact:
+            model.keys = [self.to_compact_api_key_meta(key) for key in data["keys"]]
+        else:
+            model.keys = [self.to_api_key_meta(key) for key in data["keys"]]
+
         return model
 
+    def to_api_key_table(
+        self, data: DictT, table: t.Optional[models.ApiKeyTable] = None
+    ) -> models.ApiKeyTable:
+        table = models.ApiKeyTable() if table is None else table
+        append = table.append
+        intern = self._intern
+
+        for key in data["keys"]:
+            append(
+                key["id"],
+                intern(key.get("apiId")),
+                intern(key.get("workspaceId")),
+                key.get("start"),
+                intern(key.get("ownerId")),
+                key.get("createdAt"),
+                key.get("expires"),
+                key.get("remaining"),
+            )
+
+        return table
+
     def to_refill(self, data: DictT) -> models.Refill:
         interval = models.RefillInterval.from_str(data["interval"])
         amount = data["amount"]
@@ -30,6 +30,9 @@ class ApiService(BaseService):
         Returns:
             A result containing the requested information or an error.
         """
+        if self._resource_cache and (cached := self._resource_cache.get_api(api_id)):
+            return result.Ok(self._serializer.to_api(cached))
+
         params = self._generate_map(apiId=api_id)
         route = routes.GET_API.compile().with_params(params)
         data = await self._http.fetch(route)
@@ -37,7 +40,10 @@ class ApiService(BaseService):
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
-        return result.Ok(self._serializer.to_api(data))
+        if self._resource_cache:
+            self._resource_cache.store_api(api_id, data)
+
+        return result.Ok(self._deserialize(self._serializer.to_api, data))
 
     async def list_keys(
         self,
@@ -62,11 +68,89 @@ class ApiService(BaseService):
         Returns:
             A result containing api key list or an error.
         """
-        params = self._generate_map(apiId=api_id, ownerId=owner_id, limit=limit, cursor=cursor)
-        route = routes.GET_KEYS.compile().with_params(params)
-        data = await self._http.fetch(route)
+        data = await self._fetch_keys_page(api_id, owner_id, limit, cursor)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
-        return result.Ok(self._serializer.to_api_key_list(data))
+        return result.Ok(self._deserialize(self._serializer.to_api_key_list, data))
+
+    async def list_keys_raw(
+        self,
+        api_id: str,
+        *,
+        owner_id: UndefinedOr[str] = UNDEFINED,
+        limit: UndefinedOr[int] = UNDEFINED,
+        cursor: UndefinedOr[str] = UNDEFINED,
+    ) -> ResultT[t.Dict[str, t.Any]]:
+        """Gets a paginated list of keys for the given api, as the JSON
+        data returned by the api instead of models.
+
+        Args:
+            api_id: The id of the api.
+
+        Keyword Args:
+            owner_id: The optional owner id to list the keys for.
+
+            limit: The optional max number of keys to include in this page.
+
+            cursor: Optional key used to determine pagination offset.
+
+        Returns:
+            A result containing the JSON data of the page or an error.
+        """
+        data = await self._fetch_keys_page(api_id, owner_id, limit, cursor)
+
+        if isinstance(data, models.HttpResponse):
+            return result.Err(data)
+
+        return result.Ok(data)
+
+    async def list_keys_table(
+        self,
+        api_id: str,
+        *,
+        owner_id: UndefinedOr[str] = UNDEFINED,
+        limit: UndefinedOr[int] = UNDEFINED,
+        table: t.Optional[models.ApiKeyTable] = None,
+    ) -> ResultT[models.ApiKeyTable]:
+        """Gets every key for the given api, walking all pages into a
+        columnar table without creating a model per key.
+
+        Args:
+            api_id: The id of the api.
+
+        Keyword Args:
+            owner_id: The optional owner id to list the keys for.
+
+            limit: The optional max number of keys to request per page.
+
+            table: The optional existing table to append the keys to.
+
+        Returns:
+            A result containing the table or an error.
+        """
+        table = models.ApiKeyTable() if table is None else table
+        cursor: UndefinedOr[str] = UNDEFINED
+
+        while True:
+            data = await self._fetch_keys_page(api_id, owner_id, limit, cursor)
+
+            if isinstance(data, models.HttpResponse):
+                return result.Err(data)
+
+            self._serializer.to_api_key_table(data, table)
+
+            if not data["keys"] or not (cursor := data.get("cursor") or UNDEFINED):
+                return result.Ok(table)
+
+    async def _fetch_keys_page(
+        self,
+        api_id: str,
+        owner_id: UndefinedOr[str],
+        limit: UndefinedOr[int],
+        cursor: UndefinedOr[str],
+    ) -> t.Any:
+        params = self._generate_map(apiId=api_id, ownerId=owner_id, limit=limit, cursor=cursor)
+        route = routes.GET_KEYS.compile().with_params(params)
+        return await self._http.fetch(route)
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 import abc
+import time
 import typing as t
-from datetime import datetime
-from datetime import timedelta
 
+from unkey import tracing
 from unkey import undefined
 
 if t.TYPE_CHECKING:  # pragma: nocover
+    from unkey import cache
     from unkey import serializer
 
     from . import HttpService
 
 __all__ = ("BaseService",)
 
+T = t.TypeVar("T")
+
 
 class BaseService(abc.ABC):
     """The base service all API services inherit from.
@@ -23,22 +26,48 @@ class BaseService(abc.ABC):
 
         serializer: The serializer to use for handling incoming
             JSON data from the API.
+
+    Keyword Args:
+        resource_cache: The optional read through cache used for
+            retrieving individual resources.
     """
 
-    __slots__ = ("_http", "_serializer")
+    __slots__ = ("_http", "_resource_cache", "_serializer")
 
-    def __init__(self, http_service: HttpService, serializer: serializer.Serializer) -> None:
+    def __init__(
+        self,
+        http_service: HttpService,
+        serializer: serializer.Serializer,
+        *,
+        resource_cache: t.Optional[cache.ResourceCache] = None,
+    ) -> None:
         self._http = http_service
         self._serializer = serializer
+        self._resource_cache = resource_cache
+
+    @property
+    def resource_cache(self) -> t.Optional[cache.ResourceCache]:
+        """The read through cache used by this service, if any."""
+        return self._resource_cache
+
+    def _deserialize(self, convert: t.Callable[[t.Any], T], data: t.Any) -> T:
+        # Only timed when slow requests are logged, since the time is
+        # recorded to the trace of the request that fetched the data.
+        if self._http.slow_request_log is None:
+            return convert(data)
+
+        start = time.perf_counter()
+        model = convert(data)
+        tracing.record_deserialization(time.perf_counter() - start)
+        return model
 
     def _generate_map(self, **kwargs: t.Any) -> t.Dict[str, t.Any]:
         return {k: v for k, v in kwargs.items() if v is not undefined.UNDEFINED}
 
-    def _expires_in(
-        self, *, milliseconds: int = 0, seconds: int = 0, minutes: int = 0, days: int = 0
-    ) -> undefined.UndefinedOr[int]:
-        if not any({milliseconds, seconds, minutes, days}):
+    def _expires_at(self, milliseconds: t.Optional[int]) -> undefined.UndefinedOr[int]:
+        # The unix epoch in milliseconds, truncated to the second, at
+        # which a key created or updated now with this ttl expires.
+        if not milliseconds:
             return undefined.UNDEFINED
 
-        delta = timedelta(days=days, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
-        return int((datetime.now() + delta).timestamp()) * 1000
+        return int(time.time() + milliseconds / 1000) * 1000
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
+import time
+import types
 import typing as t
-
-import aiohttp
+import urllib.parse
 
 from unkey import constants
 from unkey import models
 from unkey import routes
+from unkey import tracing
+from unkey import transports
 
 __all__ = ("HttpService",)
 
 T = t.TypeVar("T")
+RouteT = t.Union[routes.Route, routes.CompiledRoute]
+PayloadT = t.Union[t.Dict[str, t.Any], bytes]
+
+_NO_PARAMS: t.Mapping[str, t.Any] = types.MappingProxyType({})
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 class HttpService:
@@ -22,15 +33,46 @@ class HttpService:
         api_version: The optional version of the api to use.
 
         api_base_url: The optional api base url to use.
+
+    Keyword Args:
+        dedupe_gets: Whether or not concurrent identical GET requests
+            should share a single network call. Defaults to `False`.
+
+        warm_connections: The number of keep alive connections to open
+            to the api when the service starts, resolving its DNS at the
+            same time. Defaults to 0.
+
+        keep_warm_interval: The optional number of seconds without a
+            request after which `warm_connections` connections are
+            reopened, so a minimum idle pool survives quiet periods.
+            Defaults to `None`, which disables keeping the pool warm.
+
+        transport: The optional transport used to send requests.
+            Defaults to an `AiohttpTransport`.
+
+        slow_request_log: The optional logger for slow and sampled
+            requests. When set, the default transport measures the time
+            spent in each phase of a request. Defaults to `None`.
     """
 
     __slots__ = (
         "_api_version",
         "_base_url",
+        "_closed",
+        "_dedupe_gets",
+        "_drained",
         "_headers",
+        "_in_flight",
+        "_keep_warm_interval",
+        "_keep_warm_task",
+        "_last_request",
         "_ok_responses",
-        "_method_mapping",
-        "_session",
+        "_pending",
+        "_slow_request_log",
+        "_started",
+        "_transport",
+        "_urls",
+        "_warm_connections",
     )
 
     def __init__(
@@ -38,6 +80,12 @@ class HttpService:
         api_key: t.Optional[str],
         api_version: t.Optional[int],
         api_base_url: t.Optional[str],
+        *,
+        dedupe_gets: bool = False,
+        warm_connections: int = 0,
+        keep_warm_interval: t.Optional[float] = None,
+        transport: t.Optional[transports.Transport] = None,
+        slow_request_log: t.Optional[tracing.SlowRequestLogger] = None,
     ) -> None:
         if api_key == "":
             raise ValueError("Api key must not be empty.")
@@ -54,21 +102,88 @@ class HttpService:
         self._ok_responses = {200, 202}
         self._api_version = f"/v{api_version or 1}"
         self._base_url = api_base_url or constants.API_BASE_URL
+        self._dedupe_gets = dedupe_gets
+        self._in_flight: t.Dict[t.Hashable, asyncio.Future[t.Any]] = {}
+        self._warm_connections = warm_connections
+        self._keep_warm_interval = keep_warm_interval
+        self._keep_warm_task: t.Optional[asyncio.Task[None]] = None
+        self._last_request = 0.0
+        self._started = False
+        self._closed = False
+        self._pending = 0
+        self._drained: t.Optional[asyncio.Event] = None
+        self._urls: t.Dict[str, str] = {}
+        self._slow_request_log = slow_request_log
+
+        if transport is None:
+            # Idle connections must outlive the gap between warm ups.
+            keepalive_timeout = max(15.0, (keep_warm_interval or 0) * 2)
+            transport = transports.AiohttpTransport(
+                keepalive_timeout=keepalive_timeout, trace=slow_request_log is not None
+            )
+
+        self._transport = transport
+
+    @property
+    def transport(self) -> transports.Transport:
+        """The transport used to send requests."""
+        return self._transport
+
+    @property
+    def slow_request_log(self) -> t.Optional[tracing.SlowRequestLogger]:
+        """The logger for slow and sampled requests, if any."""
+        return self._slow_request_log
+
+    def _try_get_json(self, response: transports.TransportResponse) -> t.Any:
+        if response.is_json:
+            try:
+                return response.json()
+            except ValueError:
+                pass
 
-    async def _try_get_json(self, response: aiohttp.ClientResponse) -> t.Any:
-        try:
-            return await response.json()
-        except Exception:
-            if response.status not in self._ok_responses:
-                return models.HttpResponse(response.status, await response.text())
+        if response.status not in self._ok_responses:
+            return models.HttpResponse(response.status, response.text())
 
-            return await response.text()
+        return response.text()
 
     async def _request(
-        self, req: t.Callable[..., t.Awaitable[t.Any]], url: str, **kwargs: t.Any
+        self,
+        method: str,
+        url: str,
+        *,
+        params: t.Optional[t.Mapping[str, t.Any]] = None,
+        payload: t.Optional[PayloadT] = None,
     ) -> t.Any:
-        response = await req(url, **kwargs)
-        data = await self._try_get_json(response)
+        if self._closed:
+            raise RuntimeError("HttpService was closed, aborting...")
+
+        self._last_request = time.monotonic()
+        headers: t.Mapping[str, str] = self._headers
+        body = None
+
+        if payload:
+            body = payload if isinstance(payload, bytes) else _ENCODER.encode(payload).encode()
+            headers = {**headers, "Content-Type": "application/json"}
+
+        request = transports.TransportRequest(method, url, headers, params or _NO_PARAMS, body)
+        self._pending += 1
+        sent = time.perf_counter()
+
+        try:
+            response = await self._transport.send(request)
+        finally:
+            self._pending -= 1
+
+            if not self._pending and self._drained is not None:
+                self._drained.set()
+
+        if self._slow_request_log is not None:
+            return self._decode_traced(request, response, time.perf_counter() - sent)
+
+        return self._decode(response)
+
+    def _decode(self, response: transports.TransportResponse) -> t.Any:
+        data = self._try_get_json(response)
 
         if isinstance(data, models.HttpResponse):
             return data
@@ -85,21 +200,47 @@ class HttpService:
 
         return data
 
-    def _get_request_func(self, method: str) -> t.Callable[..., t.Awaitable[t.Any]]:
-        if not hasattr(self, "_method_mapping"):
-            raise RuntimeError("HttpService.start was never called, aborting...")
+    def _decode_traced(
+        self,
+        request: transports.TransportRequest,
+        response: transports.TransportResponse,
+        elapsed: float,
+    ) -> t.Any:
+        assert self._slow_request_log is not None
+        start = time.perf_counter()
+        data = self._decode(response)
+        trace = tracing.RequestTrace(
+            request.method,
+            urllib.parse.urlsplit(request.url).path,
+            response.status,
+            elapsed,
+            time.perf_counter() - start,
+            code=data.code if isinstance(data, models.HttpResponse) else None,
+        )
+
+        if (timings := response.timings) is not None:
+            trace.reused = timings.reused
+            trace.queued = timings.queued
+            trace.connecting = timings.connecting
+            trace.waiting = timings.waiting
+            trace.reading = timings.reading
+
+        # The caller deserializes the response before its task yields
+        # again, so the trace is only logged once that time is recorded.
+        tracing.start_trace(trace)
+        asyncio.get_running_loop().call_soon(self._slow_request_log.finish, trace)
+        return data
+
+    def _url(self, route: RouteT) -> str:
+        if (url := self._urls.get(route.uri)) is None:
+            url = self._base_url + self._api_version + route.uri
 
-        return self._method_mapping[method]  # type: ignore
+            # Uris with variables are not cached, since there is no limit
+            # to how many of them there could be.
+            if isinstance(route, routes.Route) or route.uri == route.route.uri:
+                self._urls[route.uri] = url
 
-    async def _init_session(self) -> None:
-        self._session = aiohttp.ClientSession()
-        self._method_mapping = {
-            constants.GET: self._session.get,
-            constants.PUT: self._session.put,
-            constants.POST: self._session.post,
-            constants.PATCH: self._session.patch,
-            constants.DELETE: self._session.delete,
-        }
+        return url
 
     def set_api_key(self, api_key: str) -> None:
         """Sets the api key used by the http service.
@@ -116,37 +257,139 @@ class HttpService:
             base_url: The new base url to use.
         """
         self._base_url = base_url
+        self._urls.clear()
 
     async def start(self) -> None:
-        """Starts the client session to be used by the http service."""
-        if not hasattr(self, "_session") or self._session.closed:
-            await self._init_session()
+        """Starts the transport used by the http service, opening any
+        warm connections.
+        """
+        self._closed = False
 
-    async def close(self) -> None:
-        """Closes the existing client session, if it's still open."""
-        if hasattr(self, "_session") and not self._session.closed:
-            await self._session.close()
+        if not self._started:
+            await self._transport.start()
+            self._started = True
+            await self.warm()
+
+        if self._keep_warm_interval and self._warm_connections and not self._keep_warm_task:
+            self._keep_warm_task = asyncio.ensure_future(self._keep_warm())
+
+    @property
+    def pending(self) -> int:
+        """The number of requests waiting for a response."""
+        return self._pending
+
+    async def close(self, *, drain_timeout: t.Optional[float] = None) -> None:
+        """Stops accepting requests and closes the transport, if it was
+        started.
+
+        Keyword Args:
+            drain_timeout: The optional number of seconds to wait for
+                pending requests to finish before closing the transport.
+                Defaults to `None`, which closes it immediately.
+        """
+        self._closed = True
+
+        if self._keep_warm_task is not None:
+            self._keep_warm_task.cancel()
+            self._keep_warm_task = None
+
+        if drain_timeout and self._pending:
+            self._drained = asyncio.Event()
+
+            try:
+                await asyncio.wait_for(self._drained.wait(), drain_timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._drained = None
+
+        if self._started:
+            self._started = False
+            await self._transport.close()
+
+    async def warm(self, connections: t.Optional[int] = None) -> None:
+        """Opens keep alive connections to the api by making concurrent
+        liveness requests. Failures are ignored, since warming is only
+        an optimization.
+
+        Args:
+            connections: The number of connections to open. Defaults to
+                `warm_connections`.
+        """
+        connections = self._warm_connections if connections is None else connections
+
+        if connections < 1:
+            return None
+
+        # Concurrent requests can not share a connection, so each one
+        # opens its own, which is returned to the pool afterwards.
+        url = self._url(routes.LIVENESS)
+        await asyncio.gather(
+            *(self._request(constants.GET, url) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
+    async def _keep_warm(self) -> None:
+        assert self._keep_warm_interval is not None
+        interval = self._keep_warm_interval
+
+        while True:
+            idle = time.monotonic() - self._last_request
+
+            if idle < interval:
+                await asyncio.sleep(interval - idle)
+                continue
+
+            await self.warm()
 
     async def fetch(
         self,
-        route: routes.CompiledRoute,
+        route: RouteT,
         *,
-        payload: t.Optional[t.Dict[str, t.Any]] = None,
+        payload: t.Optional[PayloadT] = None,
     ) -> dict[str, t.Any] | models.HttpResponse:
         """Fetches the given route.
 
         Args:
-            route: The route to make the request to.
+            route: The route to make the request to. Routes without uri
+                variables or query params do not need to be compiled.
 
-            payload: The optional payload to send in the request body.
+            payload: The optional payload to send in the request body,
+                or the payload already encoded as JSON.
 
         Returns:
             The requested json data or the error response.
         """
+        if self._dedupe_gets and route.method == constants.GET:
+            return await self._fetch_deduped(route)  # type: ignore[no-any-return]
+
         return await self._request(  # type: ignore[no-any-return]
-            self._get_request_func(route.method),
-            self._base_url + self._api_version + route.uri,
-            headers=self._headers,
-            params=route.params,
-            json=payload or None,
+            route.method, self._url(route), params=route.params, payload=payload
+        )
+
+    async def _fetch_deduped(self, route: RouteT) -> t.Any:
+        params = tuple(sorted(route.params.items()))
+        key = (route.method, route.uri, params, self._headers.get("Authorization"))
+
+        if (future := self._in_flight.get(key)) is not None:
+            # Waiters get their own copy so no two callers share mutable
+            # state, i.e. the meta dictionaries of the resulting models.
+            return copy.deepcopy(await asyncio.shield(future))
+
+        future = asyncio.ensure_future(
+            self._request(route.method, self._url(route), params=route.params)
         )
+
+        self._in_flight[key] = future
+        future.add_done_callback(lambda f: self._on_deduped_done(key, f))
+
+        # The request runs as its own task, so cancelling one caller
+        # does not cancel the request for everyone else waiting on it.
+        return await asyncio.shield(future)
+
+    def _on_deduped_done(self, key: t.Hashable, future: asyncio.Future[t.Any]) -> None:
+        self._in_flight.pop(key, None)
+
+        if not future.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled.
+            future.exception()
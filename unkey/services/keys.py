@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import typing as t
 
+from unkey import cache
 from unkey import errors
 from unkey import models
+from unkey import prefilter as prefilter_
 from unkey import result
 from unkey import routes
 from unkey.undefined import UNDEFINED
@@ -13,16 +17,203 @@ from unkey.undefined import all_undefined
 
 from . import BaseService
 
+if t.TYPE_CHECKING:  # pragma: nocover
+    from unkey import serializer
+
+    from . import HttpService
+
 __all__ = ("KeyService",)
 
 T = t.TypeVar("T")
 ResultT = result.Result[T, models.HttpResponse]
+WriteListenerT = t.Callable[[str, t.Optional[t.Dict[str, t.Any]]], None]
+
+_encode_str: t.Callable[[str], str] = json.encoder.encode_basestring_ascii  # type: ignore
+
+
+def _ratelimit_payload(ratelimit: models.Ratelimit) -> t.Dict[str, t.Any]:
+    return {
+        "limit": ratelimit.limit,
+        "type": ratelimit.type.value,
+        "refillRate": ratelimit.refill_rate,
+        "refillInterval": ratelimit.refill_interval,
+    }
+
+
+def _refill_payload(refill: models.Refill) -> t.Dict[str, t.Any]:
+    return {"amount": refill.amount, "interval": refill.interval.value}
+
+
+def _verify_payload(key: str, api_id: str) -> bytes:
+    # Encoded directly, since verifying keys is the hottest path.
+    return ('{"key":%s,"apiId":%s}' % (_encode_str(key), _encode_str(api_id))).encode()
 
 
 class KeyService(BaseService):
-    """Handles api key related requests."""
+    """Handles api key related requests.
+
+    Args:
+        http_service: The http service to use for requests.
+
+        serializer: The serializer to use for handling incoming
+            JSON data from the API.
+
+    Keyword Args:
+        resource_cache: The optional read through cache used for
+            retrieving individual keys.
+
+        verification_cache: The optional cache used to store successful
+            key verifications.
+
+        prefilter: The optional prefilter used to reject malformed or
+            recently not found keys without contacting the api.
+    """
+
+    __slots__ = ("_prefilter", "_refreshes", "_verification_cache", "_write_listeners")
+
+    def __init__(
+        self,
+        http_service: HttpService,
+        serializer: serializer.Serializer,
+        *,
+        resource_cache: t.Optional[cache.ResourceCache] = None,
+        verification_cache: t.Optional[cache.VerificationCache] = None,
+        prefilter: t.Optional[prefilter_.KeyPrefilter] = None,
+    ) -> None:
+        super().__init__(http_service, serializer, resource_cache=resource_cache)
+        self._verification_cache = verification_cache
+        self._prefilter = prefilter
+        self._refreshes: t.Dict[bytes, asyncio.Task[None]] = {}
+        self._write_listeners: t.List[WriteListenerT] = []
+
+    @property
+    def verification_cache(self) -> t.Optional[cache.VerificationCache]:
+        """The cache used to store successful key verifications, if any."""
+        return self._verification_cache
+
+    @property
+    def prefilter(self) -> t.Optional[prefilter_.KeyPrefilter]:
+        """The prefilter used to reject keys locally, if any."""
+        return self._prefilter
+
+    @property
+    def refreshing(self) -> int:
+        """The number of background verification cache refreshes still
+        running.
+        """
+        return len(self._refreshes)
+
+    async def drain(self, timeout: float = 0.0) -> None:
+        """Waits for background verification cache refreshes to finish.
+
+        Refreshes still running after the timeout are cancelled, their
+        entries are simply left to expire.
+
+        Args:
+            timeout: The number of seconds to wait. Defaults to 0, which
+                cancels running refreshes immediately.
+        """
+        if self._refreshes:
+            _, pending = await asyncio.wait(list(self._refreshes.values()), timeout=timeout)
+
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.wait(pending)
+
+    def add_write_listener(self, listener: WriteListenerT) -> None:
+        """Adds a listener called after each successful key write made
+        through this service.
+
+        The listener receives the id of the key, and either a mapping of
+        the changed fields as they appear in the api payloads, or `None`
+        if the key was revoked.
+
+        Args:
+            listener: The listener to add.
+        """
+        self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener: WriteListenerT) -> None:
+        """Removes a previously added write listener.
+
+        Args:
+            listener: The listener to remove.
+        """
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
+    def _notify_write(self, key_id: str, fields: t.Optional[t.Dict[str, t.Any]]) -> None:
+        for listener in self._write_listeners:
+            listener(key_id, fields)
 
-    __slots__ = ()
+    async def _fetch_verification(self, key: str, api_id: str) -> t.Any:
+        return await self._http.fetch(routes.VERIFY_KEY, payload=_verify_payload(key, api_id))
+
+    def _key_payload(
+        self,
+        payload: t.Dict[str, t.Any],
+        name: UndefinedNoneOr[str],
+        meta: UndefinedNoneOr[t.Dict[str, t.Any]],
+        remaining: UndefinedNoneOr[int],
+        expires: UndefinedNoneOr[int],
+        ratelimit: UndefinedNoneOr[models.Ratelimit],
+        refill: UndefinedOr[models.Refill],
+    ) -> t.Dict[str, t.Any]:
+        # Adds the optional fields shared by create_key and update_key in
+        # one pass, instead of building and filtering keyword arguments.
+        if name is not UNDEFINED:
+            payload["name"] = name
+
+        if meta is not UNDEFINED:
+            payload["meta"] = meta
+
+        if remaining is not UNDEFINED:
+            payload["remaining"] = remaining
+
+        if expires:
+            payload["expires"] = self._expires_at(expires)
+
+        if ratelimit:
+            payload["ratelimit"] = _ratelimit_payload(ratelimit)
+
+        if refill:
+            payload["refill"] = _refill_payload(refill)
+
+        return payload
+
+    def _schedule_refresh(self, digest: bytes, key: str, api_id: str) -> None:
+        if digest in self._refreshes:
+            return None
+
+        task = asyncio.ensure_future(self._refresh(digest, key, api_id))
+        self._refreshes[digest] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(digest, None))
+
+    async def _refresh(self, digest: bytes, key: str, api_id: str) -> None:
+        assert self._verification_cache is not None
+
+        try:
+            data = await self._fetch_verification(key, api_id)
+        except Exception:
+            # Errors are not surfaced from background refreshes, the
+            # stale entry simply expires if the api stays unreachable.
+            return None
+
+        if isinstance(data, models.HttpResponse):
+            return None
+
+        if not self._verification_cache.store(digest, data):
+            # The key is no longer valid, so stop serving the old result.
+            self._verification_cache.delete(digest)
+
+    def _invalidate(self, key_id: str) -> None:
+        if self._verification_cache is not None:
+            self._verification_cache.invalidate(key_id)
+
+        if self._resource_cache is not None:
+            self._resource_cache.invalidate_key(key_id)
 
     async def create_key(
         self,
@@ -71,38 +262,26 @@ class KeyService(BaseService):
         Returns:
             A result containing the newly created key or an error.
         """
-        route = routes.CREATE_KEY.compile()
-        payload = self._generate_map(
-            meta=meta,
-            name=name,
-            apiId=api_id,
-            prefix=prefix,
-            ownerId=owner_id,
-            remaining=remaining,
-            byteLength=byte_length,
-            expires=self._expires_in(milliseconds=expires or 0),
-            ratelimit=UNDEFINED
-            if not ratelimit
-            else self._generate_map(
-                limit=ratelimit.limit,
-                type=ratelimit.type.value,
-                refillRate=ratelimit.refill_rate,
-                refillInterval=ratelimit.refill_interval,
-            ),
-            refill=UNDEFINED
-            if not refill
-            else self._generate_map(
-                amount=refill.amount,
-                interval=refill.interval.value,
-            ),
+        route = routes.CREATE_KEY
+        payload = self._key_payload(
+            {"apiId": api_id, "prefix": prefix, "ownerId": owner_id},
+            name,
+            meta,
+            remaining,
+            expires,
+            ratelimit,
+            refill,
         )
 
+        if byte_length is not UNDEFINED:
+            payload["byteLength"] = byte_length
+
         data = await self._http.fetch(route, payload=payload)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
-        return result.Ok(self._serializer.to_api_key(data))
+        return result.Ok(self._deserialize(self._serializer.to_api_key, data))
 
     async def verify_key(self, key: str, api_id: str) -> ResultT[models.ApiKeyVerification]:
         """Verifies a key is valid and within ratelimit.
@@ -115,14 +294,35 @@ class KeyService(BaseService):
         Returns:
             A result containing the api key verification or an error.
         """
-        route = routes.VERIFY_KEY.compile()
-        payload = self._generate_map(key=key, apiId=api_id)
-        data = await self._http.fetch(route, payload=payload)
+        if self._prefilter is not None and self._prefilter.rejects(key, api_id):
+            not_found = self._prefilter.NOT_FOUND
+            return result.Ok(self._serializer.to_api_key_verification(not_found))
+
+        verification_cache = self._verification_cache
+        digest = b""
+
+        if verification_cache is not None:
+            digest = verification_cache.digest(key, api_id)
+            cached, refresh = verification_cache.lookup(digest)
+
+            if cached is not None:
+                if refresh:
+                    self._schedule_refresh(digest, key, api_id)
+
+                return result.Ok(self._serializer.to_api_key_verification(cached))
+
+        data = await self._fetch_verification(key, api_id)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
-        return result.Ok(self._serializer.to_api_key_verification(data))
+        if verification_cache is not None:
+            verification_cache.store(digest, data)
+
+        if self._prefilter is not None and data.get("code") == "NOT_FOUND":
+            self._prefilter.remember_not_found(key, api_id)
+
+        return result.Ok(self._deserialize(self._serializer.to_api_key_verification, data))
 
     async def revoke_key(self, key_id: str) -> ResultT[models.HttpResponse]:
         """Revokes a keys validity.
@@ -133,13 +333,14 @@ class KeyService(BaseService):
         Returns:
             A result containing the http response or an error.
         """
-        route = routes.REVOKE_KEY.compile()
-        payload = self._generate_map(keyId=key_id)
-        data = await self._http.fetch(route, payload=payload)
+        route = routes.REVOKE_KEY
+        data = await self._http.fetch(route, payload={"keyId": key_id})
+        self._invalidate(key_id)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
+        self._notify_write(key_id, None)
         return result.Ok(models.HttpResponse(200, "OK"))
 
     async def update_key(
@@ -184,35 +385,22 @@ class KeyService(BaseService):
         if all_undefined(name, owner_id, meta, expires, remaining, ratelimit, refill):
             raise errors.MissingRequiredArgument("At least one value is required to be updated.")
 
-        route = routes.UPDATE_KEY.compile()
-        payload = self._generate_map(
-            name=name,
-            meta=meta,
-            keyId=key_id,
-            ownerId=owner_id,
-            remaining=remaining,
-            expires=self._expires_in(milliseconds=expires or 0),
-            ratelimit=UNDEFINED
-            if not ratelimit
-            else self._generate_map(
-                limit=ratelimit.limit,
-                type=ratelimit.type.value,
-                refillRate=ratelimit.refill_rate,
-                refillInterval=ratelimit.refill_interval,
-            ),
-            refill=UNDEFINED
-            if not refill
-            else self._generate_map(
-                amount=refill.amount,
-                interval=refill.interval.value,
-            ),
-        )
+        route = routes.UPDATE_KEY
+        payload: t.Dict[str, t.Any] = {"keyId": key_id}
+
+        if owner_id is not UNDEFINED:
+            payload["ownerId"] = owner_id
+
+        self._key_payload(payload, name, meta, remaining, expires, ratelimit, refill)
 
         data = await self._http.fetch(route, payload=payload)
+        self._invalidate(key_id)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
+        del payload["keyId"]
+        self._notify_write(key_id, payload)
         return result.Ok(models.HttpResponse(200, "OK"))
 
     async def get_key(self, key_id: str) -> ResultT[models.ApiKeyMeta]:
@@ -224,14 +412,19 @@ class KeyService(BaseService):
         Returns:
             A result containing the api key metadata or an error.
         """
-        params = self._generate_map(keyId=key_id)
-        route = routes.GET_KEY.compile().with_params(params)
+        if self._resource_cache and (cached := self._resource_cache.get_key(key_id)):
+            return result.Ok(self._serializer.to_api_key_meta(cached))
+
+        route = routes.GET_KEY.compile().with_params({"keyId": key_id})
         data = await self._http.fetch(route)
 
         if isinstance(data, models.HttpResponse):
             return result.Err(data)
 
-        return result.Ok(self._serializer.to_api_key_meta(data))
+        if self._resource_cache:
+            self._resource_cache.store_key(key_id, data)
+
+        return result.Ok(self._deserialize(self._serializer.to_api_key_meta, data))
 
     async def update_remaining(
         self, key_id: str, value: t.Optional[int], op: models.UpdateOp
@@ -248,11 +441,19 @@ class KeyService(BaseService):
         Returns:
             A result containing the new remaining limit of the key or an error.
         """
-        payload = self._generate_map(keyId=key_id, value=value, op=op.value)
-        route = routes.UPDATE_REMAINING.compile()
+        route = routes.UPDATE_REMAINING
+        payload = {"keyId": key_id, "value": value, "op": op.value}
         data = await self._http.fetch(route, payload=payload)
 
         if isinstance(data, models.HttpResponse):
+            self._invalidate(key_id)
             return result.Err(data)
 
+        if self._verification_cache is not None:
+            self._verification_cache.invalidate(key_id)
+
+        if self._resource_cache is not None:
+            self._resource_cache.patch_key(key_id, remaining=data["remaining"])
+
+        self._notify_write(key_id, {"remaining": data["remaining"]})
         return result.Ok(data["remaining"])
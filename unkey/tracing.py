@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import random
+import typing as t
+
+import attrs
+
+from unkey import models
+
+__all__ = ("RequestTrace", "SlowRequestLogger")
+
+_current: contextvars.ContextVar[t.Optional[RequestTrace]] = contextvars.ContextVar(
+    "unkey_request_trace", default=None
+)
+
+
+@attrs.define(weakref_slot=False)
+class RequestTrace:
+    """The time a single request spent in each phase, in seconds.
+
+    Phases the transport did not measure are `None`.
+    """
+
+    method: str
+    """The HTTP method of the request."""
+
+    path: str
+    """The path of the request, without the query string."""
+
+    status: int
+    """The HTTP status of the response."""
+
+    elapsed: float
+    """The time between sending the request and receiving the body."""
+
+    decoding: float
+    """The time spent decoding the JSON response body."""
+
+    code: t.Optional[models.ErrorCode] = None
+    """The error code returned by the api, if any."""
+
+    reused: t.Optional[bool] = None
+    """Whether or not an idle connection was reused, if known."""
+
+    queued: t.Optional[float] = None
+    """The time spent waiting for a free connection in the pool."""
+
+    connecting: t.Optional[float] = None
+    """The time spent opening a new connection."""
+
+    waiting: t.Optional[float] = None
+    """The time spent waiting for the response headers."""
+
+    reading: t.Optional[float] = None
+    """The time spent reading the response body."""
+
+    deserializing: t.Optional[float] = None
+    """The time the `Serializer` spent creating models from the
+    response, if it was deserialized.
+    """
+
+    @property
+    def total(self) -> float:
+        """The total time spent on the request, including decoding and
+        deserializing the response.
+        """
+        return self.elapsed + self.decoding + (self.deserializing or 0.0)
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Converts the trace to a dictionary suitable for structured
+        logging. Durations are in milliseconds.
+
+        Returns:
+            The trace as a dictionary.
+        """
+
+        def ms(seconds: t.Optional[float]) -> t.Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "code": self.code.value if self.code else None,
+            "reused": self.reused,
+            "total": ms(self.total),
+            "queued": ms(self.queued),
+            "connecting": ms(self.connecting),
+            "waiting": ms(self.waiting),
+            "reading": ms(self.reading),
+            "decoding": ms(self.decoding),
+            "deserializing": ms(self.deserializing),
+        }
+
+
+def start_trace(trace: RequestTrace) -> None:
+    """Makes the trace the one `record_deserialization` records to in
+    the current task.
+
+    Args:
+        trace: The trace of the request that just finished.
+    """
+    _current.set(trace)
+
+
+def record_deserialization(seconds: float) -> None:
+    """Records the time spent deserializing the response to the last
+    request made by the current task.
+
+    Args:
+        seconds: The time spent creating models from the response.
+    """
+    if (trace := _current.get()) is not None:
+        trace.deserializing = seconds
+        _current.set(None)
+
+
+class SlowRequestLogger:
+    """Logs a structured record for each request slower than a
+    threshold, and for a random sample of every other request.
+
+    Records are logged with the message `"Slow request"` or
+    `"Sampled request"`, and the trace as a dictionary in the
+    `unkey_request` attribute of the log record.
+
+    Keyword Args:
+        threshold: The optional number of seconds after which a request
+            is always logged. Defaults to 1. `None` logs only sampled
+            requests.
+
+        sample_rate: The fraction of the remaining requests to log,
+            between 0 and 1. Defaults to 0.
+
+        logger: The optional logger to use. Defaults to the
+            `unkey.slow_requests` logger.
+
+        level: The level to log records at. Defaults to `WARNING`.
+    """
+
+    __slots__ = ("_level", "_logger", "_sample_rate", "_threshold")
+
+    def __init__(
+        self,
+        *,
+        threshold: t.Optional[float] = 1.0,
+        sample_rate: float = 0.0,
+        logger: t.Optional[logging.Logger] = None,
+        level: int = logging.WARNING,
+    ) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1.")
+
+        self._threshold = threshold
+        self._sample_rate = sample_rate
+        self._logger = logger or logging.getLogger("unkey.slow_requests")
+        self._level = level
+
+    @property
+    def threshold(self) -> t.Optional[float]:
+        """The number of seconds after which a request is always logged."""
+        return self._threshold
+
+    @property
+    def sample_rate(self) -> float:
+        """The fraction of the remaining requests that are logged."""
+        return self._sample_rate
+
+    def is_slow(self, trace: RequestTrace) -> bool:
+        """Whether or not the request took longer than the threshold."""
+        return self._threshold is not None and trace.total >= self._threshold
+
+    def finish(self, trace: RequestTrace) -> None:
+        """Logs the trace if the request was slow or sampled. Called by
+        the `HttpService` once the response was deserialized.
+
+        Args:
+            trace: The trace of the finished request.
+        """
+        if self.is_slow(trace):
+            self.log(trace, "Slow request")
+        elif self._sample_rate and random.random() < self._sample_rate:
+            self.log(trace, "Sampled request")
+
+    def log(self, trace: RequestTrace, message: str) -> None:
+        """Logs a record for the trace. Override this to send traces
+        somewhere other than the logger.
+
+        Args:
+            trace: The trace to log.
+
+            message: The message to log.
+        """
+        if not self._logger.isEnabledFor(self._level):
+            return None
+
+        data = trace.to_dict()
+        self._logger.log(
+            self._level,
+            "%s: %s %s %s in %.1fms",
+            message,
+            trace.method,
+            trace.path,
+            trace.status,
+            data["total"],
+            extra={"unkey_request": data},
+        )
@@ -0,0 +1,18 @@
+from .base import *
+
+from .aio import *
+from .http2 import *
+from .memory import *
+from .record import *
+
+__all__ = (
+    "AiohttpTransport",
+    "HttpxTransport",
+    "MemoryTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "Transport",
+    "TransportRequest",
+    "TransportResponse",
+    "TransportTimings",
+)
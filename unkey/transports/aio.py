@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+from .base import Transport
+from .base import TransportRequest
+from .base import TransportResponse
+from .base import TransportTimings
+
+if t.TYPE_CHECKING:  # pragma: nocover
+    import aiohttp
+
+__all__ = ("AiohttpTransport",)
+
+
+class _Trace:
+    __slots__ = ("mark", "timings")
+
+    def __init__(self) -> None:
+        self.mark = 0.0
+        self.timings = TransportTimings()
+
+
+# Trace callbacks are called with the session, the trace context and
+# the parameters of the signal.
+async def _on_start(*args: t.Any) -> None:
+    args[1].trace_request_ctx.mark = time.perf_counter()
+
+
+def _on_end(phase: str) -> t.Callable[..., t.Awaitable[None]]:
+    async def on_end(*args: t.Any) -> None:
+        trace: _Trace = args[1].trace_request_ctx
+        setattr(trace.timings, phase, time.perf_counter() - trace.mark)
+
+        if phase == "connecting":
+            trace.timings.reused = False
+
+    return on_end
+
+
+async def _on_reuse(*args: t.Any) -> None:
+    args[1].trace_request_ctx.timings.reused = True
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    import aiohttp
+
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_on_start)
+    config.on_connection_queued_end.append(_on_end("queued"))
+    config.on_connection_create_start.append(_on_start)
+    config.on_connection_create_end.append(_on_end("connecting"))
+    config.on_connection_reuseconn.append(_on_reuse)
+    # Aiohttp ends a request as soon as the response headers arrive,
+    # before the body is read.
+    config.on_request_headers_sent.append(_on_start)
+    config.on_request_end.append(_on_end("waiting"))
+    return config
+
+
+class AiohttpTransport(Transport):
+    """The default transport, sending requests with an aiohttp session
+    over pooled HTTP/1.1 connections.
+
+    Keyword Args:
+        limit: The maximum number of open connections. Defaults to 100.
+
+        keepalive_timeout: The number of seconds an idle connection is
+            kept open for. Defaults to 15.
+
+        trace: Whether or not to measure the time spent in each phase of
+            a request, returned as the responses `timings`. Defaults to
+            `False`.
+    """
+
+    __slots__ = ("_keepalive_timeout", "_limit", "_session", "_trace")
+
+    def __init__(
+        self, *, limit: int = 100, keepalive_timeout: float = 15.0, trace: bool = False
+    ) -> None:
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._trace = trace
+        self._session: t.Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        if self._session is None or self._session.closed:
+            # aiohttp is slow to import, so it is only imported once a
+            # session is actually needed.
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, keepalive_timeout=self._keepalive_timeout
+            )
+            trace_configs = [_trace_config()] if self._trace else None
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        if self._session is None:
+            raise RuntimeError("HttpService.start was never called, aborting...")
+
+        trace = _Trace() if self._trace else None
+
+        async with self._session.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            params=request.params,
+            data=request.body,
+            trace_request_ctx=trace,
+        ) as response:
+            start = time.perf_counter()
+            body = await response.read()
+            headers = {k.lower(): v for k, v in response.headers.items()}
+
+            if trace is None:
+                return TransportResponse(response.status, body, headers)
+
+            trace.timings.reading = time.perf_counter() - start
+            return TransportResponse(response.status, body, headers, trace.timings)
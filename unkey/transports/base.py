@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import abc
+import json
+import types
+import typing as t
+
+import attrs
+
+__all__ = ("Transport", "TransportRequest", "TransportResponse", "TransportTimings")
+
+_EMPTY: t.Mapping[str, t.Any] = types.MappingProxyType({})
+
+
+@attrs.define(weakref_slot=False)
+class TransportRequest:
+    """A request to be sent by a transport."""
+
+    method: str
+    """The request method."""
+
+    url: str
+    """The full url, without the query string."""
+
+    headers: t.Mapping[str, str]
+    """The request headers."""
+
+    params: t.Mapping[str, t.Any] = _EMPTY
+    """The query parameters."""
+
+    body: t.Optional[bytes] = None
+    """The encoded request body, if any."""
+
+
+@attrs.define(weakref_slot=False)
+class TransportTimings:
+    """The seconds a transport spent in each phase of a request."""
+
+    queued: float = 0.0
+    """Waiting for a free connection in the pool."""
+
+    connecting: float = 0.0
+    """Resolving the host and opening a new connection."""
+
+    waiting: float = 0.0
+    """Waiting for the response headers after sending the request."""
+
+    reading: float = 0.0
+    """Reading the response body."""
+
+    reused: t.Optional[bool] = None
+    """Whether or not an idle connection was reused, if known."""
+
+
+@attrs.define(weakref_slot=False)
+class TransportResponse:
+    """A response received by a transport."""
+
+    status: int
+    """The response status code."""
+
+    body: bytes = b""
+    """The raw response body."""
+
+    headers: t.Mapping[str, str] = _EMPTY
+    """The response headers, with lowercase names."""
+
+    timings: t.Optional[TransportTimings] = None
+    """The time spent in each phase of the request, if the transport
+    measured it.
+    """
+
+    @property
+    def is_json(self) -> bool:
+        """Whether or not the content type of the response is JSON."""
+        return "json" in self.headers.get("content-type", "")
+
+    def json(self) -> t.Any:
+        """Decodes the body as JSON.
+
+        Returns:
+            The decoded body, or `None` if it was empty.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(self.body) if self.body.strip() else None
+
+    def text(self) -> str:
+        """Decodes the body as UTF-8 text.
+
+        Returns:
+            The decoded body.
+        """
+        return self.body.decode(errors="replace")
+
+
+class Transport(abc.ABC):
+    """The base transport used by `HttpService` to send requests.
+
+    Transports only move bytes. Building urls and headers, encoding
+    payloads, and interpreting responses is left to the http service,
+    so every transport behaves the same way.
+    """
+
+    __slots__ = ()
+
+    async def start(self) -> None:
+        """Prepares the transport to send requests. Does nothing by
+        default.
+        """
+
+    async def close(self) -> None:
+        """Releases any resources held by the transport. Does nothing by
+        default.
+        """
+
+    @abc.abstractmethod
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        """Sends a request.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response.
+        """
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib
+import typing as t
+
+from .base import Transport
+from .base import TransportRequest
+from .base import TransportResponse
+
+__all__ = ("HttpxTransport",)
+
+
+class HttpxTransport(Transport):
+    """A transport that sends requests with an httpx client over HTTP/2,
+    multiplexing concurrent requests over a handful of connections
+    instead of opening one connection per request in flight.
+
+    Requires httpx to be installed with its `http2` extra, i.e.
+    `pip install unkey.py[http2]`.
+
+    Keyword Args:
+        http2: Whether or not to use HTTP/2 when the server supports it.
+            Defaults to `True`.
+
+        http1: Whether or not to allow HTTP/1.1. Disabling it together
+            with `http2` uses HTTP/2 with prior knowledge, which is needed
+            for servers without TLS. Defaults to `True`.
+
+        max_connections: The maximum number of open connections.
+            Defaults to 10.
+
+        keepalive_timeout: The number of seconds an idle connection is
+            kept open for. Defaults to 15.
+    """
+
+    __slots__ = ("_client", "_http1", "_http2", "_keepalive_timeout", "_max_connections")
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 10,
+        keepalive_timeout: float = 15.0,
+    ) -> None:
+        self._http2 = http2
+        self._http1 = http1
+        self._max_connections = max_connections
+        self._keepalive_timeout = keepalive_timeout
+        self._client: t.Any = None
+
+    async def start(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            return None
+
+        try:
+            httpx = importlib.import_module("httpx")
+
+            if self._http2:
+                importlib.import_module("h2")
+        except ImportError:
+            raise RuntimeError(
+                "httpx must be installed with the http2 extra to use HttpxTransport."
+            ) from None
+
+        limits = httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_connections,
+            keepalive_expiry=self._keepalive_timeout,
+        )
+        # Matches the default total timeout of aiohttp, since requests may
+        # queue for a stream while the connections are saturated.
+        self._client = httpx.AsyncClient(
+            http1=self._http1, http2=self._http2, limits=limits, timeout=300.0
+        )
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        if self._client is None:
+            raise RuntimeError("HttpService.start was never called, aborting...")
+
+        response = await self._client.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            params=request.params,
+            content=request.body,
+        )
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        return TransportResponse(response.status_code, response.content, headers)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import inspect
+import json
+import typing as t
+from urllib.parse import urlsplit
+
+from .base import Transport
+from .base import TransportRequest
+from .base import TransportResponse
+
+__all__ = ("MemoryTransport",)
+
+HandlerT = t.Callable[
+    [TransportRequest], t.Union[TransportResponse, t.Awaitable[TransportResponse]]
+]
+"""A function that produces the response for a request."""
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+class MemoryTransport(Transport):
+    """A transport that answers requests from memory, without touching
+    the network. Useful for tests and for benchmarking everything above
+    the network.
+
+    Responses are registered per method and url path, i.e.
+    `("POST", "/v1/keys.verifyKey")`. Unregistered requests are passed
+    to the fallback handler, or answered with a 404.
+
+    Args:
+        handler: The optional fallback handler for requests that do not
+            match a registered route.
+    """
+
+    __slots__ = ("_handler", "_routes")
+
+    def __init__(self, handler: t.Optional[HandlerT] = None) -> None:
+        self._handler = handler
+        self._routes: t.Dict[t.Tuple[str, str], HandlerT] = {}
+
+    @staticmethod
+    def json_response(status: int, data: t.Any) -> TransportResponse:
+        """Creates a JSON response.
+
+        Args:
+            status: The status code of the response.
+
+            data: The data to encode as the body.
+
+        Returns:
+            The response.
+        """
+        return TransportResponse(status, json.dumps(data).encode(), _JSON_HEADERS)
+
+    def add_route(
+        self, method: str, path: str, response: t.Union[TransportResponse, HandlerT]
+    ) -> None:
+        """Registers the response for a route, replacing any existing
+        one.
+
+        Args:
+            method: The request method.
+
+            path: The url path, including the api version.
+
+            response: The response to return every time, or a handler
+                that produces it.
+        """
+        if isinstance(response, TransportResponse):
+            fixed = response
+            response = lambda _: fixed  # noqa: E731
+
+        self._routes[(method, path)] = response
+
+    def add_json_route(self, method: str, path: str, data: t.Any, status: int = 200) -> None:
+        """Registers a fixed JSON response for a route.
+
+        Args:
+            method: The request method.
+
+            path: The url path, including the api version.
+
+            data: The data to encode as the body.
+
+            status: The status code of the response. Defaults to 200.
+        """
+        self.add_route(method, path, self.json_response(status, data))
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        handler = self._routes.get((request.method, urlsplit(request.url).path), self._handler)
+
+        if handler is None:
+            error = {"code": "NOT_FOUND", "message": f"No route for {request.url}"}
+            return self.json_response(404, {"error": error})
+
+        response = handler(request)
+
+        if inspect.isawaitable(response):
+            response = await response
+
+        return response  # type: ignore[return-value]
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import io
+import json
+import os
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+from .base import Transport
+from .base import TransportRequest
+from .base import TransportResponse
+
+__all__ = ("RecordingTransport", "ReplayTransport")
+
+DictT = t.Dict[str, t.Any]
+
+
+def _open(path: str, mode: str) -> t.IO[str]:
+    if mode == "a":
+        # New recordings are only readable by their owner.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        file: t.IO[bytes] = os.fdopen(fd, "ab")
+    else:
+        file = open(path, "rb")
+
+    if path.endswith(".gz"):
+        return t.cast(t.IO[str], gzip.open(file, mode + "t", encoding="utf-8"))
+
+    return io.TextIOWrapper(file, encoding="utf-8")
+
+
+def _payload(body: t.Optional[bytes]) -> t.Any:
+    if not body:
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode(errors="replace")
+
+
+def _redact(payload: t.Any) -> t.Any:
+    if not isinstance(payload, dict):
+        return payload
+
+    data = t.cast(DictT, payload)
+
+    if not isinstance(key := data.get("key"), str):
+        return data
+
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return {**data, "key": f"sha256:{digest}"}
+
+
+def _match_key(method: str, path: str, params: t.Any, payload: t.Any) -> str:
+    return json.dumps([method, path, params or {}, payload], sort_keys=True, default=str)
+
+
+class RecordingTransport(Transport):
+    """A transport that records every exchange made through another
+    transport to a newline delimited JSON file.
+
+    Each line holds the request method, url path, params and payload,
+    the response status and body, the seconds since the first recorded
+    request (`at`), and the seconds the exchange took (`elapsed`).
+    Headers are not recorded, so api keys used for authorization never
+    reach the file. Keys sent in payloads, i.e. to verify them, are
+    replaced with their SHA-256 digest unless `redact_keys` is disabled.
+    New recordings are created readable only by their owner.
+
+    Args:
+        transport: The transport to record.
+
+        path: The path of the recording, which is appended to. Paths
+            ending in `.gz` are written gzip compressed.
+
+    Keyword Args:
+        redact_keys: Whether or not to replace the `key` of request
+            payloads with its digest. Redacted verifications replay as
+            unknown keys. Defaults to `True`.
+    """
+
+    __slots__ = ("_file", "_path", "_redact_keys", "_started_at", "_transport")
+
+    def __init__(self, transport: Transport, path: str, *, redact_keys: bool = True) -> None:
+        self._transport = transport
+        self._path = path
+        self._redact_keys = redact_keys
+        self._file: t.Optional[t.IO[str]] = None
+        self._started_at: t.Optional[float] = None
+
+    @staticmethod
+    def load(path: str) -> t.List[DictT]:
+        """Loads the exchanges saved by a recording transport.
+
+        Args:
+            path: The path of the recording. Paths ending in `.gz` are
+                read as gzip compressed.
+
+        Returns:
+            The recorded exchanges, in the order their requests were
+                sent.
+        """
+        with _open(path, "r") as f:
+            exchanges = [json.loads(line) for line in f if line.strip()]
+
+        return sorted(exchanges, key=lambda e: e["at"])
+
+    async def start(self) -> None:
+        await self._transport.start()
+
+    async def close(self) -> None:
+        await self._transport.close()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        start = time.monotonic()
+
+        # Set before sending, so a slower request that started first is
+        # not recorded before the start of the recording.
+        if self._started_at is None:
+            self._started_at = start
+
+        response = await self._transport.send(request)
+        elapsed = time.monotonic() - start
+
+        if self._file is None:
+            self._file = _open(self._path, "a")
+
+        payload = _payload(request.body)
+        exchange = {
+            "at": round(start - self._started_at, 6),
+            "elapsed": round(elapsed, 6),
+            "method": request.method,
+            "path": urlsplit(request.url).path,
+            "params": dict(request.params),
+            "payload": _redact(payload) if self._redact_keys else payload,
+            "status": response.status,
+            "contentType": response.headers.get("content-type"),
+            "body": response.text(),
+        }
+        self._file.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+        return response
+
+
+class ReplayTransport(Transport):
+    """A transport that answers requests with the responses saved by a
+    `RecordingTransport`, without touching the network.
+
+    Requests are matched on their method, path, params and payload,
+    with or without its key redacted. Requests recorded more than once
+    get each recorded response in turn, and requests that were never
+    recorded get a response recorded for the same method and path, or a
+    404.
+
+    Args:
+        path: The path of the recording.
+
+    Keyword Args:
+        speed: How many times faster than recorded to answer requests.
+            `None` answers immediately. Defaults to 1, the recorded
+            timings.
+    """
+
+    __slots__ = ("_by_key", "_by_route", "_served", "_speed")
+
+    def __init__(self, path: str, *, speed: t.Optional[float] = 1.0) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be greater than 0.")
+
+        self._speed = speed
+        self._served: t.Dict[str, int] = {}
+        self._by_key: t.Dict[str, t.List[DictT]] = {}
+        self._by_route: t.Dict[str, t.List[DictT]] = {}
+
+        for exchange in RecordingTransport.load(path):
+            method, route = exchange["method"], exchange["path"]
+            key = _match_key(method, route, exchange["params"], exchange["payload"])
+            self._by_key.setdefault(key, []).append(exchange)
+            self._by_route.setdefault(_match_key(method, route, None, None), []).append(exchange)
+
+    def _next(self, key: str, exchanges: t.List[DictT]) -> DictT:
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return exchanges[served % len(exchanges)]
+
+    async def send(self, request: TransportRequest) -> TransportResponse:
+        path = urlsplit(request.url).path
+        params = dict(request.params)
+        payload = _payload(request.body)
+        key = _match_key(request.method, path, params, payload)
+
+        if (exchanges := self._by_key.get(key)) is None:
+            key = _match_key(request.method, path, params, _redact(payload))
+            exchanges = self._by_key.get(key)
+
+        if exchanges is None:
+            key = _match_key(request.method, path, None, None)
+
+            if (exchanges := self._by_route.get(key)) is None:
+                error = {"code": "NOT_FOUND", "message": f"No recording for {path}"}
+                body = json.dumps({"error": error}).encode()
+                return TransportResponse(404, body, {"content-type": "application/json"})
+
+        exchange = self._next(key, exchanges)
+
+        if self._speed is not None:
+            await asyncio.sleep(exchange["elapsed"] / self._speed)
+
+        headers = {"content-type": exchange["contentType"]} if exchange["contentType"] else {}
+        return TransportResponse(exchange["status"], exchange["body"].encode(), headers)